@@ -1,12 +1,9 @@
-from flask import Flask, render_template, request, flash, redirect, url_for, session, send_from_directory
+from flask import Flask, render_template, request, flash, redirect, url_for, session, send_from_directory, jsonify
 from flask.sessions import SessionInterface, SecureCookieSession
 from flask_wtf import FlaskForm
 from wtforms import StringField, FloatField, SelectField, BooleanField, SubmitField, RadioField
 from wtforms.validators import DataRequired, Email, Optional, ValidationError, NumberRange
 from flask_session import Session
-from itsdangerous import URLSafeTimedSerializer
-from flask_caching import Cache
-import numpy as np  # Add at top of app.py
 from flask_mail import Mail, Message
 import os
 import time
@@ -15,16 +12,24 @@ import logging
 import json
 import threading
 import re
-import zlib
+import hmac
+from functools import partial, wraps
 from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import gspread
-from google.oauth2.service_account import Credentials
-from tenacity import retry, stop_after_attempt, wait_exponential
 from dotenv import load_dotenv
 import random
-from translations import get_translations
+from translations import get_translations, supported_languages
+from sheets_journal import SheetsJournal, JournalFlusher
+from email_outbox import EmailOutbox, EmailWorkerPool
+from mail_delivery import PersistentMailer
+from session_codec import SessionCodec
+from session_backups import SessionBackups
+from chart_specs import ChartCache, bar_spec
+from email_shells import EmailShells
+from sheets_client import SessionPool, WorksheetCache, header_range, pooled_http_client, stale_headers
+from sheet_mirror import SheetMirror, frame_from_rows
+from rank_service import VersionedRanks
+from peer_aggregates import PeerAggregates
+from scoring import COURSE_URLS, RECOVERY_COURSE_URL, budget_metrics, budget_metrics_values, score_health, score_health_values
 
 # Configure logging
 logging.basicConfig(
@@ -41,7 +46,6 @@ app.config['SERVER_NAME'] = os.getenv('SERVER_NAME', 'localhost:5000')  # Fallba
 app.config['APPLICATION_ROOT'] = os.getenv('APPLICATION_ROOT', '/')
 app.config['PREFERRED_URL_SCHEME'] = os.getenv('PREFERRED_URL_SCHEME', 'http')  # Use 'https' in production
 app.config['DEBUG'] = False  # Set to True during development
-mail = Mail(app)
 if not app.config['SECRET_KEY']:
     logger.critical("FLASK_SECRET_KEY not set.")
     raise RuntimeError("FLASK_SECRET_KEY not set.")
@@ -67,6 +71,13 @@ app.config['MAIL_USERNAME'] = os.getenv('SMTP_USER')
 app.config['MAIL_PASSWORD'] = os.getenv('SMTP_PASSWORD')
 app.config['MAIL_USE_TLS'] = True
 app.config['MAIL_USE_SSL'] = False
+app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_DEFAULT_SENDER', os.getenv('SMTP_USER'))
+# Flask-Mail reads its settings when initialized, so this must follow the config above
+mail = Mail(app)
+# Messages sent over one SMTP session before it is recycled, and idle seconds before it is closed
+MAIL_MAX_MESSAGES_PER_CONNECTION = int(os.getenv('MAIL_MAX_MESSAGES_PER_CONNECTION', '100'))
+MAIL_CONNECTION_IDLE_TIMEOUT = float(os.getenv('MAIL_CONNECTION_IDLE_TIMEOUT', '30'))
+mailer = PersistentMailer(mail, max_messages=MAIL_MAX_MESSAGES_PER_CONNECTION, max_idle=MAIL_CONNECTION_IDLE_TIMEOUT)
 
 # Define session directories
 SESSION_FILE_DIR = os.path.join(app.root_path, 'flask_session')
@@ -121,22 +132,34 @@ except Exception as e:
     logger.critical(f"Failed to create or verify {SESSION_BACKUP_DIR}: {e}")
     raise RuntimeError(f"Failed to create or verify {SESSION_BACKUP_DIR}")
 
-# Define sanitize_input for backup filenames
-def sanitize_input(email):
+# Define sanitize_filename for backup filenames
+def sanitize_filename(email):
     return re.sub(r'[^\w\-_\. ]', '_', email)
-    
+
+# Session backups are written by a background thread, at most once per SESSION_BACKUP_DELAY seconds per email
+SESSION_BACKUP_DELAY = float(os.getenv('SESSION_BACKUP_DELAY', '1.0'))
+session_backups = SessionBackups(SESSION_BACKUP_DIR, sanitize_filename, delay=SESSION_BACKUP_DELAY)
+session_backups.start()
+
 # Custom session interface for compression
 class CompressedSession(SessionInterface):
+    def __init__(self):
+        self._codec = None
+
+    def get_codec(self, app):
+        # Built once per secret key instead of on every request
+        codec = self._codec
+        if codec is None or codec.secret_key != app.config['SECRET_KEY']:
+            codec = self._codec = SessionCodec(app.config['SECRET_KEY'])
+        return codec
+
     def open_session(self, app, request):
         session_data = request.cookies.get(self.get_cookie_name(app))
         if not session_data:
             logger.info("No session cookie found, creating new session")
             return SecureCookieSession()  # Return a new SecureCookieSession
         try:
-            serializer = URLSafeTimedSerializer(app.config['SECRET_KEY'])
-            decompressed_data = serializer.loads(session_data)
-            compressed_data = bytes.fromhex(decompressed_data)
-            session_dict = json.loads(zlib.decompress(compressed_data).decode('utf-8'))
+            session_dict = self.get_codec(app).loads(session_data)
             session = SecureCookieSession(session_dict)  # Wrap dict in SecureCookieSession
             if ('budget_data' not in session and 'health_data' not in session and 'quiz_results' not in session) and session.get('email'):
                 session = self.restore_from_backup(session.get('email'), session)
@@ -155,11 +178,7 @@ class CompressedSession(SessionInterface):
                 response.delete_cookie(self.get_cookie_name(app), domain=domain, path=path)
             return
         try:
-            serializer = URLSafeTimedSerializer(app.config['SECRET_KEY'])
-            session_data = json.dumps(dict(session)).encode('utf-8')
-            compressed_data = zlib.compress(session_data)
-            encoded_data = compressed_data.hex()
-            signed_data = serializer.dumps(encoded_data)
+            signed_data = self.get_codec(app).dumps(dict(session))
             response.set_cookie(
                 self.get_cookie_name(app),
                 signed_data,
@@ -180,19 +199,14 @@ class CompressedSession(SessionInterface):
 
     def backup_session(self, email, session):
         try:
-            backup_file = os.path.join(SESSION_BACKUP_DIR, f"{sanitize_input(email)}.json")
-            with open(backup_file, 'w') as f:
-                json.dump(dict(session), f)
-            logger.info(f"Session backed up for {email}")
+            session_backups.save(email, dict(session))
         except Exception as e:
             logger.error(f"Failed to backup session for {email}: {e}")
 
     def restore_from_backup(self, email, session):
         try:
-            backup_file = os.path.join(SESSION_BACKUP_DIR, f"{sanitize_input(email)}.json")
-            if os.path.exists(backup_file):
-                with open(backup_file, 'r') as f:
-                    backup_data = json.load(f)
+            backup_data = session_backups.load(email)
+            if backup_data is not None:
                 session.update(backup_data)
                 session.modified = True  # Mark session as modified
                 logger.info(f"Session restored for {email}")
@@ -212,13 +226,6 @@ class CompressedSession(SessionInterface):
         
 app.session_interface = CompressedSession()
 
-# Configure caching
-app.config['CACHE_TYPE'] = 'filesystem'
-app.config['CACHE_DIR'] = os.path.join(app.root_path, 'cache')
-app.config['CACHE_DEFAULT_TIMEOUT'] = 3600
-os.makedirs(app.config['CACHE_DIR'], exist_ok=True)
-cache = Cache(app)
-
 # Custom validator
 def non_negative(form, field):
     if field.data < 0:
@@ -239,6 +246,10 @@ SCOPE = ['https://www.googleapis.com/auth/spreadsheets']
 SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
 sheets = None
 sheets_lock = threading.Lock()
+sheets_ready = threading.Event()
+sheets_unavailable = threading.Event()
+sheets_init_thread = None
+sheets_pool = None
 
 # URL constants
 FEEDBACK_FORM_URL = os.getenv('FEEDBACK_FORM_URL', 'https://docs.google.com/forms/feedback')
@@ -247,10 +258,6 @@ CONSULTANCY_FORM_URL = os.getenv('CONSULTANCY_FORM_URL', 'https://docs.google.co
 LINKEDIN_URL = os.getenv('LINKEDIN_URL', 'https://www.linkedin.com/in/ficore-africa')
 TWITTER_URL = os.getenv('TWITTER_URL', 'https://x.com/Ficore_Africa')
 FACEBOOK_URL = os.getenv('FACEBOOK_URL', 'https://www.facebook.com/profile.php?id=61575627944628&mibextid=ZbWKwL')
-INVESTING_COURSE_URL = 'https://youtube.com/@ficore.africa'
-SAVINGS_COURSE_URL = 'https://www.youtube.com/@FICORE.AFRICA'
-DEBT_COURSE_URL = 'https://www.youtube.com/@FICORE.AFRICA'
-RECOVERY_COURSE_URL = 'https://www.youtube.com/@FICORE.AFRICA'
 # Define base_url using os.getenv() with a default
 BASE_URL = os.getenv('BASE_URL', f"{app.config['PREFERRED_URL_SCHEME']}://{app.config['SERVER_NAME']}")
 
@@ -272,6 +279,45 @@ PREDETERMINED_HEADERS_QUIZ = [
     *(f'answer_{i}' for i in range(1, 11)),
     'personality', 'badges', 'auto_email'
 ]
+WORKSHEET_HEADERS = {
+    'Budget': PREDETERMINED_HEADERS_BUDGET,
+    'Health': PREDETERMINED_HEADERS_HEALTH,
+    'Quiz': PREDETERMINED_HEADERS_QUIZ
+}
+
+# Write-behind journal for sheet appends
+SHEETS_JOURNAL_PATH = os.getenv('SHEETS_JOURNAL_PATH', os.path.join(app.root_path, 'sheets_journal.db'))
+# Local SQLite replica of the worksheets, shared by all workers
+SHEETS_REPLICA_PATH = os.getenv('SHEETS_REPLICA_PATH', os.path.join(app.root_path, 'sheets_replica.db'))
+# Seconds between incremental syncs of a worksheet mirror, and between full reconciles
+SHEETS_SYNC_INTERVAL = int(os.getenv('SHEETS_SYNC_INTERVAL', '60'))
+SHEETS_RECONCILE_INTERVAL = int(os.getenv('SHEETS_RECONCILE_INTERVAL', '3600'))
+# Rows per append call and how long a partial batch may wait before it is sent
+SHEETS_BATCH_SIZE = int(os.getenv('SHEETS_BATCH_SIZE', '50'))
+SHEETS_MAX_LINGER = float(os.getenv('SHEETS_MAX_LINGER', '2.0'))
+# Seconds a caller waits for the first background Sheets connection attempt
+SHEETS_INIT_WAIT = float(os.getenv('SHEETS_INIT_WAIT', '5'))
+# Upper bound on the backoff between reconnection attempts once Sheets is unreachable
+SHEETS_RETRY_MAX = float(os.getenv('SHEETS_RETRY_MAX', '300'))
+# Keep-alive HTTP sessions per worker; concurrent Sheets calls beyond this wait for one
+SHEETS_POOL_SIZE = int(os.getenv('SHEETS_POOL_SIZE', '8'))
+# Outbox of report emails waiting to be sent, and email sender threads per worker
+EMAIL_OUTBOX_PATH = os.getenv('EMAIL_OUTBOX_PATH', os.path.join(app.root_path, 'email_outbox.db'))
+EMAIL_WORKERS = int(os.getenv('EMAIL_WORKERS', '2'))
+# Upper bound on the memory held by cached dashboard chart specs
+CHART_CACHE_BYTES = int(os.getenv('CHART_CACHE_BYTES', str(1 << 20)))
+# Shared secret for the /*_status endpoints (sent as X-Status-Token); unset disables them
+STATUS_TOKEN = os.getenv('STATUS_TOKEN')
+
+def status_endpoint(view):
+    """Serve an operational status view only to callers presenting STATUS_TOKEN."""
+    @wraps(view)
+    def guarded(*args, **kwargs):
+        token = request.headers.get('X-Status-Token', '')
+        if not STATUS_TOKEN or not hmac.compare_digest(token.encode('utf-8'), STATUS_TOKEN.encode('utf-8')):
+            return jsonify({'error': 'Not found'}), 404
+        return view(*args, **kwargs)
+    return guarded
 
 def sanitize_input(text):
     if not text:
@@ -279,136 +325,253 @@ def sanitize_input(text):
     return re.sub(r'[<>";]', '', text.strip())[:100]
 
 def get_sheets_client():
-    global sheets
+    if sheets is None:
+        # Connecting happens in the background. Wait briefly for the first
+        # attempt; once one has failed, fail fast while the retrier reconnects.
+        start_sheets_initialization()
+        if not sheets_unavailable.is_set():
+            sheets_ready.wait(SHEETS_INIT_WAIT)
     if sheets is None:
         logger.error("Google Sheets client not initialized.")
         return None
     return sheets
 
+worksheet_cache = WorksheetCache(get_sheets_client)
+
 def set_sheet_headers(headers, worksheet_name):
     try:
-        client = get_sheets_client()
-        if client is None:
+        if get_sheets_client() is None:
             return False
-        try:
-            worksheet = client.worksheet(worksheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            client.add_worksheet(worksheet_name, rows=100, cols=len(headers))
-            worksheet = client.worksheet(worksheet_name)
-        
-        col_num = len(headers)
-        col_letter = ''
-        while col_num > 0:
-            col_num, remainder = divmod(col_num - 1, 26)
-            col_letter = chr(65 + remainder) + col_letter
-        range_end = col_letter + '1'
-        worksheet.update(f'A1:{range_end}', [headers])
+        worksheet_cache.call(
+            worksheet_name,
+            lambda worksheet: worksheet.update(values=[headers], range_name=header_range(headers)),
+            headers
+        )
         logger.info(f"Headers set in worksheet '{worksheet_name}'.")
         return True
     except Exception as e:
         logger.error(f"Error setting headers in '{worksheet_name}': {e}")
         return False
-        
-def initialize_sheets(max_retries=5, backoff_factor=2):
-    global sheets
+
+def ensure_sheet_headers():
+    """Verify every worksheet's header row with one batched read; only rewrite those that differ."""
+    try:
+        spreadsheet = get_sheets_client()
+        if spreadsheet is None:
+            return False
+        # One metadata read loads all handles and creates any missing worksheet with its headers
+        for worksheet_name, headers in WORKSHEET_HEADERS.items():
+            worksheet_cache.get(worksheet_name, headers)
+        stale = stale_headers(spreadsheet, WORKSHEET_HEADERS)
+    except Exception as e:
+        logger.error(f"Error checking sheet headers: {e}")
+        return False
+    for worksheet_name in stale:
+        set_sheet_headers(WORKSHEET_HEADERS[worksheet_name], worksheet_name)
+    return True
+
+def initialize_sheets(backoff_factor=2):
+    """Connect to Google Sheets, retrying with backoff capped at SHEETS_RETRY_MAX until it succeeds."""
+    global sheets, sheets_pool
     if not SPREADSHEET_ID:
         logger.critical("SPREADSHEET_ID not set.")
+        sheets_unavailable.set()
         return False
-    for attempt in range(max_retries):
+    import gspread
+    from google.auth.transport.requests import AuthorizedSession
+    from google.oauth2.service_account import Credentials
+    attempt = 0
+    while True:
         try:
             creds_dict = json.loads(os.getenv('GOOGLE_CREDENTIALS_JSON'))
             creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPE)
-            client = gspread.authorize(creds)
+            pool = SessionPool(lambda: AuthorizedSession(creds), size=SHEETS_POOL_SIZE, credentials=creds)
+            pool.refresh_credentials(force=True)
+            client = gspread.authorize(creds, http_client=pooled_http_client(), session=pool)
             sheets = client.open_by_key(SPREADSHEET_ID)
-            set_sheet_headers(PREDETERMINED_HEADERS_BUDGET, 'Budget')
-            set_sheet_headers(PREDETERMINED_HEADERS_HEALTH, 'Health')
-            set_sheet_headers(PREDETERMINED_HEADERS_QUIZ, 'Quiz')
+            sheets_pool = pool
+            pool.start_refresher()
+            worksheet_cache.invalidate()
+            ensure_sheet_headers()
+            sheets_unavailable.clear()
+            sheets_ready.set()
             logger.info("Google Sheets initialized.")
             return True
         except Exception as e:
-            logger.error(f"Attempt {attempt + 1} failed: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(backoff_factor ** attempt)
-    logger.critical("Failed to initialize Google Sheets.")
-    return False
+            delay = min(backoff_factor ** attempt, SHEETS_RETRY_MAX)
+            logger.error(f"Attempt {attempt + 1} failed: {e}; retrying in {delay:.0f}s.")
+            sheets_unavailable.set()
+            attempt += 1
+            time.sleep(delay)
+
+def start_sheets_initialization():
+    """Connect to Google Sheets on a background thread unless connected or already connecting.
+
+    The thread keeps retrying until it connects, so there is only ever one
+    retrier per worker; the check restarts it in a worker forked without it.
+    """
+    global sheets_init_thread
+    with sheets_lock:
+        if sheets is not None or (sheets_init_thread is not None and sheets_init_thread.is_alive()):
+            return
+        sheets_init_thread = threading.Thread(target=initialize_sheets, name='sheets-init', daemon=True)
+        sheets_init_thread.start()
+
+# Serve static and form pages right away; Sheets connects in the background
+start_sheets_initialization()
+
+# Sorted scores behind the ranks on the health and budget dashboards
+score_ranks = {'Health': VersionedRanks(), 'Budget': VersionedRanks()}
+RANK_COLUMNS = {'Health': 'HealthScore', 'Budget': 'surplus_deficit'}
+
+def _row_score(worksheet_name, row):
+    import pandas as pd
+    if worksheet_name == 'Health':
+        values = dict(zip(PREDETERMINED_HEADERS_HEALTH, row))
+        return score_health_values(values['income_revenue'], values['expenses_costs'], values['debt_loan'],
+                                   values['debt_interest_rate'], COURSE_URLS).health_score
+    return pd.to_numeric(row[PREDETERMINED_HEADERS_BUDGET.index('surplus_deficit')], errors='coerce')
+
+def _add_ranked_rows(worksheet_name, previous_version, version, rows):
+    # Called by the mirror for each write-through or sync, so ranks follow new rows without a rebuild
+    score_ranks[worksheet_name].add(previous_version, version, [_row_score(worksheet_name, row) for row in rows])
+
+# Health score components whose peer means are kept alongside the score
+HEALTH_COMPONENTS = ['NormCashFlow', 'NormDebtToIncome', 'NormDebtInterest']
+
+def _make_mirror(worksheet_name):
+    headers = WORKSHEET_HEADERS[worksheet_name]
+    aggregates = None
+    if worksheet_name == 'Health':
+        aggregates = PeerAggregates(
+            'HealthScore',
+            HEALTH_COMPONENTS,
+            lambda rows: calculate_health_score(frame_from_rows(rows, PREDETERMINED_HEADERS_HEALTH))
+        )
+    return SheetMirror(
+        worksheet_name,
+        headers,
+        read_range=lambda a1_range: worksheet_cache.call(worksheet_name, lambda worksheet: worksheet.get_values(a1_range), headers),
+        read_all=lambda: worksheet_cache.call(worksheet_name, lambda worksheet: worksheet.get_all_values(), headers),
+        db_path=SHEETS_REPLICA_PATH,
+        sync_interval=SHEETS_SYNC_INTERVAL,
+        reconcile_interval=SHEETS_RECONCILE_INTERVAL,
+        aggregates=aggregates,
+        on_rows=partial(_add_ranked_rows, worksheet_name) if worksheet_name in score_ranks else None
+    )
 
-if not initialize_sheets():
-    raise RuntimeError("Failed to initialize Google Sheets.")
+sheet_mirrors = {name: _make_mirror(name) for name in WORKSHEET_HEADERS}
 
-@cache.memoize(timeout=3600)
 def fetch_data_from_sheet(email=None, headers=PREDETERMINED_HEADERS_HEALTH, worksheet_name='Health'):
+    mirror = sheet_mirrors[worksheet_name]
+    # Without Sheets the replica still holds the last sync plus rows written through since
     try:
-        client = get_sheets_client()
-        if client is None:
-            return pd.DataFrame(columns=headers)
-        try:
-            worksheet = client.worksheet(worksheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            client.add_worksheet(worksheet_name, rows=100, cols=len(headers))
-            worksheet = client.worksheet(worksheet_name)
-            worksheet.update('A1:' + chr(64 + len(headers)) + '1', [headers])
-        values = worksheet.get_all_values()
-        if not values:
-            return pd.DataFrame(columns=headers)
-        rows = values[1:] if len(values) > 1 else []
-        adjusted_rows = [row + [''] * (len(headers) - len(row)) if len(row) < len(headers) else row[:len(headers)] for row in rows]
-        df = pd.DataFrame(adjusted_rows, columns=headers)
-        df['language'] = df['language'].replace('', 'en')
-        if email:
-            df = df[df['email'] == email].head(1) if headers == PREDETERMINED_HEADERS_BUDGET else df[df['email'] == email]
-        logger.info(f"Fetched {len(df)} rows from '{worksheet_name}'.")
-        return df
+        if get_sheets_client() is not None:
+            mirror.refresh()
     except Exception as e:
-        logger.error(f"Error fetching data from '{worksheet_name}': {e}")
-        return pd.DataFrame(columns=headers)
+        logger.error(f"Error syncing '{worksheet_name}': {e}")
+    if email:
+        df = mirror.rows_for_email(email, limit=1 if headers == PREDETERMINED_HEADERS_BUDGET else None)
+    else:
+        df = mirror.frame()
+    logger.info(f"Fetched {len(df)} rows from '{worksheet_name}'.")
+    return df
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
 def append_to_sheet(data, headers, worksheet_name='Health'):
+    """Record a row in the write-behind journal; the flusher appends it to the sheet."""
     try:
         if len(data) != len(headers):
             logger.error(f"Invalid data length for '{worksheet_name}': {data}")
             return False
-        client = get_sheets_client()
-        if client is None:
-            return False
+        journal_id = sheets_journal.enqueue(worksheet_name, data)
         try:
-            worksheet = client.worksheet(worksheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            client.add_worksheet(worksheet_name, rows=100, cols=len(headers))
-            worksheet = client.worksheet(worksheet_name)
-            worksheet.update('A1:' + chr(64 + len(headers)) + '1', [headers])
-        worksheet.append_row(data, value_input_option='RAW')
-        logger.info(f"Appended data to '{worksheet_name}'.")
-        time.sleep(1)
+            sheet_mirrors[worksheet_name].write_through(journal_id, data)
+        except Exception as e:
+            # The row is journaled; it will show up after the next sync instead
+            logger.error(f"Error writing row through to '{worksheet_name}' replica: {e}")
+        sheets_flusher.notify()
+        logger.info(f"Queued row for '{worksheet_name}'.")
         return True
     except Exception as e:
-        logger.error(f"Error appending to '{worksheet_name}': {e}")
+        logger.error(f"Error queueing row for '{worksheet_name}': {e}")
         return False
 
+def _deliver_rows(worksheet_name, rows):
+    if get_sheets_client() is None:
+        raise RuntimeError("Google Sheets client not initialized.")
+    worksheet_cache.call(
+        worksheet_name,
+        lambda worksheet: worksheet.append_rows(rows, value_input_option='RAW'),
+        WORKSHEET_HEADERS[worksheet_name]
+    )
+    logger.info(f"Appended {len(rows)} rows to '{worksheet_name}'.")
+
+def _on_rows_delivered(worksheet_names):
+    for name in worksheet_names:
+        sheet_mirrors[name].mark_stale()
+
+sheets_journal = SheetsJournal(SHEETS_JOURNAL_PATH)
+sheets_flusher = JournalFlusher(
+    sheets_journal,
+    _deliver_rows,
+    on_delivered=_on_rows_delivered,
+    batch_size=SHEETS_BATCH_SIZE,
+    max_linger=SHEETS_MAX_LINGER
+)
+sheets_flusher.start()
+
+def get_score_ranks(worksheet_name):
+    """Ranks for the worksheet's current rows.
+
+    New rows are inserted as this worker writes or syncs them; all users are
+    only rescored when the replica changed some other way (a reconcile, or
+    another worker's write or sync).
+    """
+    import pandas as pd
+    mirror = sheet_mirrors[worksheet_name]
+    ranks = score_ranks[worksheet_name].current(mirror.version)
+    if ranks is not None:
+        return ranks
+    all_users_df = fetch_data_from_sheet(headers=WORKSHEET_HEADERS[worksheet_name], worksheet_name=worksheet_name)
+
+    def scores():
+        df = calculate_health_score(all_users_df) if worksheet_name == 'Health' else all_users_df
+        return pd.to_numeric(df[RANK_COLUMNS[worksheet_name]], errors='coerce')
+
+    # The sync in fetch_data_from_sheet may already have brought the ranks up to date
+    return score_ranks[worksheet_name].get(mirror.snapshot_version, scores)
+
+def get_peer_aggregates():
+    try:
+        return sheet_mirrors['Health'].peer_aggregates()
+    except Exception as e:
+        logger.error(f"Error reading peer aggregates: {e}")
+        return None
+
+@app.route('/sheets_status', methods=['GET'])
+@status_endpoint
+def sheets_status():
+    status = sheets_journal.stats()
+    status['connected'] = sheets is not None
+    status['worksheet_cache'] = worksheet_cache.stats()
+    status['http_pool'] = sheets_pool.stats() if sheets_pool is not None else None
+    status['mirrors'] = {name: mirror.stats() for name, mirror in sheet_mirrors.items()}
+    status['ranks'] = {name: ranks.stats() for name, ranks in score_ranks.items()}
+    status['peer_aggregates'] = get_peer_aggregates()
+    return jsonify(status)
+
 def calculate_budget_metrics(df):
     try:
         if df.empty:
             logger.warning("Empty DataFrame in calculate_budget_metrics.")
             return df
-        for col in ['monthly_income', 'housing_expenses', 'food_expenses', 'transport_expenses', 'other_expenses', 'savings_goal']:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
-        df['total_expenses'] = df['housing_expenses'] + df['food_expenses'] + df['transport_expenses'] + df['other_expenses']
-        df['savings'] = df.apply(
-            lambda row: max(0, row['monthly_income'] * 0.1) if pd.isna(row['savings_goal']) or row['savings_goal'] == 0 else row['savings_goal'],
-            axis=1
-        )
-        df['surplus_deficit'] = df['monthly_income'] - df['total_expenses'] - df['savings']
-        df['outcome_status'] = df['surplus_deficit'].apply(lambda x: 'Savings' if x >= 0 else 'Overspend')
-        df['advice'] = df['surplus_deficit'].apply(
-            lambda x: get_translations(df['language'].iloc[0])['Great job! Save or invest your surplus to grow your wealth.'] if x >= 0 
-            else get_translations(df['language'].iloc[0])['Reduce non-essential spending to balance your budget.']
-        )
-        return df
+        return budget_metrics(df, get_translations)
     except Exception as e:
         logger.error(f"Error in calculate_budget_metrics: {e}")
         return df
 
 def assign_badges_budget(user_df):
+    import pandas as pd
     badges = []
     try:
         if user_df.empty:
@@ -416,68 +579,37 @@ def assign_badges_budget(user_df):
             return badges
         user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', errors='coerce')
         user_df = user_df.sort_values('Timestamp', ascending=False)
-        language = user_df.iloc[0].get('language', 'en')
-        if len(user_df) == 1:
-            badges.append(get_translations(language)['First Budget Completed!'])
-        return badges
+        return budget_badges(user_df.iloc[0].get('language', 'en'), len(user_df))
     except Exception as e:
         logger.error(f"Error in assign_badges_budget: {e}")
         return badges
 
+def budget_badges(language, submissions):
+    badges = []
+    if submissions == 1:
+        badges.append(get_translations(language)['First Budget Completed!'])
+    return badges
+
+def score_budget_submission(budget_data):
+    """One submission's budget row (form data plus metrics) without building a DataFrame."""
+    row = {header: budget_data.get(header) for header in PREDETERMINED_HEADERS_BUDGET}
+    row.update(budget_metrics_values(budget_data, budget_data.get('language') or 'en', get_translations).as_columns())
+    return row
+
 def calculate_health_score(df):
     try:
         if df.empty:
             logger.warning("Empty DataFrame in calculate_health_score.")
             df['HealthScore'] = 0.0
             return df
-        for col in ['income_revenue', 'expenses_costs', 'debt_loan', 'debt_interest_rate']:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
-        df['IncomeRevenueSafe'] = df['income_revenue'].replace(0, 1e-10)
-        df['CashFlowRatio'] = (df['income_revenue'] - df['expenses_costs']) / df['IncomeRevenueSafe']
-        df['DebtToIncomeRatio'] = df['debt_loan'] / df['IncomeRevenueSafe']
-        df['DebtInterestBurden'] = df['debt_interest_rate'].clip(lower=0) / 20
-        df['DebtInterestBurden'] = df['DebtInterestBurden'].clip(upper=1)
-        df['NormCashFlow'] = df['CashFlowRatio'].clip(0, 1)
-        df['NormDebtToIncome'] = 1 - df['DebtToIncomeRatio'].clip(0, 1)
-        df['NormDebtInterest'] = 1 - df['DebtInterestBurden']
-        df['HealthScore'] = (
-            df['NormCashFlow'] * 0.333 +
-            df['NormDebtToIncome'] * 0.333 +
-            df['NormDebtInterest'] * 0.333
-        ) * 100
-        df['HealthScore'] = df['HealthScore'].round(2)
-        df[['ScoreDescription', 'CourseTitle', 'CourseURL']] = df.apply(
-            score_description_and_course, axis=1, result_type='expand'
-        )
-        return df
+        return score_health(df, COURSE_URLS)
     except Exception as e:
         logger.error(f"Error calculating health score: {e}")
         df['HealthScore'] = 0.0
         return df
 
-def score_description_and_course(row):
-    score = row['HealthScore']
-    cash_flow = row['CashFlowRatio']
-    debt_to_income = row['DebtToIncomeRatio']
-    debt_interest = row['DebtInterestBurden']
-    clean_urls = {
-        'investing': INVESTING_COURSE_URL.split('?')[0],
-        'debt': DEBT_COURSE_URL.split('?')[0],
-        'savings': SAVINGS_COURSE_URL.split('?')[0],
-        'recovery': RECOVERY_COURSE_URL.split('?')[0]
-    }
-    if score >= 75:
-        return ('Stable Income; invest excess now', 'Ficore Simplified Investing Course', clean_urls['investing'])
-    elif score >= 50:
-        if cash_flow < 0.3 or debt_interest > 0.5:
-            return ('At Risk; manage your expense!', 'Ficore Debt and Expense Management', clean_urls['debt'])
-        return ('Moderate; save something monthly!', 'Ficore Savings Mastery', clean_urls['savings'])
-    elif score >= 25:
-        return ('At Risk; manage your expense!', 'Ficore Debt and Expense Management', clean_urls['debt'])
-    else:
-        return ('Critical; seek financial help!', 'Ficore Financial Recovery', clean_urls['recovery'])
-
-def assign_badges_health(user_df, all_users_df):
+def assign_badges_health(user_df):
+    import pandas as pd
     badges = []
     if user_df.empty:
         logger.warning("Empty user_df in assign_badges_health.")
@@ -486,18 +618,38 @@ def assign_badges_health(user_df, all_users_df):
         user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', dayfirst=True, errors='coerce')
         user_df = user_df.sort_values('Timestamp', ascending=False)
         user_row = user_df.iloc[0]
-        language = user_row['language']
-        if len(user_df) == 1:
-            badges.append(get_translations(language)['First Health Score Completed!'])
-        if user_row['HealthScore'] >= 50:
-            badges.append(get_translations(language)['Financial Stability Achieved!'])
-        if user_row['DebtToIncomeRatio'] < 0.3:
-            badges.append(get_translations(language)['Debt Slayer!'])
-        return badges
+        return health_badges(user_row['language'], len(user_df), user_row['HealthScore'], user_row['DebtToIncomeRatio'])
     except Exception as e:
         logger.error(f"Error in assign_badges_health: {e}")
         return badges
 
+def health_badges(language, submissions, health_score, debt_to_income):
+    trans = get_translations(language)
+    badges = []
+    if submissions == 1:
+        badges.append(trans['First Health Score Completed!'])
+    if health_score >= 50:
+        badges.append(trans['Financial Stability Achieved!'])
+    if debt_to_income < 0.3:
+        badges.append(trans['Debt Slayer!'])
+    return badges
+
+def email_shell_context(language):
+    return {
+        'trans': get_translations(language),
+        'language': language,
+        'base_url': BASE_URL,
+        'FEEDBACK_FORM_URL': FEEDBACK_FORM_URL,
+        'WAITLIST_FORM_URL': WAITLIST_FORM_URL,
+        'CONSULTANCY_FORM_URL': CONSULTANCY_FORM_URL,
+        'LINKEDIN_URL': LINKEDIN_URL,
+        'TWITTER_URL': TWITTER_URL,
+        'RECOVERY_COURSE_URL': RECOVERY_COURSE_URL
+    }
+
+# Email templates rendered once per language; sends only fill in the recipient's fields
+email_shells = EmailShells(app.jinja_env, email_shell_context, filters={'format_currency': format_currency})
+
 def send_health_email(to_email, user_name, health_score, score_description, rank, total_users, course_title, course_url, language):
     try:
         trans = get_translations(language)
@@ -505,72 +657,54 @@ def send_health_email(to_email, user_name, health_score, score_description, rank
         msg = Message(
             subject=subject,
             recipients=[to_email],
-            html=render_template(
+            html=email_shells.render(
                 'health_score_email.html',
-                trans=trans,
+                language,
                 user_name=sanitize_input(user_name),
                 health_score=health_score,
                 score_description=score_description,
                 rank=rank,
                 total_users=total_users,
                 course_title=course_title,
-                course_url=course_url,
-                base_url=BASE_URL,
-                FEEDBACK_FORM_URL=FEEDBACK_FORM_URL,
-                WAITLIST_FORM_URL=WAITLIST_FORM_URL,
-                CONSULTANCY_FORM_URL=CONSULTANCY_FORM_URL,
-                LINKEDIN_URL=LINKEDIN_URL,
-                TWITTER_URL=TWITTER_URL,
-                language=language
+                course_url=course_url
             )
         )
-        mail.send(msg)
+        mailer.send(msg)
         logger.info(f"Health email sent to {to_email}")
         return True
     except Exception as e:
         logger.error(f"Error sending health email to {to_email}: {e}")
         return False
 
-def send_health_email_async(to_email, user_name, health_score, score_description, rank, total_users, course_title, course_url, language):
-    with app.app_context():
-        send_health_email(to_email, user_name, health_score, score_description, rank, total_users, course_title, course_url, language)
+chart_cache = ChartCache(max_bytes=CHART_CACHE_BYTES)
 
-def generate_breakdown_plot(user_df):
+def generate_breakdown_plot(user_row, language='en'):
     try:
-        if user_df.empty:
-            return None
-        user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', dayfirst=True, errors='coerce')
-        user_df = user_df.sort_values('Timestamp', ascending=False)
-        user_row = user_df.iloc[0]
+        trans = get_translations(language)
         labels = ['Cash Flow', 'Debt-to-Income', 'Debt Interest']
-        values = [
-            user_row['NormCashFlow'] * 100 / 3,
-            user_row['NormDebtToIncome'] * 100 / 3,
-            user_row['NormDebtInterest'] * 100 / 3
-        ]
-        fig = px.bar(x=labels, y=values, title='Score Breakdown', labels={'x': 'Component', 'y': 'Score Contribution'})
-        fig.update_layout(margin=dict(l=20, r=20, t=30, b=20), height=300, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
-        return fig.to_html(full_html=False, include_plotlyjs=False)
+        values = tuple(
+            round(float(user_row[column]) * 100 / 3, 1)
+            for column in ('NormCashFlow', 'NormDebtToIncome', 'NormDebtInterest')
+        )
+        return chart_cache.get(('breakdown', language) + values, lambda: bar_spec(
+            [trans.get(label, label) for label in labels], values,
+            trans.get('Score Breakdown', 'Score Breakdown'), 'Component', 'Score Contribution'
+        ))
     except Exception as e:
         logger.error(f"Error generating breakdown plot: {e}")
         return None
 
-def generate_comparison_plot(user_df, all_users_df):
+def generate_comparison_plot(user_row, avg_score, language='en'):
     try:
-        if user_df.empty or all_users_df.empty:
+        if avg_score is None:
             return None
-        user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', dayfirst=True, errors='coerce')
-        user_df = user_df.sort_values('Timestamp', ascending=False)
-        user_score = user_df.iloc[0]['HealthScore']
-        avg_score = all_users_df['HealthScore'].astype(float).mean()
-        fig = px.bar(
-            x=['Your Score', 'Average Peer Score'],
-            y=[user_score, avg_score],
-            title='How Your Score Compares',
-            labels={'x': 'Score Type', 'y': 'Score'}
-        )
-        fig.update_layout(margin=dict(l=20, r=20, t=30, b=20), height=300, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
-        return fig.to_html(full_html=False, include_plotlyjs=False)
+        trans = get_translations(language)
+        user_score = round(float(user_row['HealthScore']), 1)
+        avg_score = round(float(avg_score), 1)
+        return chart_cache.get(('comparison', language, user_score, avg_score), lambda: bar_spec(
+            ['Your Score', 'Average Peer Score'], [user_score, avg_score],
+            trans.get('How Your Score Compares', 'How Your Score Compares'), 'Score Type', 'Score'
+        ))
     except Exception as e:
         logger.error(f"Error generating comparison plot: {e}")
         return None
@@ -740,6 +874,7 @@ def assign_personality(answers, language='en'):
         return 'Avoider', trans.get('Avoider', 'You avoid financial planning.'), trans.get('Avoider Tip', 'Start with a simple plan.')
         
 def assign_badges_quiz(user_df, all_users_df):
+    import pandas as pd
     badges = []
     if user_df.empty:
         logger.warning("Empty user_df in assign_badges_quiz.")
@@ -761,110 +896,97 @@ def assign_badges_quiz(user_df, all_users_df):
         logger.error(f"Error in assign_badges_quiz: {e}")
         return badges
 
-def generate_quiz_summary_chart(answers, language='en'):
-    try:
-        answer_counts = {}
-        for _, answer in answers:
-            answer_counts[answer] = answer_counts.get(answer, 0) + 1
-        labels = list(answer_counts.keys())
-        values = list(answer_counts.values())
-        trans = get_translations(language)
-        
-        # Calculate max value for Y-axis, default to 1 if no values
-        max_value = max(values) if values else 1
-        
-        fig = px.bar(
-            x=labels,
-            y=values,
-            title=trans.get('Quiz Summary', 'Quiz Summary'),
-            labels={'x': trans.get('Answer', 'Answer'), 'y': trans.get('Count', 'Count')}
-        )
-        fig.update_layout(
-            margin=dict(l=20, r=20, t=30, b=20),
-            height=400,  # Match the chart-section height in the template
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            yaxis=dict(range=[0, max_value + 1]),  # Fix Y-axis to start at 0
-            font=dict(color='#666'),
-            title_font=dict(color='#01579B', size=18),
-            xaxis_title_font=dict(color='#666', size=14),
-            yaxis_title_font=dict(color='#666', size=14),
-            bargap=0.2
-        )
-        fig.update_traces(marker_color='#0288D1', marker_line_color='#01579B', marker_line_width=1)
-        return fig.to_html(full_html=False, include_plotlyjs=False)
-    except Exception as e:
-        logger.error(f"Error generating quiz summary chart: {e}")
-        return None
 def send_quiz_email(to_email, user_name, personality, personality_desc, tip, language):
     try:
         trans = get_translations(language)
         msg = Message(
             subject=trans.get('Quiz Report Subject', 'Your Quiz Report'),
             recipients=[to_email],
-            html=render_template(
+            html=email_shells.render(
                 'quiz_email.html',
-                trans=trans,
+                language,
                 user_name=sanitize_input(user_name) or 'User',
                 personality=personality,
                 personality_desc=personality_desc,
-                tip=tip,
-                base_url=BASE_URL,
-                FEEDBACK_FORM_URL=FEEDBACK_FORM_URL,
-                WAITLIST_FORM_URL=WAITLIST_FORM_URL,
-                CONSULTANCY_FORM_URL=CONSULTANCY_FORM_URL,
-                LINKEDIN_URL=LINKEDIN_URL,
-                TWITTER_URL=TWITTER_URL,
-                language=language
+                tip=tip
             )
         )
-        mail.send(msg)
+        mailer.send(msg)
         logger.info(f"Quiz email sent to {to_email}")
         return True
     except Exception as e:
         logger.error(f"Error sending quiz email to {to_email}: {e}")
         return False
 
-def send_quiz_email_async(to_email, user_name, personality, personality_desc, tip, language):
-    with app.app_context():
-        send_quiz_email(to_email, user_name, personality, personality_desc, tip, language)
-
 def send_budget_email(to_email, user_name, user_data, language):
     try:
         trans = get_translations(language)
         msg = Message(
             subject=trans.get('Budget Report Subject', 'Your Budget Report'),
             recipients=[to_email],
-            html=render_template(
+            html=email_shells.render(
                 'budget_email.html',
-                trans=trans,
+                language,
                 user_name=sanitize_input(user_name),
-                user_data=user_data,
-                FEEDBACK_FORM_URL=FEEDBACK_FORM_URL,
-                WAITLIST_FORM_URL=WAITLIST_FORM_URL,
-                CONSULTANCY_FORM_URL=CONSULTANCY_FORM_URL,
-                LINKEDIN_URL=LINKEDIN_URL,
-                TWITTER_URL=TWITTER_URL,
-                base_url=BASE_URL,
-                language=language
+                user_data=user_data
             )
         )
-        mail.send(msg)
+        mailer.send(msg)
         logger.info(f"Budget email sent to {to_email}")
         return True
     except Exception as e:
         logger.error(f"Error sending budget email to {to_email}: {e}")
         return False
 
-def send_budget_email_async(to_email, user_name, user_data, language):
+EMAIL_SENDERS = {
+    'budget': send_budget_email,
+    'health': send_health_email,
+    'quiz': send_quiz_email
+}
+
+def _send_queued_email(kind, payload):
     with app.app_context():
-        send_budget_email(to_email, user_name, user_data, language)
+        if not EMAIL_SENDERS[kind](**payload):
+            # The sender logged the recipient; the outbox keeps no addresses in last_error
+            raise RuntimeError(f"{kind} email was not sent")
+
+email_outbox = EmailOutbox(EMAIL_OUTBOX_PATH)
+email_workers = EmailWorkerPool(email_outbox, _send_queued_email, workers=EMAIL_WORKERS, on_idle=mailer.close_if_idle)
+email_workers.start()
+
+def queue_email(kind, **payload):
+    """Record an email in the outbox; a bounded pool of email workers sends it."""
+    try:
+        email_outbox.enqueue(kind, payload)
+        email_workers.notify()
+        return True
+    except Exception as e:
+        logger.error(f"Error queueing {kind} email to {payload.get('to_email')}: {e}")
+        return False
+
+@app.route('/email_status', methods=['GET'])
+@status_endpoint
+def email_status():
+    status = email_workers.stats()
+    status['smtp'] = mailer.stats()
+    status['shells'] = email_shells.stats()
+    return jsonify(status)
+
+@app.route('/session_status', methods=['GET'])
+@status_endpoint
+def session_status():
+    return jsonify(session_backups.stats())
+
+@app.route('/chart_status', methods=['GET'])
+@status_endpoint
+def chart_status():
+    return jsonify(chart_cache.stats())
 
 # Routes
 @app.route('/change_language', methods=['POST'])
 def change_language():
     language = request.form.get('language', 'en')
-    if language in ['en', 'ha']:
+    if language in supported_languages():
         session['language'] = language
         session.modified = True
     return redirect(request.args.get('next') or url_for('index'))
@@ -1008,14 +1130,8 @@ def budget_step4():
             })
             session.modified = True
             budget_data = session['budget_data']
-            df = pd.DataFrame([budget_data], columns=PREDETERMINED_HEADERS_BUDGET)
-            df = calculate_budget_metrics(df)
-            if df.empty:
-                flash(trans['Error retrieving data. Please try again.'], 'error')
-                return redirect(url_for('budget_step1'))
-            user_df = df
-            badges = assign_badges_budget(user_df)
-            user_df['badges'] = ', '.join(badges)
+            user_row = score_budget_submission(budget_data)
+            user_row['badges'] = ', '.join(budget_badges(user_row['language'], 1))
             data = [
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 budget_data.get('first_name', ''),
@@ -1028,10 +1144,10 @@ def budget_step4():
                 budget_data.get('other_expenses', 0),
                 budget_data.get('savings_goal', 0),
                 str(budget_data.get('auto_email', False)).lower(),
-                user_df['total_expenses'].iloc[0],
-                user_df['savings'].iloc[0],
-                user_df['surplus_deficit'].iloc[0],
-                user_df['badges'].iloc[0],
+                user_row['total_expenses'],
+                user_row['savings'],
+                user_row['surplus_deficit'],
+                user_row['badges'],
                 0,
                 0
             ]
@@ -1039,10 +1155,8 @@ def budget_step4():
                 flash(trans['Google Sheets Error'], 'error')
                 return redirect(url_for('budget_step1'))
             if budget_data.get('auto_email'):
-                threading.Thread(
-                    target=send_budget_email_async,
-                    args=(budget_data['email'], budget_data['first_name'], user_df.iloc[0], language)
-                ).start()
+                queue_email('budget', to_email=budget_data['email'], user_name=budget_data['first_name'],
+                            user_data=user_row, language=language)
                 flash(trans['Check Inbox'], 'success')
             flash(trans['Submission Success'], 'success')
             return redirect(url_for('budget_dashboard'))
@@ -1070,6 +1184,7 @@ def budget_step4():
 
 @app.route('/budget_dashboard', methods=['GET', 'POST'])
 def budget_dashboard():
+    import pandas as pd
     language = session.get('language', 'en')
     trans = get_translations(language)
     if 'budget_data' not in session or not session['budget_data'].get('email'):
@@ -1078,10 +1193,9 @@ def budget_dashboard():
     email = session['budget_data']['email']
     try:
         if 'budget_data' in session:
-            budget_data = session['budget_data']
-            df = pd.DataFrame([budget_data], columns=PREDETERMINED_HEADERS_BUDGET)
-            user_df = calculate_budget_metrics(df)
-            user_df['Timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            user_row = score_budget_submission(session['budget_data'])
+            user_row['Timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            badges = budget_badges(user_row['language'], 1)
         else:
             user_df = fetch_data_from_sheet(email=email, headers=PREDETERMINED_HEADERS_BUDGET, worksheet_name='Budget')
             if user_df.empty:
@@ -1089,23 +1203,12 @@ def budget_dashboard():
                 return redirect(url_for('budget_step1'))
             user_df = calculate_budget_metrics(user_df)
             user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', errors='coerce')
-        all_users_df = fetch_data_from_sheet(headers=PREDETERMINED_HEADERS_BUDGET, worksheet_name='Budget')
-        user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', errors='coerce')
-        user_df = user_df.sort_values('Timestamp', ascending=False)
-        user_row = user_df.iloc[0]
-        rank = sum(all_users_df['surplus_deficit'].astype(float) > user_row['surplus_deficit']) + 1
-        total_users = len(all_users_df)
-        badges = assign_badges_budget(user_df)
-        budget_breakdown = {
-            'Housing': user_row['housing_expenses'],
-            'Food': user_row['food_expenses'],
-            'Transport': user_row['transport_expenses'],
-            'Other': user_row['other_expenses']
-        }
-        breakdown_fig = px.pie(names=list(budget_breakdown.keys()), values=list(budget_breakdown.values()), title=trans['Budget Breakdown'])
-        breakdown_plot = breakdown_fig.to_html(full_html=False, include_plotlyjs=False)
-        comparison_fig = px.bar(x=['Income', 'Expenses', 'Savings'], y=[user_row['monthly_income'], user_row['total_expenses'], user_row['savings']], title=trans['Income vs Expenses'])
-        comparison_plot = comparison_fig.to_html(full_html=False, include_plotlyjs=False)
+            user_df = user_df.sort_values('Timestamp', ascending=False)
+            user_row = user_df.iloc[0]
+            badges = assign_badges_budget(user_df)
+        ranks = get_score_ranks('Budget')
+        rank = ranks.count_above(float(user_row['surplus_deficit'])) + 1
+        total_users = len(ranks)
         session.pop('budget_data', None)
         session.modified = True
         return render_template(
@@ -1116,8 +1219,6 @@ def budget_dashboard():
             rank=rank,
             base_url=BASE_URL,
             total_users=total_users,
-            breakdown_plot=breakdown_plot,
-            comparison_plot=comparison_plot,
             FEEDBACK_FORM_URL=FEEDBACK_FORM_URL,
             WAITLIST_FORM_URL=WAITLIST_FORM_URL,
             CONSULTANCY_FORM_URL=CONSULTANCY_FORM_URL,
@@ -1261,62 +1362,37 @@ def health_score_step3():
                 flash(trans['Google Sheets Error'], 'error')
                 return redirect(url_for('health_score_step1'))
 
-            user_df = fetch_data_from_sheet(email=health_data['email'], headers=PREDETERMINED_HEADERS_HEALTH, worksheet_name='Health')
-            all_users_df = fetch_data_from_sheet(headers=PREDETERMINED_HEADERS_HEALTH, worksheet_name='Health')
-            user_df = calculate_health_score(user_df)
-            all_users_df = calculate_health_score(all_users_df)
-
-            if user_df.empty:
-                flash(trans['Error retrieving data. Please try again.'], 'error')
-                return redirect(url_for('health_score_step1'))
-
-            user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', errors='coerce')
-            user_df = user_df.sort_values('Timestamp', ascending=False)
-            user_row = user_df.iloc[0]
-
-            badges = assign_badges_health(user_df, all_users_df)
-            all_scores = all_users_df['HealthScore'].astype(float).sort_values(ascending=False)
-            rank = (all_scores >= user_row['HealthScore']).sum()
-            total_users = len(all_scores)
-
-            user_row_dict = {
-                key: float(val) if isinstance(val, (np.float64, np.int64)) else
-                     int(val) if isinstance(val, np.int64) else
-                     val.strftime('%Y-%m-%d %H:%M:%S') if isinstance(val, pd.Timestamp) else
-                     val
-                for key, val in user_row.to_dict().items()
-            }
+            # The submitted row is the user's latest, so it is scored directly
+            result = score_health_values(income_revenue, expenses_costs, debt_loan, debt_interest_rate, COURSE_URLS)
+            user_row = dict(zip(PREDETERMINED_HEADERS_HEALTH, data))
+            user_row.update(result.as_columns())
+            ranks = get_score_ranks('Health')
+            rank = ranks.count_at_or_above(result.health_score)
+            total_users = len(ranks)
 
-            # Store minimal data in session, avoid large objects like plots
+            # Only identifiers and inputs go in the session; the dashboard rescores them
             session['dashboard_data'] = {
                 'first_name': health_data['first_name'],
                 'email': health_data['email'],
-                'language': health_data['language'],
-                'health_score': float(user_row['HealthScore']),
-                'score_description': user_row['ScoreDescription'],
-                'course_title': user_row['CourseTitle'],
-                'course_url': user_row['CourseURL'],
-                'rank': int(rank),
-                'total_users': int(total_users),
-                'badges': badges,
-                'user_data': user_row_dict
+                'income_revenue': income_revenue,
+                'expenses_costs': expenses_costs,
+                'debt_loan': debt_loan,
+                'debt_interest_rate': debt_interest_rate
             }
 
             if health_data.get('auto_email'):
-                threading.Thread(
-                    target=send_health_email_async,
-                    args=(
-                        health_data['email'],
-                        health_data['first_name'],
-                        float(user_row['HealthScore']),
-                        user_row['ScoreDescription'],
-                        rank,
-                        total_users,
-                        user_row['CourseTitle'],
-                        user_row['CourseURL'],
-                        language
-                    )
-                ).start()
+                queue_email(
+                    'health',
+                    to_email=health_data['email'],
+                    user_name=health_data['first_name'],
+                    health_score=float(user_row['HealthScore']),
+                    score_description=user_row['ScoreDescription'],
+                    rank=rank,
+                    total_users=total_users,
+                    course_title=user_row['CourseTitle'],
+                    course_url=user_row['CourseURL'],
+                    language=language
+                )
                 flash(trans['Check Inbox'], 'success')
 
             flash(trans['Submission Success'], 'success')
@@ -1349,6 +1425,7 @@ def health_score_step3():
 
 @app.route('/health_dashboard', methods=['GET'])
 def health_dashboard():
+    import pandas as pd
     step = request.args.get('step', default=1, type=int)
     if step not in range(1, 7):
         flash(get_translations(session.get('language', 'en'))['Invalid Step'], 'error')
@@ -1365,40 +1442,46 @@ def health_dashboard():
     email = dashboard_data['email']
     try:
         user_df = fetch_data_from_sheet(email=email, headers=PREDETERMINED_HEADERS_HEALTH, worksheet_name='Health')
-        all_users_df = fetch_data_from_sheet(headers=PREDETERMINED_HEADERS_HEALTH, worksheet_name='Health')
 
         if user_df.empty:
             flash(trans['Error retrieving data. Please try again.'], 'error')
             return redirect(url_for('health_score_step1'))
 
         user_df = calculate_health_score(user_df)
-        all_users_df = calculate_health_score(all_users_df)
         user_df['Timestamp'] = pd.to_datetime(user_df['Timestamp'], format='mixed', errors='coerce')
         user_df = user_df.sort_values('Timestamp', ascending=False)
         user_row = user_df.iloc[0]
 
-        badges = assign_badges_health(user_df, all_users_df)
-        all_scores = all_users_df['HealthScore'].astype(float).sort_values(ascending=False)
-        rank = (all_scores >= user_row['HealthScore']).sum()
-        total_users = len(all_scores)
-
-        # Generate plots on demand instead of storing in session
-        breakdown_plot = generate_breakdown_plot(user_df)
-        comparison_plot = generate_comparison_plot(user_df, all_users_df)
+        # Sessions saved before inputs were stored directly kept them under 'user_data'
+        inputs = dashboard_data.get('user_data', dashboard_data)
+        result = score_health_values(
+            inputs['income_revenue'], inputs['expenses_costs'], inputs['debt_loan'], inputs['debt_interest_rate'], COURSE_URLS
+        )
+        badges = assign_badges_health(user_df)
+        ranks = get_score_ranks('Health')
+        rank = ranks.count_at_or_above(float(user_row['HealthScore']))
+        total_users = len(ranks)
+        peers = get_peer_aggregates()
+
+        # Only steps 2 and 5 show a chart; repeat views come from chart_cache
+        breakdown_plot = generate_breakdown_plot(user_row, language) if step == 2 else None
+        comparison_plot = None
+        if step == 5 and peers and peers['count']:
+            comparison_plot = generate_comparison_plot(user_row, peers['mean'], language)
 
         template_data = {
             'trans': trans,
-            'user_data': dashboard_data['user_data'],
+            'user_data': inputs,
             'badges': badges,
             'rank': rank,
             'total_users': total_users,
-            'health_score': dashboard_data['health_score'],
+            'health_score': result.health_score,
             'first_name': sanitize_input(dashboard_data.get('first_name', 'User')),
             'email': sanitize_input(email),
             'breakdown_plot': breakdown_plot,
             'comparison_plot': comparison_plot,
-            'course_title': dashboard_data['course_title'],
-            'course_url': dashboard_data['course_url'],
+            'course_title': result.course_title,
+            'course_url': result.course_url,
             'step': step,
             'FEEDBACK_FORM_URL': FEEDBACK_FORM_URL,
             'WAITLIST_FORM_URL': WAITLIST_FORM_URL,
@@ -1572,6 +1655,7 @@ def quiz_step2():
 
 @app.route('/quiz_step3', methods=['GET', 'POST'])
 def quiz_step3():
+    import pandas as pd
     if not QUIZ_QUESTIONS:
         flash(get_translations(session.get('language', 'en'))['Quiz configuration error. Please try again later.'], 'error')
         return redirect(url_for('index'))
@@ -1654,23 +1738,19 @@ def quiz_step3():
                         flash(trans['Google Sheets Error'], 'error')
                         return redirect(url_for('quiz_step3'))
 
+                    # quiz_results rebuilds the personality text and question labels from the answers
                     results = {
                         'first_name': session['quiz_data'].get('first_name', ''),
-                        'personality': personality,
-                        'personality_desc': personality_desc,
-                        'tip': tip,
                         'badges': badges,
-                        'answers': {trans.get(q['text'], q['text']): a for q, a in answers},
-                        'summary_chart': generate_quiz_summary_chart(answers, language)
+                        'answers': {k: v for k, v in session['quiz_data'].items() if k.startswith('question_')}
                     }
                     session['quiz_results'] = results
                     session.modified = True
 
                     if session['quiz_data'].get('auto_email') and session['quiz_data'].get('email'):
-                        threading.Thread(
-                            target=send_quiz_email_async,
-                            args=(session['quiz_data']['email'], session['quiz_data']['first_name'], personality, personality_desc, tip, language)
-                        ).start()
+                        queue_email('quiz', to_email=session['quiz_data']['email'],
+                                    user_name=session['quiz_data']['first_name'], personality=personality,
+                                    personality_desc=personality_desc, tip=tip, language=language)
                         flash(trans['Check Inbox'], 'success')
 
                     flash(trans['Submission Success'], 'success')
@@ -1724,6 +1804,17 @@ def quiz_results():
     session.pop('quiz_results', None)
     session.modified = True
 
+    if 'personality' not in results:
+        answers = [(QUIZ_QUESTIONS[int(k.split('_')[1]) - 1], v) for k, v in results['answers'].items()]
+        personality, personality_desc, tip = assign_personality(answers, language)
+        results = dict(
+            results,
+            personality=personality,
+            personality_desc=personality_desc,
+            tip=tip,
+            answers={trans.get(q['text'], q['text']): a for q, a in answers}
+        )
+
     return render_template(
         'quiz_results.html',
         results=results,
@@ -1747,13 +1838,11 @@ def logout():
     session.clear()
     session.modified = True
     if email:
-        backup_file = os.path.join(SESSION_BACKUP_DIR, f"{sanitize_filename(email)}.json")
-        if os.path.exists(backup_file):
-            try:
-                os.remove(backup_file)
+        try:
+            if session_backups.discard(email):
                 logger.info(f"Deleted session backup for {email}")
-            except Exception as e:
-                logger.error(f"Failed to delete session backup for {email}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to delete session backup for {email}: {e}")
     flash(trans['Logged Out Successfully'], 'success')
     return redirect(url_for('index'))
 
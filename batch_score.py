@@ -0,0 +1,134 @@
+# batch_score.py
+# Offline re-scoring of Health and Budget exports.
+#
+# Streams a CSV or NDJSON export through the vectorized scoring functions in
+# fixed-size chunks and appends each scored chunk to the output as soon as it
+# is ready, so memory stays bounded by the chunk size and the number of chunks
+# in flight. With --workers, chunks are scored in a process pool; output order
+# always matches input order.
+#
+#     python batch_score.py health health_export.csv health_scored.csv
+#     python batch_score.py budget budget.ndjson budget_scored.ndjson --chunk-size 20000 --workers 4
+#
+# Throughput (rows/sec) is reported on stderr.
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from scoring import COURSE_URLS, budget_metrics, score_health
+from translations import get_translations
+
+FORMATS = ('csv', 'ndjson')
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    if extension == '.csv':
+        return 'csv'
+    raise ValueError(f"Cannot tell the format of {path}; pass --input-format/--output-format")
+
+
+def read_chunks(path, file_format, chunk_size):
+    # Values stay text, as they are in the sheet, so scoring coerces them the same way.
+    if file_format == 'csv':
+        return pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_size)
+    return pd.read_json(path, lines=True, dtype=False, chunksize=chunk_size)
+
+
+def score_chunk(kind, chunk):
+    if kind == 'health':
+        return score_health(chunk, COURSE_URLS)
+    # budget_metrics localizes advice in the first row's language, so score
+    # each language separately and restore the input order.
+    if 'language' not in chunk:
+        chunk['language'] = 'en'
+    chunk['language'] = chunk['language'].fillna('').replace('', 'en')
+    scored = [budget_metrics(group.copy(), get_translations) for _, group in chunk.groupby('language', sort=False)]
+    return pd.concat(scored).loc[chunk.index]
+
+
+class ChunkWriter:
+    def __init__(self, path, file_format):
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.file_format = file_format
+        self.header = True
+
+    def write(self, chunk):
+        if self.file_format == 'csv':
+            chunk.to_csv(self.file, header=self.header, index=False)
+        else:
+            text = chunk.to_json(orient='records', lines=True, force_ascii=False)
+            self.file.write(text if text.endswith('\n') else text + '\n')
+        self.header = False
+
+    def close(self):
+        self.file.close()
+
+
+def run(kind, source, target, input_format=None, output_format=None, chunk_size=10000, workers=0, report=None):
+    """Score `source` into `target`; returns (rows, seconds)."""
+    input_format = input_format or detect_format(source)
+    output_format = output_format or detect_format(target)
+    writer = ChunkWriter(target, output_format)
+    rows = 0
+    start = time.perf_counter()
+
+    def emit(scored):
+        nonlocal rows
+        writer.write(scored)
+        rows += len(scored)
+        if report is not None:
+            elapsed = time.perf_counter() - start
+            report(f"{rows:,} rows scored, {rows / elapsed:,.0f} rows/s")
+
+    try:
+        chunks = read_chunks(source, input_format, chunk_size)
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(score_chunk, kind, chunk))
+                    # Bound the chunks held in memory; write in input order.
+                    if len(pending) >= workers * 2:
+                        emit(pending.popleft().result())
+                while pending:
+                    emit(pending.popleft().result())
+        else:
+            for chunk in chunks:
+                emit(score_chunk(kind, chunk))
+    finally:
+        writer.close()
+    return rows, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Re-score a Health or Budget export in chunks.')
+    parser.add_argument('kind', choices=('health', 'budget'))
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--input-format', choices=FORMATS)
+    parser.add_argument('--output-format', choices=FORMATS)
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=0, help='score chunks in this many processes')
+    parser.add_argument('--quiet', action='store_true', help='only print the final summary')
+    args = parser.parse_args(argv)
+
+    def report(message):
+        print(message, file=sys.stderr)
+
+    rows, seconds = run(args.kind, args.input, args.output, args.input_format, args.output_format,
+                        args.chunk_size, args.workers, report=None if args.quiet else report)
+    report(f"Scored {rows:,} rows in {seconds:.2f}s ({rows / seconds if seconds else 0:,.0f} rows/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""CPU time per dashboard's charts: plotly.express to_html vs compact specs.
+
+For each dashboard, builds the charts it used to embed with plotly.express
+and fig.to_html(), and the chart_specs equivalents serialized the way the
+template's |tojson does. Times are process CPU time, so they show what a sync
+worker spends per page view. The budget dashboard draws its chart with
+Chart.js from user_data and the quiz summary chart was never displayed, so
+neither builds a chart any more.
+
+Run from the repository root:
+
+    python benchmarks/bench_chart_render.py [--renders 200]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chart_specs import bar_spec
+
+LAYOUT = dict(margin=dict(l=20, r=20, t=30, b=20), height=300, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+ANSWERS = ['Yes', 'No', 'Sometimes', 'Yes', 'Yes', 'No', 'Sometimes', 'Yes', 'No', 'Yes']
+
+
+def legacy_health():
+    import plotly.express as px
+    breakdown = px.bar(x=['Cash Flow', 'Debt-to-Income', 'Debt Interest'], y=[25.1, 30.4, 12.9], title='Score Breakdown',
+                       labels={'x': 'Component', 'y': 'Score Contribution'})
+    breakdown.update_layout(**LAYOUT)
+    comparison = px.bar(x=['Your Score', 'Average Peer Score'], y=[68.4, 55.2], title='How Your Score Compares',
+                        labels={'x': 'Score Type', 'y': 'Score'})
+    comparison.update_layout(**LAYOUT)
+    return [fig.to_html(full_html=False, include_plotlyjs=False) for fig in (breakdown, comparison)]
+
+
+def spec_health():
+    return [json.dumps(bar_spec(['Cash Flow', 'Debt-to-Income', 'Debt Interest'], [25.1, 30.4, 12.9],
+                                'Score Breakdown', 'Component', 'Score Contribution')),
+            json.dumps(bar_spec(['Your Score', 'Average Peer Score'], [68.4, 55.2],
+                                'How Your Score Compares', 'Score Type', 'Score'))]
+
+
+def answer_counts():
+    counts = {}
+    for answer in ANSWERS:
+        counts[answer] = counts.get(answer, 0) + 1
+    return list(counts), list(counts.values())
+
+
+def legacy_quiz():
+    import plotly.express as px
+    labels, values = answer_counts()
+    fig = px.bar(x=labels, y=values, title='Quiz Summary', labels={'x': 'Answer', 'y': 'Count'})
+    fig.update_layout(margin=dict(l=20, r=20, t=30, b=20), height=400, paper_bgcolor='rgba(0,0,0,0)',
+                      plot_bgcolor='rgba(0,0,0,0)', yaxis=dict(range=[0, max(values) + 1]), font=dict(color='#666'),
+                      title_font=dict(color='#01579B', size=18), xaxis_title_font=dict(color='#666', size=14),
+                      yaxis_title_font=dict(color='#666', size=14), bargap=0.2)
+    fig.update_traces(marker_color='#0288D1', marker_line_color='#01579B', marker_line_width=1)
+    return [fig.to_html(full_html=False, include_plotlyjs=False)]
+
+
+def spec_quiz():
+    return []
+
+
+def legacy_budget():
+    import plotly.express as px
+    pie = px.pie(names=['Housing', 'Food', 'Transport', 'Other'], values=[300.0, 200.0, 100.0, 50.0], title='Budget Breakdown')
+    bar = px.bar(x=['Income', 'Expenses', 'Savings'], y=[1000.0, 650.0, 100.0], title='Income vs Expenses')
+    return [fig.to_html(full_html=False, include_plotlyjs=False) for fig in (pie, bar)]
+
+
+def spec_budget():
+    return []
+
+
+def cpu_ms(render, renders):
+    start = time.process_time()
+    for _ in range(renders):
+        output = render()
+    return (time.process_time() - start) * 1000 / renders, sum(len(chart) for chart in output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--renders', type=int, default=200)
+    args = parser.parse_args()
+    legacy_health()  # import plotly outside the timings
+
+    print(f"{'dashboard':<18} {'to_html ms':>11} {'bytes':>8} {'spec ms':>9} {'bytes':>7} {'speedup':>8}")
+    for name, legacy, spec in (('health_dashboard', legacy_health, spec_health),
+                               ('quiz_results', legacy_quiz, spec_quiz),
+                               ('budget_dashboard', legacy_budget, spec_budget)):
+        old_ms, old_bytes = cpu_ms(legacy, args.renders)
+        new_ms, new_bytes = cpu_ms(spec, args.renders)
+        speedup = f"{old_ms / new_ms:.0f}x" if new_bytes else "-"
+        print(f"{name:<18} {old_ms:>11.2f} {old_bytes:>8} {new_ms:>9.3f} {new_bytes:>7} {speedup:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Report emails rendered per second: full render_template vs cached shells.
+
+The baseline renders each email's whole template inside an app context, as
+the send functions used to. The shell path renders each (template, language)
+once and then fills in only the recipient's fields. Both use the templates in
+templates/; the baseline converts the [[ ]] / [% %] fields back to ordinary
+Jinja syntax so it renders exactly what the old templates did.
+
+Run from the repository root:
+
+    python benchmarks/bench_email_render.py [--emails 2000]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from flask import Flask, render_template
+
+from email_shells import EmailShells
+from translations import get_translations
+
+TEMPLATES = ('health_score_email.html', 'quiz_email.html', 'budget_email.html')
+LANGUAGES = ('en', 'ha')
+
+
+def format_currency(value, currency='NGN'):
+    formatted = f"{float(value):,.2f}"
+    return f"₦{formatted}" if currency == 'NGN' else f"{currency} {formatted}"
+
+
+def shared_context(language):
+    return {
+        'trans': get_translations(language), 'language': language, 'base_url': 'https://ficore.example',
+        'FEEDBACK_FORM_URL': 'https://forms.example/feedback', 'WAITLIST_FORM_URL': 'https://forms.example/waitlist',
+        'CONSULTANCY_FORM_URL': 'https://forms.example/consultancy', 'LINKEDIN_URL': 'https://linkedin.example',
+        'TWITTER_URL': 'https://x.example', 'RECOVERY_COURSE_URL': 'https://youtube.example/recovery'
+    }
+
+
+def fields(template_name, i):
+    if template_name == 'health_score_email.html':
+        return {'user_name': f'User {i}', 'health_score': 40 + i % 60, 'score_description': 'Moderate; save something monthly!',
+                'rank': i % 500 + 1, 'total_users': 500, 'course_title': 'Ficore Savings Mastery',
+                'course_url': 'https://youtube.example/savings'}
+    if template_name == 'quiz_email.html':
+        return {'user_name': f'User {i}', 'personality': 'Planner', 'personality_desc': 'You plan ahead.',
+                'tip': 'Automate your savings.'}
+    return {'user_name': f'User {i}', 'user_data': {
+        'monthly_income': 1000.0 + i, 'housing_expenses': 300.0, 'food_expenses': 200.0, 'transport_expenses': 100.0,
+        'other_expenses': 50.0, 'total_expenses': 650.0, 'savings': 100.0, 'surplus_deficit': 250.0 + i,
+        'badges': 'First Budget Completed!', 'advice': 'Great job! Save or invest your surplus to grow your wealth.'}}
+
+
+def legacy_templates(target):
+    for name in TEMPLATES:
+        with open(os.path.join(ROOT, 'templates', name), encoding='utf-8') as f:
+            source = f.read()
+        for shell, jinja in (('[[', '{{'), (']]', '}}'), ('[%', '{%'), ('%]', '%}')):
+            source = source.replace(shell, jinja)
+        with open(os.path.join(target, name), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--emails', type=int, default=2000)
+    args = parser.parse_args()
+    jobs = [(TEMPLATES[i % 3], LANGUAGES[i % 2], fields(TEMPLATES[i % 3], i)) for i in range(args.emails)]
+
+    workdir = tempfile.mkdtemp()
+    try:
+        legacy_templates(workdir)
+        legacy = Flask(__name__, template_folder=workdir)
+        legacy.jinja_env.filters['format_currency'] = format_currency
+        start = time.perf_counter()
+        for template_name, language, values in jobs:
+            with legacy.app_context():
+                render_template(template_name, **shared_context(language), **values)
+        baseline = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workdir)
+
+    app = Flask(__name__, template_folder=os.path.join(ROOT, 'templates'))
+    shells = EmailShells(app.jinja_env, shared_context, filters={'format_currency': format_currency})
+    start = time.perf_counter()
+    for template_name, language, values in jobs:
+        shells.render(template_name, language, **values)
+    cached = time.perf_counter() - start
+
+    print(f"{'mode':<24} {'emails':>8} {'seconds':>9} {'emails/sec':>11}")
+    print(f"{'render_template':<24} {args.emails:>8} {baseline:>9.3f} {args.emails / baseline:>11.0f}")
+    print(f"{'cached shells':<24} {args.emails:>8} {cached:>9.3f} {args.emails / cached:>11.0f}")
+    print(f"shells built: {shells.stats()['misses']}, speedup {baseline / cached:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
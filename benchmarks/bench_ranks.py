@@ -0,0 +1,61 @@
+"""Rank lookups: full pandas comparison vs sorted-array bisection.
+
+For each population size, times what the dashboards used to do per request
+(compare the user's score against every score) against ScoreRanks lookups,
+plus the one-off build and the per-submission insort.
+
+Run from the repository root:
+
+    python benchmarks/bench_ranks.py [--sizes 10000 100000 1000000] [--lookups 1000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rank_service import ScoreRanks
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls
+
+
+def run(size, lookups):
+    rng = np.random.default_rng(size)
+    scores = pd.Series(rng.uniform(0, 100, size).round(2))
+    probes = rng.uniform(0, 100, lookups).round(2)
+    scan_calls = max(1, min(lookups, 20_000_000 // size))
+
+    scan = per_call(lambda i: int((scores.astype(float) >= probes[i]).sum()), scan_calls)
+    start = time.perf_counter()
+    ranks = ScoreRanks(scores)
+    build = time.perf_counter() - start
+    lookup = per_call(lambda i: ranks.count_at_or_above(probes[i]), lookups)
+    percentile = per_call(lambda i: ranks.percentile(probes[i]), lookups)
+    insert = per_call(lambda i: ranks.add(probes[i]), lookups)
+    return scan, build, lookup, percentile, insert
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--lookups', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'users':>10} {'full scan':>12} {'build':>10} {'rank':>10} {'percentile':>11} {'insort':>10} {'speedup':>9}")
+    for size in args.sizes:
+        scan, build, lookup, percentile, insert = run(size, args.lookups)
+        print(f"{size:>10,} {scan * 1e3:>10.3f}ms {build * 1e3:>8.1f}ms {lookup * 1e6:>8.2f}us "
+              f"{percentile * 1e6:>9.2f}us {insert * 1e6:>8.2f}us {scan / lookup:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
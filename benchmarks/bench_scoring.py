@@ -0,0 +1,57 @@
+"""Health score and budget metrics: row-wise apply vs vectorized scoring.
+
+Scores the same synthetic frame (sheet-style text values) with the row-wise
+reference implementation and with scoring.py, and checks the outputs match.
+
+Run from the repository root:
+
+    python benchmarks/bench_scoring.py [--rows 100000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring import budget_metrics, score_health
+from tests.legacy_scoring import legacy_budget_metrics, legacy_health_score
+from tests.test_scoring import COURSE_URLS, budget_frame, health_frame
+from translations import get_translations
+
+
+def best_of(repeat, make_frame, score):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        df = make_frame()
+        start = time.perf_counter()
+        result = score(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cases = [
+        ('health', lambda: health_frame(args.rows),
+         lambda df: legacy_health_score(df, COURSE_URLS), lambda df: score_health(df, COURSE_URLS)),
+        ('budget', lambda: budget_frame(args.rows),
+         lambda df: legacy_budget_metrics(df, get_translations), lambda df: budget_metrics(df, get_translations)),
+    ]
+    print(f"{args.rows:,} rows, best of {args.repeat}")
+    for name, make_frame, legacy, vectorized in cases:
+        legacy_time, expected = best_of(args.repeat, make_frame, legacy)
+        fast_time, actual = best_of(args.repeat, make_frame, vectorized)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        print(f"{name:>8}: row-wise {legacy_time * 1e3:9.1f}ms  vectorized {fast_time * 1e3:8.1f}ms  "
+              f"{legacy_time / fast_time:6.1f}x  ({args.rows / fast_time:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Session cookie size and encode/decode time: legacy hex format vs v2 codec.
+
+Encodes sessions shaped like the ones each flow leaves behind (health
+dashboard, budget submission, quiz results) with the original
+JSON -> zlib -> hex -> URLSafeTimedSerializer chain and with SessionCodec.
+Decode times are shown cold (cache disabled, as for a cookie this worker
+has not seen) and warm (the same cookie sent again).
+
+Run from the repository root:
+
+    python benchmarks/bench_session_cookie.py [--repeat 5000]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from itsdangerous import URLSafeTimedSerializer
+
+from session_codec import SessionCodec
+
+SECRET_KEY = 'benchmark-secret'
+SESSIONS = {
+    'health dashboard': {
+        'health_data': {'first_name': 'Ada', 'email': 'ada.obi@gmail.com', 'language': 'en', 'auto_email': True,
+                        'business_name': 'Obi Foods', 'user_type': 'SME', 'income_revenue': 250000.0,
+                        'expenses_costs': 180000.0, 'debt_loan': 50000.0, 'debt_interest_rate': 12.5},
+        'language': 'en',
+        'dashboard_data': {'first_name': 'Ada', 'email': 'ada.obi@gmail.com', 'income_revenue': 250000.0,
+                           'expenses_costs': 180000.0, 'debt_loan': 50000.0, 'debt_interest_rate': 12.5},
+        '_flashes': [['success', 'Check your Inbox, Junk, or Spam folder for your report!'],
+                     ['success', 'Data submitted successfully!']]
+    },
+    'budget submission': {
+        'budget_data': {'first_name': 'Musa', 'email': 'musa@yahoo.com', 'language': 'ha', 'monthly_income': 120000.0,
+                        'housing_expenses': 40000.0, 'food_expenses': 30000.0, 'transport_expenses': 15000.0,
+                        'other_expenses': 10000.0, 'savings_goal': 20000.0, 'auto_email': False},
+        'language': 'ha'
+    },
+    'quiz results': {
+        'quiz_data': dict({f'question_{i}': 'Yes' if i % 3 else 'No' for i in range(1, 11)},
+                          first_name='Zainab', email='zainab@gmail.com', language='en', auto_email=True),
+        'language': 'en',
+        'csrf_token': 'b4d30666fc760189a09d2786ff67f4891c6b5544',
+        'quiz_results': {'first_name': 'Zainab', 'badges': ['First Quiz Completed!', 'Master Planner!'],
+                         'answers': {f'question_{i}': 'Yes' if i % 3 else 'No' for i in range(1, 11)}},
+        '_flashes': [['success', 'Data submitted successfully!']]
+    }
+}
+
+
+def legacy_dumps(session_dict):
+    serializer = URLSafeTimedSerializer(SECRET_KEY)
+    return serializer.dumps(zlib.compress(json.dumps(session_dict).encode('utf-8')).hex())
+
+
+def legacy_loads(cookie):
+    serializer = URLSafeTimedSerializer(SECRET_KEY)
+    return json.loads(zlib.decompress(bytes.fromhex(serializer.loads(cookie))).decode('utf-8'))
+
+
+def per_call_us(func, arg, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(arg)
+    return (time.perf_counter() - start) * 1e6 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5000)
+    args = parser.parse_args()
+    codec = SessionCodec(SECRET_KEY)
+    uncached = SessionCodec(SECRET_KEY, cache_size=0)
+
+    print(f"{'session':<18} {'format':<7} {'bytes':>6} {'encode us':>10} {'decode us':>10} {'warm us':>8}")
+    for name, session_dict in SESSIONS.items():
+        legacy = legacy_dumps(session_dict)
+        compact = codec.dumps(session_dict)
+        assert legacy_loads(legacy) == session_dict == SessionCodec(SECRET_KEY).loads(compact)
+        print(f"{name:<18} {'legacy':<7} {len(legacy):>6} {per_call_us(legacy_dumps, session_dict, args.repeat):>10.1f} "
+              f"{per_call_us(legacy_loads, legacy, args.repeat):>10.1f} {'-':>8}")
+        print(f"{'':<18} {'v2':<7} {len(compact):>6} {per_call_us(codec.dumps, session_dict, args.repeat):>10.1f} "
+              f"{per_call_us(uncached.loads, compact, args.repeat):>10.1f} {per_call_us(codec.loads, compact, args.repeat):>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
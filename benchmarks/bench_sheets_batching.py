@@ -0,0 +1,77 @@
+"""Sheets API calls per 1,000 submissions, per-row vs coalesced appends.
+
+Submissions are written to a SheetsJournal at a steady arrival rate while a
+JournalFlusher drains it into a local fake Sheets server
+(tests/fake_sheets.py). The delivery callback mirrors app._deliver_rows:
+look up the worksheet, then append the batch.
+
+Run from the repository root:
+
+    python benchmarks/bench_sheets_batching.py [--submissions 1000] [--rate 250]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sheets_journal import JournalFlusher, SheetsJournal
+from tests.fake_sheets import FakeSheetsServer
+
+WORKSHEETS = ('Budget', 'Health', 'Quiz')
+
+
+def run(submissions, rate, batch_size, max_linger):
+    workdir = tempfile.mkdtemp()
+    try:
+        with FakeSheetsServer() as server:
+            spreadsheet = server.connect()
+            server.reset_calls()
+
+            def deliver(worksheet_name, rows):
+                spreadsheet.worksheet(worksheet_name).append_rows(rows, value_input_option='RAW')
+
+            journal = SheetsJournal(os.path.join(workdir, 'journal.db'))
+            flusher = JournalFlusher(journal, deliver, batch_size=batch_size, max_linger=max_linger, interval=0.05)
+            flusher.start()
+            start = time.perf_counter()
+            for i in range(submissions):
+                journal.enqueue(WORKSHEETS[i % len(WORKSHEETS)], [f'2025-01-01 00:00:{i % 60:02d}', f'user{i}@example.com', i])
+                flusher.notify()
+                time.sleep(1.0 / rate)
+            while journal.stats()['backlog']:
+                time.sleep(0.05)
+            elapsed = time.perf_counter() - start
+            flusher.stop(timeout=5)
+            delivered = sum(len(server.rows(name)) for name in WORKSHEETS)
+            return dict(server.state.calls), delivered, elapsed
+    finally:
+        shutil.rmtree(workdir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--submissions', type=int, default=1000)
+    parser.add_argument('--rate', type=float, default=250.0, help='submissions per second')
+    args = parser.parse_args()
+    scenarios = [
+        ('per-row (batch 1)', 1, 0.0),
+        ('batch 50, linger 0.5s', 50, 0.5),
+        ('batch 50, linger 2s', 50, 2.0),
+        ('batch 200, linger 2s', 200, 2.0),
+    ]
+    print(f"{args.submissions} submissions at {args.rate:.0f}/s across {', '.join(WORKSHEETS)}")
+    for name, batch_size, max_linger in scenarios:
+        calls, delivered, elapsed = run(args.submissions, args.rate, batch_size, max_linger)
+        appends = calls.get('values_append', 0)
+        total = sum(calls.values())
+        per_thousand = total * 1000 / args.submissions
+        print(f"  {name:<22} appends={appends:<5} total API calls={total:<5} "
+              f"({per_thousand:,.0f} per 1,000)  rows delivered={delivered}  drained in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
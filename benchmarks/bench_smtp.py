@@ -0,0 +1,59 @@
+"""SMTP throughput: a new session per message vs a persistent session.
+
+Sends the same messages through mail.send() (connect, send one, quit) and
+through PersistentMailer against a local SMTP stand-in (tests/fake_smtp.py).
+--connect-latency delays each session's greeting to stand in for the TCP,
+TLS and AUTH round trips of a real provider.
+
+Run from the repository root:
+
+    python benchmarks/bench_smtp.py [--messages 500] [--connect-latency 0.05] [--recycle 100]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask_mail import Mail, Message
+
+from mail_delivery import PersistentMailer
+from tests.fake_smtp import FakeSMTPServer
+
+
+def run(messages, connect_latency, recycle, persistent):
+    with FakeSMTPServer(connect_latency=connect_latency) as server:
+        app = Flask(__name__)
+        app.config.update(MAIL_SERVER='127.0.0.1', MAIL_PORT=server.port, MAIL_USE_TLS=False,
+                          MAIL_USE_SSL=False, MAIL_DEFAULT_SENDER='reports@example.com')
+        mail = Mail(app)
+        mailer = PersistentMailer(mail, max_messages=recycle)
+        send = mailer.send if persistent else mail.send
+        with app.app_context():
+            start = time.perf_counter()
+            for i in range(messages):
+                send(Message(subject=f'Report {i}', recipients=[f'user{i}@example.com'],
+                             html=f'<p>Score {i}</p>'))
+            mailer.close()
+            seconds = time.perf_counter() - start
+        assert len(server.messages) == messages
+        return seconds, server.connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=500)
+    parser.add_argument('--connect-latency', type=float, default=0.05)
+    parser.add_argument('--recycle', type=int, default=100, help='messages per persistent session')
+    args = parser.parse_args()
+
+    print(f"{'mode':<22} {'messages':>9} {'sessions':>9} {'seconds':>9} {'msgs/sec':>10}")
+    for label, persistent in (('session per message', False), ('persistent session', True)):
+        seconds, connections = run(args.messages, args.connect_latency, args.recycle, persistent)
+        print(f"{label:<22} {args.messages:>9} {connections:>9} {seconds:>9.2f} {args.messages / seconds:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
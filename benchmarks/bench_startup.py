@@ -0,0 +1,133 @@
+"""Worker boot cost: time to import app and RSS afterwards.
+
+Each run imports app in a fresh interpreter, the way a gunicorn worker does,
+and reports the import time, RSS and which heavy libraries were loaded at
+that point, then the time and RSS once the background Sheets connection is
+ready. The Sheets client is patched to an in-memory stand-in inside
+the child so no network or credentials are needed. --eager imports pandas,
+numpy, plotly and gspread before app to show what boot cost without lazy
+imports.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py [--runs 5] [--eager]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ['pandas', 'numpy', 'plotly', 'gspread', 'google.oauth2']
+
+CHILD = r'''
+import importlib.abc, importlib.util, json, os, sys, time
+
+class _Worksheet:
+    def __init__(self, title):
+        self.title = title
+    def update(self, *args, **kwargs):
+        pass
+
+class _Spreadsheet:
+    def worksheets(self):
+        return [_Worksheet(title) for title in ('Budget', 'Health', 'Quiz')]
+    def values_batch_get(self, ranges, params=None):
+        return {'valueRanges': []}
+
+class _Client:
+    def open_by_key(self, key):
+        return _Spreadsheet()
+
+def _patch_gspread(module):
+    module.authorize = lambda *args, **kwargs: _Client()
+
+def _patch_credentials(module):
+    module.Credentials.from_service_account_info = classmethod(lambda cls, info, scopes=None: None)
+
+PATCHES = {'gspread': _patch_gspread, 'google.oauth2.service_account': _patch_credentials}
+
+class _PatchOnImport(importlib.abc.MetaPathFinder):
+    """Swap out network entry points right after their modules load, without importing them early."""
+    def find_spec(self, name, path, target=None):
+        if name not in PATCHES:
+            return None
+        sys.meta_path.remove(self)
+        try:
+            spec = importlib.util.find_spec(name)
+        finally:
+            sys.meta_path.insert(0, self)
+        exec_module = spec.loader.exec_module
+        def exec_and_patch(module):
+            exec_module(module)
+            PATCHES[name](module)
+        spec.loader.exec_module = exec_and_patch
+        return spec
+
+sys.meta_path.insert(0, _PatchOnImport())
+sys.path.insert(0, os.environ['BENCH_ROOT'])
+
+def rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+start = time.perf_counter()
+for name in os.environ.get('BENCH_EAGER', '').split():
+    __import__(name)
+import app
+seconds = time.perf_counter() - start
+rss = rss_mb()
+loaded = [name for name in json.loads(os.environ['BENCH_HEAVY']) if name in sys.modules]
+app.sheets_ready.wait(30)
+print(json.dumps({
+    'seconds': seconds,
+    'rss_mb': rss,
+    'loaded': loaded,
+    'ready_seconds': time.perf_counter() - start,
+    'ready_rss_mb': rss_mb(),
+}))
+'''
+
+
+def boot(workdir, eager):
+    env = dict(os.environ)
+    env.update({
+        'FLASK_SECRET_KEY': 'bench', 'SMTP_SERVER': 'localhost', 'SMTP_PORT': '25', 'SMTP_USER': 'bench',
+        'SMTP_PASSWORD': 'bench', 'SPREADSHEET_ID': 'bench', 'GOOGLE_CREDENTIALS_JSON': '{}',
+        'SHEETS_JOURNAL_PATH': os.path.join(workdir, 'journal.db'),
+        'SHEETS_REPLICA_PATH': os.path.join(workdir, 'replica.db'),
+        'BENCH_ROOT': ROOT, 'BENCH_HEAVY': json.dumps(HEAVY),
+        'BENCH_EAGER': 'pandas numpy plotly.express gspread' if eager else '',
+    })
+    # app logs to ./app.log; keep that out of the repository
+    result = subprocess.run([sys.executable, '-c', CHILD], cwd=workdir, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--eager', action='store_true', help='import the heavy libraries up front, as before')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        results = [boot(workdir, args.eager) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(f"import app ({'eager' if args.eager else 'lazy'}), median of {args.runs} runs")
+    print(f"  import          {statistics.median(r['seconds'] for r in results) * 1e3:8.0f} ms")
+    print(f"  rss             {statistics.median(r['rss_mb'] for r in results):8.1f} MB")
+    print(f"  loaded          {', '.join(results[-1]['loaded']) or '(none of ' + ', '.join(HEAVY) + ')'}")
+    print(f"  sheets ready    {statistics.median(r['ready_seconds'] for r in results) * 1e3:8.0f} ms")
+    print(f"  rss when ready  {statistics.median(r['ready_rss_mb'] for r in results):8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Microbenchmark for translations.get_translations.
+
+Compares rebuilding the nested {language: {key: text}} dict on every call
+(the behaviour before the catalog was cached) with the compiled,
+memory-mapped catalog, reporting lookups per second and bytes allocated
+per simulated request, plus the cost of the first lookup of a language.
+
+Run from the repository root:
+
+    python benchmarks/bench_translations.py
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import translation_catalog
+import translations
+
+# A budget dashboard request resolves the catalog about this many times
+# (form __init__, route body, advice text, badges, error handlers).
+CALLS_PER_REQUEST = 6
+KEYS = ['Home', 'Session Expired', 'Budget Breakdown', 'Check Inbox', 'Submission Success']
+
+
+def _read_sources():
+    source = {}
+    for language in translation_catalog.available_languages():
+        with open(translation_catalog.source_path(language), encoding='utf-8') as f:
+            source[language] = json.load(f)
+    return source
+
+
+SOURCE = _read_sources()
+
+
+def rebuild_each_call(language):
+    source = {lang: dict(strings) for lang, strings in SOURCE.items()}
+    return source.get(language, source['en'])
+
+
+def simulate_request(lookup, language):
+    for _ in range(CALLS_PER_REQUEST):
+        trans = lookup(language)
+        for key in KEYS:
+            trans.get(key, key)
+
+
+def lookups_per_second(lookup, language, seconds=1.0):
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            lookup(language)
+        count += 100
+    return count / seconds
+
+
+def bytes_per_request(lookup, language, requests=20):
+    """Average peak transient allocation of one simulated request."""
+    simulate_request(lookup, language)  # warm up
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(requests):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            simulate_request(lookup, language)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / requests
+
+
+def first_use_seconds(language):
+    """Time compiling (cold) and mapping (warm) one language from scratch."""
+    workdir = tempfile.mkdtemp()
+    try:
+        for lang in translation_catalog.available_languages():
+            shutil.copy(translation_catalog.source_path(lang), workdir)
+        start = time.perf_counter()
+        translation_catalog.load_catalog(language, workdir)
+        cold = time.perf_counter() - start
+        translation_catalog._loaded.clear()
+        start = time.perf_counter()
+        translation_catalog.load_catalog(language, workdir)
+        warm = time.perf_counter() - start
+        translation_catalog._loaded.clear()
+        return cold, warm
+    finally:
+        shutil.rmtree(workdir)
+
+
+def main():
+    for language in ('en', 'ha'):
+        print(f"language={language}")
+        for name, lookup in (('before (rebuild)', rebuild_each_call), ('after (catalog)', translations.get_translations)):
+            rate = lookups_per_second(lookup, language)
+            allocated = bytes_per_request(lookup, language)
+            print(f"  {name:<18} {rate:>14,.0f} lookups/sec  {allocated:>12,.0f} bytes/request")
+        cold, warm = first_use_seconds(language)
+        print(f"  first use: compile+map {cold * 1000:.2f} ms, map only {warm * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# chart_specs.py
+# Compact plotly.js chart specs built on the server, drawn in the browser.
+#
+# The dashboards used to build a plotly.express figure per chart and call
+# fig.to_html(), which validates every property against plotly's schema and
+# serializes the full default template, costing tens of milliseconds of CPU
+# for a bar chart with three points. The pages already load plotly.js, so the
+# server only needs to send the traces and a small layout: these helpers
+# return plain dicts that templates embed as JSON and hand to Plotly.newPlot.
+#
+# Many users see identical charts (the comparison chart depends only on two
+# scores), so ChartCache keeps the serialized specs in a bounded LRU keyed by
+# the caller's quantized inputs.
+
+import math
+import threading
+from collections import OrderedDict
+
+from jinja2.utils import htmlsafe_json_dumps
+
+_LAYOUT = {
+    'margin': {'l': 20, 'r': 20, 't': 30, 'b': 20},
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'plot_bgcolor': 'rgba(0,0,0,0)'
+}
+_COLOR = '#636efa'
+
+
+def _number(value):
+    value = float(value)
+    return round(value, 4) if math.isfinite(value) else None
+
+
+def _axis(title):
+    return {'title': {'text': title}, 'automargin': True}
+
+
+def bar_spec(labels, values, title, x_title, y_title, height=300):
+    """A vertical bar chart in the dashboards' default style."""
+    return {
+        'data': [{
+            'type': 'bar',
+            'x': [str(label) for label in labels],
+            'y': [_number(value) for value in values],
+            'marker': {'color': _COLOR}
+        }],
+        'layout': dict(_LAYOUT, title={'text': title}, height=height, xaxis=_axis(x_title), yaxis=_axis(y_title))
+    }
+
+
+class ChartCache:
+    """LRU of chart fragments: specs serialized as HTML-safe JSON.
+
+    Entries are evicted oldest-first once there are more than `max_entries`
+    or their combined length exceeds `max_bytes`. Keys must capture every
+    input the chart depends on, already rounded so near-identical inputs
+    share an entry.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=1 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """The fragment for `key`, calling `build()` for its spec on a miss.
+
+        A spec of None (no chart) is returned as None and not cached.
+        """
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fragment
+            self.misses += 1
+        spec = build()
+        if spec is None:
+            return None
+        fragment = htmlsafe_json_dumps(spec)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = fragment
+            self._bytes += len(fragment)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+        return fragment
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,281 @@
+# email_outbox.py
+# Durable outbox and bounded worker pool for report emails.
+#
+# Request handlers used to start a thread per email, with no limit on how many
+# could run at once, no retry, and nothing left behind if the worker process
+# was recycled before the thread finished. Emails are now recorded in a local
+# SQLite outbox and sent by a fixed number of worker threads per process, which
+# retry failures with exponential backoff. Messages are claimed with a lease so
+# several gunicorn workers can share one outbox file; delivery is at-least-once.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_SENT = 'sent'
+STATUS_FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    sent_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_status_due ON outbox (status, next_attempt_at);
+"""
+
+
+def _json_default(value):
+    # numpy scalars (e.g. values taken from a DataFrame row) expose item()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class EmailOutbox:
+    """SQLite-backed queue of emails waiting to be sent.
+
+    Each entry is a `kind` naming the email and a JSON payload of its
+    arguments. An email that still fails after `max_attempts` is marked
+    failed and kept for inspection instead of being retried forever.
+    """
+
+    def __init__(self, path, lease_seconds=120, max_backoff=900, max_attempts=8):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=FULL')
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, kind, payload):
+        now = time.time()
+        cursor = self._connect().execute(
+            'INSERT INTO outbox (kind, payload, created_at, next_attempt_at) VALUES (?, ?, ?, ?)',
+            (kind, json.dumps(payload, default=_json_default), now, now)
+        )
+        return cursor.lastrowid
+
+    def claim(self, limit=1):
+        """Lease up to `limit` due emails, oldest first, as (id, kind, payload, created_at) tuples."""
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = conn.execute(
+                'SELECT id, kind, payload, created_at FROM outbox '
+                'WHERE status = ? AND next_attempt_at <= ? AND claimed_until <= ? ORDER BY id LIMIT ?',
+                (STATUS_PENDING, now, now, limit)
+            ).fetchall()
+            conn.executemany(
+                'UPDATE outbox SET claimed_until = ? WHERE id = ?',
+                [(now + self.lease_seconds, row[0]) for row in rows]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return [(email_id, kind, json.loads(payload), created_at) for email_id, kind, payload, created_at in rows]
+
+    def mark_sent(self, email_id):
+        self._connect().execute(
+            'UPDATE outbox SET status = ?, sent_at = ?, claimed_until = 0, last_error = NULL WHERE id = ?',
+            (STATUS_SENT, time.time(), email_id)
+        )
+
+    def mark_failed(self, email_id, error):
+        """Schedule a retry with exponential backoff; returns False once the email has given up."""
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            attempts = conn.execute('SELECT attempts FROM outbox WHERE id = ?', (email_id,)).fetchone()
+            attempts = (attempts[0] if attempts else 0) + 1
+            retry = attempts < self.max_attempts
+            conn.execute(
+                'UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, claimed_until = 0, last_error = ? '
+                'WHERE id = ?',
+                (STATUS_PENDING if retry else STATUS_FAILED, attempts,
+                 now + min(self.max_backoff, 2 ** attempts), str(error)[:500], email_id)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return retry
+
+    def purge_sent(self, older_than_seconds=86400):
+        cursor = self._connect().execute(
+            'DELETE FROM outbox WHERE status = ? AND sent_at < ?',
+            (STATUS_SENT, time.time() - older_than_seconds)
+        )
+        return cursor.rowcount
+
+    def stats(self):
+        conn = self._connect()
+        now = time.time()
+        counts = {STATUS_PENDING: 0, STATUS_SENT: 0, STATUS_FAILED: 0}
+        counts.update(conn.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status').fetchall())
+        retrying, oldest = conn.execute(
+            'SELECT COALESCE(SUM(attempts > 0), 0), MIN(created_at) FROM outbox WHERE status = ?',
+            (STATUS_PENDING,)
+        ).fetchone()
+        last_error = conn.execute(
+            'SELECT last_error FROM outbox WHERE last_error IS NOT NULL ORDER BY id DESC LIMIT 1'
+        ).fetchone()
+        return {
+            'queue_depth': counts[STATUS_PENDING],
+            'retrying': retrying,
+            'sent': counts[STATUS_SENT],
+            'failed': counts[STATUS_FAILED],
+            'oldest_pending_age': round(now - oldest, 3) if oldest else 0.0,
+            'last_error': last_error[0] if last_error else None
+        }
+
+
+class EmailWorkerPool:
+    """Fixed number of threads sending emails from an EmailOutbox.
+
+    `send(kind, payload)` sends one email and raises on failure; `on_idle()`,
+    if given, is called on a worker thread whenever it finds nothing to send,
+    e.g. to close an idle SMTP connection. Send latency
+    (time spent in `send`) and delivery latency (enqueue to sent) are kept for
+    the most recent `window` emails.
+    """
+
+    def __init__(self, outbox, send, workers=2, interval=1.0, purge_after=86400, window=500, on_idle=None):
+        self.outbox = outbox
+        self.send = send
+        self.on_idle = on_idle
+        self.workers = workers
+        self.interval = interval
+        self.purge_after = purge_after
+        self._wake = threading.Condition()
+        self._signals = 0
+        self._stopping = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._send_seconds = deque(maxlen=window)
+        self._delivery_seconds = deque(maxlen=window)
+        self._last_purge = 0.0
+        self.sent = 0
+        self.errors = 0
+        self.busy = 0
+
+    def start(self):
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f'email-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def notify(self):
+        """Wake one idle worker, e.g. right after an email is enqueued."""
+        with self._wake:
+            self._signals += 1
+            self._wake.notify()
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        with self._wake:
+            self._wake.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def send_once(self):
+        """Claim and send one due email; returns False when none is due."""
+        claimed = self.outbox.claim()
+        if not claimed:
+            return False
+        email_id, kind, payload, created_at = claimed[0]
+        with self._lock:
+            self.busy += 1
+        start = time.time()
+        try:
+            self.send(kind, payload)
+        except Exception as e:
+            retry = self.outbox.mark_failed(email_id, e)
+            with self._lock:
+                self.errors += 1
+            if retry:
+                logger.error(f"Failed to send {kind} email {email_id}, will retry: {e}")
+            else:
+                logger.critical(f"Giving up on {kind} email {email_id}: {e}")
+        else:
+            self.outbox.mark_sent(email_id)
+            finished = time.time()
+            with self._lock:
+                self.sent += 1
+                self._send_seconds.append(finished - start)
+                self._delivery_seconds.append(finished - created_at)
+        finally:
+            with self._lock:
+                self.busy -= 1
+        return True
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                if self.send_once():
+                    continue
+                if self.on_idle is not None:
+                    self.on_idle()
+                if time.time() - self._last_purge > 3600:
+                    self._last_purge = time.time()
+                    self.outbox.purge_sent(self.purge_after)
+            except Exception as e:
+                logger.error(f"Email worker error: {e}")
+            with self._wake:
+                if not self._signals:
+                    self._wake.wait(self.interval)
+                self._signals = max(0, self._signals - 1)
+
+    @staticmethod
+    def _summary(samples):
+        if not samples:
+            return {'avg': None, 'p95': None, 'max': None}
+        ordered = sorted(samples)
+        return {
+            'avg': round(sum(ordered) / len(ordered), 4),
+            'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+            'max': round(ordered[-1], 4)
+        }
+
+    def stats(self):
+        status = self.outbox.stats()
+        with self._lock:
+            status.update({
+                'workers': self.workers,
+                'busy': self.busy,
+                'sent_by_process': self.sent,
+                'errors_by_process': self.errors,
+                'send_seconds': self._summary(self._send_seconds),
+                'delivery_seconds': self._summary(self._delivery_seconds)
+            })
+        return status
@@ -0,0 +1,90 @@
+# email_shells.py
+# Report email templates rendered once per language.
+#
+# Most of each report email (layout, translated boilerplate, footer links) is
+# the same for every recipient in a language, yet render_template used to
+# render all of it for each message. The email templates mark the
+# per-recipient parts with a second delimiter set, [[ ... ]] and [% ... %],
+# which the app's Jinja environment leaves alone. EmailShells renders a
+# template once per language with the shared context, compiles the result as
+# a template in that second syntax, and caches it; sending an email then only
+# fills in the recipient's fields.
+#
+# Recipient fields are only ever passed to that second render, whose output is
+# not parsed again. Values printed by the first pass (translations, links)
+# do become template source, so the shell pass defuses anything in them that
+# would open a [[, [% or [# tag.
+
+import re
+import threading
+
+from jinja2 import Environment
+from markupsafe import Markup, escape
+
+_SECOND_PASS_START = re.compile(r'\[(?=[\[%#])')
+
+
+def _defuse(value):
+    # finalize hook for the shell pass: '[' becomes an HTML entity wherever
+    # it would start a second-pass tag, so the value prints as written
+    if not isinstance(value, str) or not _SECOND_PASS_START.search(value):
+        return value
+    return Markup(_SECOND_PASS_START.sub('&#91;', str(escape(value))))
+
+
+class EmailShells:
+    """Per-(template, language) cache of partially rendered email templates.
+
+    `jinja_env` loads the templates (the app's environment; shells are
+    rendered by an overlay of it that defuses second-pass delimiters);
+    `shared_context(language)` returns the variables common to every email in
+    that language. `filters` are made available to the per-recipient fields.
+    """
+
+    def __init__(self, jinja_env, shared_context, filters=None):
+        # A fresh cache, so templates are compiled with the overlay's finalize
+        self.jinja_env = jinja_env.overlay(finalize=_defuse, cache_size=50)
+        self.shared_context = shared_context
+        self.fill_env = Environment(
+            variable_start_string='[[', variable_end_string=']]',
+            block_start_string='[%', block_end_string='%]',
+            comment_start_string='[#', comment_end_string='#]',
+            autoescape=True
+        )
+        self.fill_env.filters.update(filters or {})
+        self._lock = threading.Lock()
+        self._shells = {}
+        self.hits = 0
+        self.misses = 0
+
+    def shell(self, template_name, language):
+        key = (template_name, language)
+        with self._lock:
+            shell = self._shells.get(key)
+            if shell is not None:
+                self.hits += 1
+                return shell
+            self.misses += 1
+        context = self.shared_context(language)
+        source = self.jinja_env.get_template(template_name).render(**context)
+        shell = self.fill_env.from_string(source, globals=context)
+        with self._lock:
+            return self._shells.setdefault(key, shell)
+
+    def render(self, template_name, language, **fields):
+        """The email's HTML for one recipient; `fields` are escaped as usual."""
+        return self.shell(template_name, language).render(**fields)
+
+    def clear(self):
+        with self._lock:
+            self._shells = {}
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'shells': len(self._shells),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
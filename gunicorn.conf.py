@@ -1,6 +1,7 @@
 bind = "0.0.0.0:10000"
 workers = 2
-worker_class = "sync"
+worker_class = "gthread"
+threads = 8
 timeout = 30
 keepalive = 2
 loglevel = "info"
@@ -0,0 +1,109 @@
+# mail_delivery.py
+# Reusable SMTP sessions for the email workers.
+#
+# mail.send(msg) opens a new SMTP session for every message: TCP connect,
+# STARTTLS, AUTH, one message, QUIT. PersistentMailer keeps one Flask-Mail
+# connection open per sending thread and sends consecutive messages over it.
+# A connection that fails mid-send is reopened and the message retried once;
+# connections are recycled after `max_messages` and closed once they have sat
+# idle for `max_idle` seconds, before the server would drop them.
+
+import logging
+import smtplib
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _connection_lost(error):
+    # SMTPException subclasses OSError; only retry when the session itself went away
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    return not isinstance(error, smtplib.SMTPException)
+
+
+class PersistentMailer:
+    """Sends Flask-Mail messages over a long-lived SMTP connection per thread.
+
+    Must be used inside an application context, like mail.send().
+    """
+
+    def __init__(self, mail, max_messages=100, max_idle=30):
+        self.mail = mail
+        self.max_messages = max_messages
+        self.max_idle = max_idle
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.reconnects = 0
+        self.recycles = 0
+        self.messages = 0
+
+    def _open(self):
+        connection = self.mail.connect()
+        connection.__enter__()
+        self._local.connection = connection
+        self._local.sent = 0
+        self._local.last_used = time.monotonic()
+        with self._lock:
+            self.connects += 1
+        return connection
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and time.monotonic() - self._local.last_used > self.max_idle:
+            self.close()
+            connection = None
+        return connection if connection is not None else self._open()
+
+    def close(self):
+        """Close this thread's connection, if any."""
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is None:
+            return
+        try:
+            connection.__exit__(None, None, None)
+        except (smtplib.SMTPException, OSError):
+            # The server may already have dropped it
+            pass
+
+    def close_if_idle(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and time.monotonic() - self._local.last_used > self.max_idle:
+            self.close()
+
+    def send(self, message):
+        connection = self._connection()
+        try:
+            connection.send(message)
+        except OSError as e:
+            if not _connection_lost(e):
+                raise
+            logger.warning(f"SMTP connection lost ({e}); reconnecting.")
+            self.close()
+            with self._lock:
+                self.reconnects += 1
+            connection = self._open()
+            connection.send(message)
+        self._local.last_used = time.monotonic()
+        self._local.sent += 1
+        with self._lock:
+            self.messages += 1
+        if self._local.sent >= self.max_messages:
+            self.close()
+            with self._lock:
+                self.recycles += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'connects': self.connects,
+                'reconnects': self.reconnects,
+                'recycles': self.recycles,
+                'messages': self.messages,
+                'messages_per_connection': round(self.messages / self.connects, 2) if self.connects else 0.0
+            }
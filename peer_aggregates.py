@@ -0,0 +1,109 @@
+# peer_aggregates.py
+# Running peer statistics stored alongside the sheet replica.
+#
+# The health comparison chart only needs the average peer score, but used to
+# re-score the whole Health sheet on every dashboard view to get it.
+# PeerAggregates keeps count, sum, min and max of a score plus per-component
+# sums in the replica database, updated in the same transaction that ingests
+# rows, so reading them is a single-row lookup and survives worker restarts.
+
+import json
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS peer_aggregates (
+    worksheet TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    total REAL NOT NULL,
+    minimum REAL,
+    maximum REAL,
+    components TEXT NOT NULL
+);
+"""
+
+
+class PeerAggregates:
+    """Incrementally maintained aggregates of one score column.
+
+    `score_rows(rows)` turns raw sheet rows into a DataFrame holding
+    `score_column` and every name in `components`. Methods take the caller's
+    connection so updates commit atomically with the rows they describe.
+    """
+
+    def __init__(self, score_column, components, score_rows):
+        self.score_column = score_column
+        self.components = list(components)
+        self.score_rows = score_rows
+
+    def create(self, conn):
+        conn.executescript(_SCHEMA)
+
+    def _summarize(self, rows):
+        df = self.score_rows(rows)
+        scores = df[self.score_column].astype(float).dropna()
+        return {
+            'count': int(len(scores)),
+            'total': float(scores.sum()),
+            'minimum': float(scores.min()) if len(scores) else None,
+            'maximum': float(scores.max()) if len(scores) else None,
+            'components': {name: float(df[name].astype(float).sum()) for name in self.components}
+        }
+
+    def _write(self, conn, worksheet_name, summary):
+        conn.execute(
+            'INSERT OR REPLACE INTO peer_aggregates (worksheet, count, total, minimum, maximum, components) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (worksheet_name, summary['count'], summary['total'], summary['minimum'], summary['maximum'],
+             json.dumps(summary['components']))
+        )
+
+    def _load(self, conn, worksheet_name):
+        row = conn.execute(
+            'SELECT count, total, minimum, maximum, components FROM peer_aggregates WHERE worksheet = ?',
+            (worksheet_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        count, total, minimum, maximum, components = row
+        return {'count': count, 'total': total, 'minimum': minimum, 'maximum': maximum,
+                'components': json.loads(components)}
+
+    def rebuild(self, conn, worksheet_name, rows):
+        self._write(conn, worksheet_name, self._summarize(rows))
+
+    def add(self, conn, worksheet_name, rows):
+        """Fold newly ingested rows into the stored aggregates; a no-op until they have been built."""
+        if not rows:
+            return
+        current = self._load(conn, worksheet_name)
+        if current is None:
+            return
+        added = self._summarize(rows)
+        bounds = [value for value in (current['minimum'], added['minimum']) if value is not None]
+        tops = [value for value in (current['maximum'], added['maximum']) if value is not None]
+        self._write(conn, worksheet_name, {
+            'count': current['count'] + added['count'],
+            'total': current['total'] + added['total'],
+            'minimum': min(bounds) if bounds else None,
+            'maximum': max(tops) if tops else None,
+            'components': {name: current['components'].get(name, 0.0) + added['components'][name]
+                           for name in self.components}
+        })
+
+    def read(self, conn, worksheet_name):
+        """Stored aggregates with means filled in, or None if they have not been built.
+
+        With no scored rows the means are None, so the result stays valid JSON.
+        """
+        current = self._load(conn, worksheet_name)
+        if current is None:
+            return None
+        count = current['count']
+        return {
+            'count': count,
+            'sum': current['total'],
+            'mean': current['total'] / count if count else None,
+            'min': current['minimum'],
+            'max': current['maximum'],
+            'component_means': {name: (current['components'].get(name, 0.0) / count if count else None)
+                                for name in self.components}
+        }
@@ -0,0 +1,106 @@
+# rank_service.py
+# Rank and percentile lookups over sorted score arrays.
+#
+# The dashboards used to rank a user by comparing their score against every
+# other user's on each request. ScoreRanks keeps the scores sorted so a rank
+# is two bisections, and a new submission is an insort instead of a re-sort.
+# VersionedRanks ties a ScoreRanks to a sheet replica version so it is only
+# rebuilt when rows change underneath it.
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+
+
+class ScoreRanks:
+    """Sorted list of scores supporting O(log n) rank and percentile lookups."""
+
+    def __init__(self, scores=()):
+        self._scores = []
+        if len(scores):
+            import numpy as np
+            values = np.asarray(scores, dtype=float)
+            self._scores = np.sort(values[~np.isnan(values)]).tolist()
+
+    def __len__(self):
+        return len(self._scores)
+
+    def add(self, score):
+        score = float(score)
+        if score == score:  # skip NaN
+            insort(self._scores, score)
+
+    def count_at_or_above(self, score):
+        return len(self._scores) - bisect_left(self._scores, score)
+
+    def count_above(self, score):
+        return len(self._scores) - bisect_right(self._scores, score)
+
+    def percentile(self, score):
+        """Percentage of scores at or below `score`."""
+        if not self._scores:
+            return 0.0
+        return 100.0 * bisect_right(self._scores, score) / len(self._scores)
+
+    def top_threshold(self, fraction=0.1):
+        """Lowest score whose holders all rank within the top `fraction`, or None."""
+        allowed = int(len(self._scores) * fraction)
+        if allowed == 0:
+            return None
+        threshold = self._scores[-allowed]
+        # Ties share the worst rank, so step past values with too many holders.
+        while self.count_at_or_above(threshold) > allowed:
+            position = bisect_right(self._scores, threshold)
+            if position == len(self._scores):
+                return None
+            threshold = self._scores[position]
+        return threshold
+
+    def in_top(self, score, fraction=0.1):
+        return self.count_at_or_above(score) <= len(self._scores) * fraction
+
+
+class VersionedRanks:
+    """A ScoreRanks rebuilt only when the source's version changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version = None
+        self.ranks = ScoreRanks()
+        self.rebuilds = 0
+        self.inserts = 0
+
+    def current(self, version):
+        """The ranks if they were built for `version`, else None."""
+        with self._lock:
+            return self.ranks if version is not None and version == self.version else None
+
+    def get(self, version, scores):
+        """Return ranks for `version`, rebuilding from `scores` (an iterable or a callable) if needed.
+
+        A `version` of None means the source is unversioned and always rebuilds.
+        """
+        with self._lock:
+            if version is None or version != self.version:
+                self.ranks = ScoreRanks(scores() if callable(scores) else scores)
+                self.version = version
+                self.rebuilds += 1
+            return self.ranks
+
+    def add(self, previous_version, version, scores):
+        """Insert `scores` if they are the only change between the two versions.
+
+        An empty `scores` moves the ranks to `version` for changes that leave
+        the set of scores as it was.
+        """
+        with self._lock:
+            if self.version is None or self.version != previous_version:
+                return False
+            for score in scores:
+                self.ranks.add(score)
+                self.inserts += 1
+            self.version = version
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {'version': self.version, 'size': len(self.ranks), 'rebuilds': self.rebuilds, 'inserts': self.inserts}
@@ -0,0 +1,213 @@
+# scoring.py
+# Vectorized health score and budget metrics.
+#
+# The app used to derive the score description, course and budget advice with
+# row-wise DataFrame.apply calls (and looked translations up once per row).
+# These functions compute the same columns with whole-column NumPy operations:
+# each row is assigned an outcome code with np.select and the text columns are
+# filled by indexing a small array of categories with those codes.
+#
+# Single submissions go through score_health_values and budget_metrics_values instead,
+# which do the same arithmetic on plain floats and return slotted results, so a
+# request scoring one user does not pay for building a DataFrame. NumPy and
+# pandas are imported by the vectorized functions on first use, so importing
+# this module (and the scalar path) does not load them.
+
+import math
+
+HEALTH_INPUTS = ['income_revenue', 'expenses_costs', 'debt_loan', 'debt_interest_rate']
+BUDGET_INPUTS = ['monthly_income', 'housing_expenses', 'food_expenses', 'transport_expenses', 'other_expenses',
+                 'savings_goal']
+
+INVESTING_COURSE_URL = 'https://youtube.com/@ficore.africa'
+SAVINGS_COURSE_URL = 'https://www.youtube.com/@FICORE.AFRICA'
+DEBT_COURSE_URL = 'https://www.youtube.com/@FICORE.AFRICA'
+RECOVERY_COURSE_URL = 'https://www.youtube.com/@FICORE.AFRICA'
+COURSE_URLS = {
+    'investing': INVESTING_COURSE_URL.split('?')[0],
+    'debt': DEBT_COURSE_URL.split('?')[0],
+    'savings': SAVINGS_COURSE_URL.split('?')[0],
+    'recovery': RECOVERY_COURSE_URL.split('?')[0]
+}
+
+# Outcome codes index these (description, course title, course key) categories.
+HEALTH_OUTCOMES = [
+    ('Stable Income; invest excess now', 'Ficore Simplified Investing Course', 'investing'),
+    ('At Risk; manage your expense!', 'Ficore Debt and Expense Management', 'debt'),
+    ('Moderate; save something monthly!', 'Ficore Savings Mastery', 'savings'),
+    ('Critical; seek financial help!', 'Ficore Financial Recovery', 'recovery')
+]
+_INVEST, _DEBT, _SAVE, _RECOVER = range(len(HEALTH_OUTCOMES))
+
+SURPLUS_ADVICE = 'Great job! Save or invest your surplus to grow your wealth.'
+DEFICIT_ADVICE = 'Reduce non-essential spending to balance your budget.'
+
+
+def _numeric(df, columns):
+    import pandas as pd
+    for col in columns:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+
+
+def health_outcome_codes(score, cash_flow, debt_interest):
+    """Outcome code per row; NaN scores fall through to the recovery outcome."""
+    import numpy as np
+    score = np.asarray(score, dtype=float)
+    at_risk = (np.asarray(cash_flow, dtype=float) < 0.3) | (np.asarray(debt_interest, dtype=float) > 0.5)
+    return np.select(
+        [score >= 75, (score >= 50) & at_risk, score >= 50, score >= 25],
+        [_INVEST, _DEBT, _SAVE, _DEBT],
+        default=_RECOVER
+    )
+
+
+def health_outcome_code(score, cash_flow, debt_interest):
+    """Scalar form of health_outcome_codes."""
+    if score >= 75:
+        return _INVEST
+    if score >= 50:
+        return _DEBT if cash_flow < 0.3 or debt_interest > 0.5 else _SAVE
+    if score >= 25:
+        return _DEBT
+    return _RECOVER
+
+
+def score_health(df, course_urls):
+    """Add the health score, its components and the recommended course to `df` in place.
+
+    `course_urls` maps the course keys in HEALTH_OUTCOMES to URLs.
+    """
+    import numpy as np
+    _numeric(df, HEALTH_INPUTS)
+    df['IncomeRevenueSafe'] = df['income_revenue'].replace(0, 1e-10)
+    df['CashFlowRatio'] = (df['income_revenue'] - df['expenses_costs']) / df['IncomeRevenueSafe']
+    df['DebtToIncomeRatio'] = df['debt_loan'] / df['IncomeRevenueSafe']
+    df['DebtInterestBurden'] = (df['debt_interest_rate'].clip(lower=0) / 20).clip(upper=1)
+    df['NormCashFlow'] = df['CashFlowRatio'].clip(0, 1)
+    df['NormDebtToIncome'] = 1 - df['DebtToIncomeRatio'].clip(0, 1)
+    df['NormDebtInterest'] = 1 - df['DebtInterestBurden']
+    df['HealthScore'] = ((
+        df['NormCashFlow'] * 0.333 +
+        df['NormDebtToIncome'] * 0.333 +
+        df['NormDebtInterest'] * 0.333
+    ) * 100).round(2)
+    codes = health_outcome_codes(df['HealthScore'], df['CashFlowRatio'], df['DebtInterestBurden'])
+    descriptions, titles, urls = (np.array(column, dtype=object) for column in zip(*(
+        (description, title, course_urls[key]) for description, title, key in HEALTH_OUTCOMES
+    )))
+    df['ScoreDescription'] = descriptions[codes]
+    df['CourseTitle'] = titles[codes]
+    df['CourseURL'] = urls[codes]
+    return df
+
+
+def budget_metrics(df, get_translations):
+    """Add totals, savings, surplus/deficit, outcome and advice columns to `df` in place.
+
+    Advice is localized in the language of the first row, as the dashboards
+    only ever score one user's rows at a time.
+    """
+    import numpy as np
+    _numeric(df, BUDGET_INPUTS)
+    df['total_expenses'] = df['housing_expenses'] + df['food_expenses'] + df['transport_expenses'] + df['other_expenses']
+    income = df['monthly_income'].to_numpy(dtype=float)
+    goal = df['savings_goal'].to_numpy(dtype=float)
+    df['savings'] = np.where(np.isnan(goal) | (goal == 0), np.maximum(0, income * 0.1), goal)
+    df['surplus_deficit'] = df['monthly_income'] - df['total_expenses'] - df['savings']
+    surplus = df['surplus_deficit'].to_numpy(dtype=float) >= 0
+    df['outcome_status'] = np.array(['Overspend', 'Savings'], dtype=object)[surplus.astype(int)]
+    trans = get_translations(df['language'].iloc[0])
+    df['advice'] = np.array([trans[DEFICIT_ADVICE], trans[SURPLUS_ADVICE]], dtype=object)[surplus.astype(int)]
+    return df
+
+
+def to_float(value):
+    """Scalar equivalent of pd.to_numeric(errors='coerce').fillna(0.0)."""
+    if isinstance(value, str):
+        value = value.strip()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(number) else number
+
+
+def _round2(value):
+    # Same result as Series.round(2): round half to even on value * 100.
+    return round(value * 100) / 100 if math.isfinite(value) else value
+
+
+def _clip(value, lower, upper):
+    return min(max(value, lower), upper)
+
+
+class HealthResult:
+    """Health score of one submission; attributes mirror score_health's columns."""
+
+    __slots__ = ('income_revenue', 'expenses_costs', 'debt_loan', 'debt_interest_rate',
+                 'income_revenue_safe', 'cash_flow_ratio', 'debt_to_income_ratio', 'debt_interest_burden',
+                 'norm_cash_flow', 'norm_debt_to_income', 'norm_debt_interest', 'health_score',
+                 'score_description', 'course_title', 'course_url')
+
+    COLUMNS = {
+        'income_revenue': 'income_revenue', 'expenses_costs': 'expenses_costs', 'debt_loan': 'debt_loan',
+        'debt_interest_rate': 'debt_interest_rate', 'income_revenue_safe': 'IncomeRevenueSafe',
+        'cash_flow_ratio': 'CashFlowRatio', 'debt_to_income_ratio': 'DebtToIncomeRatio',
+        'debt_interest_burden': 'DebtInterestBurden', 'norm_cash_flow': 'NormCashFlow',
+        'norm_debt_to_income': 'NormDebtToIncome', 'norm_debt_interest': 'NormDebtInterest',
+        'health_score': 'HealthScore', 'score_description': 'ScoreDescription',
+        'course_title': 'CourseTitle', 'course_url': 'CourseURL'
+    }
+
+    def as_columns(self):
+        """The result keyed by the DataFrame column names score_health uses."""
+        return {column: getattr(self, name) for name, column in self.COLUMNS.items()}
+
+
+def score_health_values(income_revenue, expenses_costs, debt_loan, debt_interest_rate, course_urls):
+    result = HealthResult()
+    income = result.income_revenue = to_float(income_revenue)
+    expenses = result.expenses_costs = to_float(expenses_costs)
+    debt = result.debt_loan = to_float(debt_loan)
+    rate = result.debt_interest_rate = to_float(debt_interest_rate)
+    safe = result.income_revenue_safe = 1e-10 if income == 0 else income
+    result.cash_flow_ratio = (income - expenses) / safe
+    result.debt_to_income_ratio = debt / safe
+    result.debt_interest_burden = min(max(rate, 0) / 20, 1)
+    result.norm_cash_flow = _clip(result.cash_flow_ratio, 0, 1)
+    result.norm_debt_to_income = 1 - _clip(result.debt_to_income_ratio, 0, 1)
+    result.norm_debt_interest = 1 - result.debt_interest_burden
+    result.health_score = _round2((
+        result.norm_cash_flow * 0.333 +
+        result.norm_debt_to_income * 0.333 +
+        result.norm_debt_interest * 0.333
+    ) * 100)
+    code = health_outcome_code(result.health_score, result.cash_flow_ratio, result.debt_interest_burden)
+    result.score_description, result.course_title, key = HEALTH_OUTCOMES[code]
+    result.course_url = course_urls[key]
+    return result
+
+
+class BudgetResult:
+    """Budget metrics of one submission; attributes mirror budget_metrics' columns."""
+
+    __slots__ = ('monthly_income', 'housing_expenses', 'food_expenses', 'transport_expenses', 'other_expenses',
+                 'savings_goal', 'total_expenses', 'savings', 'surplus_deficit', 'outcome_status', 'advice')
+
+    def as_columns(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def budget_metrics_values(values, language, get_translations):
+    """Score a mapping holding the BUDGET_INPUTS, e.g. the budget form's session data."""
+    result = BudgetResult()
+    for name in BUDGET_INPUTS:
+        setattr(result, name, to_float(values.get(name)))
+    result.total_expenses = (result.housing_expenses + result.food_expenses +
+                             result.transport_expenses + result.other_expenses)
+    result.savings = max(0, result.monthly_income * 0.1) if result.savings_goal == 0 else result.savings_goal
+    result.surplus_deficit = result.monthly_income - result.total_expenses - result.savings
+    surplus = result.surplus_deficit >= 0
+    result.outcome_status = 'Savings' if surplus else 'Overspend'
+    result.advice = get_translations(language)[SURPLUS_ADVICE if surplus else DEFICIT_ADVICE]
+    return result
@@ -0,0 +1,183 @@
+# session_backups.py
+# Per-email session backups written in the background.
+#
+# CompressedSession backs up the session of any user with an email so it can
+# be restored if the cookie is lost. The backup used to be written with a
+# plain open()/json.dump on every modified response, inside the request, and
+# a concurrent writer in another worker could leave a torn file behind.
+# SessionBackups takes the latest snapshot per email and a writer thread
+# saves it after a short delay, so a burst of requests costs one write. Files
+# are written to a temporary name and renamed into place, so readers never
+# see a partial file. Restores are served from a small LRU that is checked
+# against the file's mtime and size, so a newer backup written by another
+# worker is still picked up.
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class SessionBackups(threading.Thread):
+    """Background writer and cached reader of `<directory>/<file_name(email)>.json`.
+
+    `save` records a snapshot and returns at once; the thread writes it
+    `delay` seconds later, keeping only the newest snapshot per email.
+    `load` sees snapshots that are still pending, then the file.
+    """
+
+    def __init__(self, directory, file_name, delay=1.0, cache_size=256):
+        super().__init__(name='session-backup-writer', daemon=True)
+        self.directory = directory
+        self.file_name = file_name
+        self.delay = delay
+        self.cache_size = cache_size
+        self._lock = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._pending = {}
+        self._cache = OrderedDict()
+        self.writes = 0
+        self.coalesced = 0
+        self.unchanged = 0
+        self.errors = 0
+        self.restore_hits = 0
+        self.restore_misses = 0
+
+    def path(self, email):
+        return os.path.join(self.directory, os.path.basename(f"{self.file_name(email)}.json"))
+
+    def save(self, email, data):
+        text = json.dumps(data)
+        path = self.path(email)
+        with self._lock:
+            if path in self._pending:
+                self.coalesced += 1
+            elif self._cached(path) == text:
+                self.unchanged += 1
+                return
+            self._pending[path] = text
+            self._lock.notify()
+
+    def load(self, email):
+        """The most recent backup for `email`, or None if there is none."""
+        path = self.path(email)
+        with self._lock:
+            text = self._pending.get(path)
+            if text is None:
+                text = self._cached(path)
+                if text is not None:
+                    self.restore_hits += 1
+        if text is None:
+            try:
+                stat = os.stat(path)
+                with open(path, 'r') as f:
+                    text = f.read()
+            except FileNotFoundError:
+                return None
+            with self._lock:
+                self.restore_misses += 1
+                self._remember(path, stat, text)
+        return json.loads(text)
+
+    def discard(self, email):
+        """Drop the backup for `email`, including a write that has not happened yet."""
+        path = self.path(email)
+        with self._write_lock:
+            with self._lock:
+                self._pending.pop(path, None)
+                self._cache.pop(path, None)
+            try:
+                os.remove(path)
+                return True
+            except FileNotFoundError:
+                return False
+
+    def flush(self):
+        """Write every pending snapshot now; returns how many were written."""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            written = 0
+            for path, text in batch.items():
+                written += self._write(path, text)
+            return written
+
+    def run(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._stopping.is_set():
+                    self._lock.wait()
+            # Let further saves for the same emails replace the pending snapshot
+            stopping = self._stopping.wait(self.delay)
+            self.flush()
+            if stopping:
+                return
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        with self._lock:
+            self._lock.notify()
+        if self.is_alive():
+            self.join(timeout)
+        self.flush()
+
+    def stats(self):
+        with self._lock:
+            loads = self.restore_hits + self.restore_misses
+            return {
+                'pending': len(self._pending),
+                'cached': len(self._cache),
+                'writes': self.writes,
+                'coalesced': self.coalesced,
+                'unchanged': self.unchanged,
+                'errors': self.errors,
+                'restore_hits': self.restore_hits,
+                'restore_misses': self.restore_misses,
+                'restore_hit_rate': round(self.restore_hits / loads, 4) if loads else 0.0
+            }
+
+    def _write(self, path, text):
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                f.write(text)
+            os.replace(temp_path, path)
+            stat = os.stat(path)
+            with self._lock:
+                self.writes += 1
+                self._remember(path, stat, text)
+            return 1
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.error(f"Failed to write session backup {path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return 0
+
+    def _cached(self, path):
+        # Caller holds self._lock; the entry counts only while the file is unchanged
+        entry = self._cache.get(path)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        if stat is None or (stat.st_mtime_ns, stat.st_size) != entry[0]:
+            del self._cache[path]
+            return None
+        self._cache.move_to_end(path)
+        return entry[1]
+
+    def _remember(self, path, stat, text):
+        self._cache[path] = ((stat.st_mtime_ns, stat.st_size), text)
+        self._cache.move_to_end(path)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
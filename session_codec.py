@@ -0,0 +1,95 @@
+# session_codec.py
+# Compact, signed encoding of the session cookie.
+#
+# The first cookie format was JSON, zlib, .hex() (doubling the size) and then
+# URLSafeTimedSerializer, which JSON-encodes and base64s that hex string
+# again. Version 2 ("v2." prefix) is JSON with no spaces, raw deflate primed
+# with a preset dictionary of our session keys and common values, one
+# URL-safe base64 layer and an HMAC signature. Cookies in the first format
+# still decode, so sessions survive the switch.
+#
+# SESSION_ZDICT is part of the v2 format: changing it makes existing v2
+# cookies unreadable, so a new dictionary needs a new version prefix.
+
+import base64
+import json
+import threading
+import zlib
+from collections import OrderedDict
+
+from itsdangerous import Signer, URLSafeTimedSerializer
+
+# zlib favours matches near the end of the dictionary, so the most common
+# fragments come last.
+SESSION_ZDICT = ''.join([
+    '"_flashes":[["error","Error processing data. Please try again."]],'
+    '[["success","Check your Inbox, Junk, or Spam folder for your report!"],["success","Data submitted successfully!"]]',
+    '"quiz_results":{"first_name":"","badges":["First Quiz Completed!","Master Planner!"],"answers":{',
+    '"quiz_data":{"question_1":"Yes","question_2":"No","question_3":"Yes","question_4":"No",'
+    '"question_5":"Yes","question_6":"No","question_7":"Yes","question_8":"No","question_9":"Yes",'
+    '"question_10":"No","first_name":"","email":"","language":"en","auto_email":false}',
+    '"budget_data":{"first_name":"","email":"","language":"en","monthly_income":.0,"housing_expenses":.0,'
+    '"food_expenses":.0,"transport_expenses":.0,"other_expenses":.0,"savings_goal":.0,"auto_email":false}',
+    '"dashboard_data":{"first_name":"","email":"","income_revenue":.0,"expenses_costs":.0,'
+    '"debt_loan":.0,"debt_interest_rate":.0}',
+    '"health_data":{"first_name":"","email":"@gmail.com","language":"en","auto_email":true,'
+    '"business_name":"","user_type":"Individual","user_type":"SME","income_revenue":.0,"expenses_costs":.0,'
+    '"debt_loan":.0,"debt_interest_rate":.0}',
+    '"csrf_token":"","language":"ha"},"language":"en"}'
+]).encode('utf-8')
+
+VERSION_PREFIX = 'v2.'
+
+
+class SessionCodec:
+    """Encodes session dicts as v2 cookie values; decodes v2 and legacy ones.
+
+    Decoded cookies are remembered in a small LRU keyed by the exact cookie
+    value (which has already passed the signature check), so a browser
+    repeating an unchanged cookie costs one json.loads. `loads` raises
+    itsdangerous.BadSignature, zlib.error or ValueError for cookies it cannot
+    read.
+    """
+
+    def __init__(self, secret_key, cache_size=256):
+        self.secret_key = secret_key
+        self.signer = Signer(secret_key, salt='session-cookie-v2')
+        self.legacy = URLSafeTimedSerializer(secret_key)
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._decoded = OrderedDict()
+
+    def dumps(self, session_dict):
+        text = json.dumps(session_dict, separators=(',', ':'))
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15, zdict=SESSION_ZDICT)
+        payload = compressor.compress(text.encode('utf-8')) + compressor.flush()
+        encoded = base64.urlsafe_b64encode(payload).rstrip(b'=')
+        cookie = VERSION_PREFIX + self.signer.sign(encoded).decode('ascii')
+        self._remember(cookie, text)
+        return cookie
+
+    def loads(self, cookie):
+        with self._lock:
+            text = self._decoded.get(cookie)
+            if text is not None:
+                self._decoded.move_to_end(cookie)
+        if text is None:
+            text = self._decode(cookie)
+            self._remember(cookie, text)
+        return json.loads(text)
+
+    def _decode(self, cookie):
+        if not cookie.startswith(VERSION_PREFIX):
+            # First format: URLSafeTimedSerializer around the hex of zlib'd JSON
+            return zlib.decompress(bytes.fromhex(self.legacy.loads(cookie))).decode('utf-8')
+        encoded = self.signer.unsign(cookie[len(VERSION_PREFIX):])
+        payload = base64.urlsafe_b64decode(encoded + b'=' * (-len(encoded) % 4))
+        decompressor = zlib.decompressobj(-15, zdict=SESSION_ZDICT)
+        return (decompressor.decompress(payload) + decompressor.flush()).decode('utf-8')
+
+    def _remember(self, cookie, text):
+        with self._lock:
+            self._decoded[cookie] = text
+            self._decoded.move_to_end(cookie)
+            while len(self._decoded) > self.cache_size:
+                self._decoded.popitem(last=False)
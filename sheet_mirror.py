@@ -0,0 +1,391 @@
+# sheet_mirror.py
+# Incrementally synced local SQLite replica of a worksheet.
+#
+# Instead of downloading the whole worksheet with get_all_values() on every
+# cache miss, a SheetMirror remembers how many rows have been synced and only
+# requests the range after them (A{n+2}:<last column>). Rows are stored in a
+# SQLite file shared by all workers, with indexes on email and Timestamp so
+# per-user reads are indexed lookups instead of a scan over the whole sheet.
+# A periodic full reconcile re-reads the worksheet to pick up manual edits or
+# deleted rows.
+#
+# Appends are written through to the replica as provisional rows as soon as
+# they are journaled, so reads see a user's own submission before it reaches
+# the sheet. When a sync brings in the delivered row, the provisional copy
+# with the same (Timestamp, email) is dropped.
+#
+# Every change bumps a version number in the replica. Each worker keeps one
+# DataFrame snapshot of the worksheet per version, with an email -> row
+# positions index, so per-user reads are slices of that snapshot rather than
+# separate queries or downloads.
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from sheets_client import column_letter
+
+logger = logging.getLogger(__name__)
+
+_META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror_meta (
+    worksheet TEXT PRIMARY KEY,
+    synced_rows INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL,
+    reconciled_at REAL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _cell(value):
+    if isinstance(value, str):
+        return value
+    # numpy scalars (e.g. values taken from a DataFrame row) expose item()
+    return str(value.item() if hasattr(value, 'item') else value)
+
+
+def _fit(row, width):
+    row = list(row)
+    return row + [''] * (width - len(row)) if len(row) < width else row[:width]
+
+
+def frame_from_rows(rows, headers):
+    """Build a DataFrame from raw sheet rows, padding or trimming them to the headers."""
+    import pandas as pd
+    df = pd.DataFrame([_fit(row, len(headers)) for row in rows], columns=headers)
+    df['language'] = df['language'].replace('', 'en')
+    return df
+
+
+class SheetMirror:
+    """SQLite replica of one worksheet's data rows.
+
+    `read_range(a1_range)` returns the cell values for a range and
+    `read_all()` returns every row including the header row; both are
+    supplied by the caller so the mirror stays independent of the client.
+    Several workers may share `db_path`; sync timestamps are stored in the
+    database so one worker's sync serves the others. An optional
+    PeerAggregates is kept up to date as rows are written through or synced.
+    `on_rows(previous_version, version, rows)`, if given, is called once such
+    a change has committed, with the rows it added to the data set (none when
+    a sync only settled provisional rows), so per-worker structures built for
+    `previous_version` can follow along instead of being rebuilt.
+    """
+
+    def __init__(self, worksheet_name, headers, read_range, read_all, db_path,
+                 sync_interval=60, reconcile_interval=3600, aggregates=None, on_rows=None):
+        self.worksheet_name = worksheet_name
+        self.headers = list(headers)
+        self.read_range = read_range
+        self.read_all = read_all
+        self.db_path = db_path
+        self.sync_interval = sync_interval
+        self.reconcile_interval = reconcile_interval
+        self.aggregates = aggregates
+        self.on_rows = on_rows
+        self.last_column = column_letter(len(headers))
+        self.table = _quote(f"sheet_{worksheet_name}")
+        self.pending_table = _quote(f"pending_{worksheet_name}")
+        self._columns = ', '.join(_quote(header) for header in self.headers)
+        self._local = threading.Lock()
+        self._thread_state = threading.local()
+        self._stale = True
+        self._snapshot = None
+        self.incremental_syncs = 0
+        self.full_syncs = 0
+        self.snapshot_builds = 0
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._create_schema()
+
+    def _connect(self):
+        conn = getattr(self._thread_state, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._thread_state.conn = conn
+        return conn
+
+    def _create_schema(self):
+        name = f"sheet_{self.worksheet_name}"
+        columns = ', '.join(f"{_quote(header)} TEXT NOT NULL DEFAULT ''" for header in self.headers)
+        self._connect().executescript(
+            _META_SCHEMA +
+            f"CREATE TABLE IF NOT EXISTS {self.table} (row_number INTEGER PRIMARY KEY, {columns});\n"
+            f"CREATE INDEX IF NOT EXISTS {_quote(name + '_email_ts')} ON {self.table} (\"email\", \"Timestamp\");\n"
+            f"CREATE INDEX IF NOT EXISTS {_quote(name + '_ts')} ON {self.table} (\"Timestamp\");\n"
+            f"CREATE TABLE IF NOT EXISTS {self.pending_table} (journal_id INTEGER PRIMARY KEY, {columns});\n"
+            f"CREATE INDEX IF NOT EXISTS {_quote('pending_' + self.worksheet_name + '_email_ts')} "
+            f"ON {self.pending_table} (\"email\", \"Timestamp\");\n"
+        )
+        try:
+            # Replicas created before snapshots were versioned
+            self._connect().execute('ALTER TABLE mirror_meta ADD COLUMN version INTEGER NOT NULL DEFAULT 0')
+        except sqlite3.OperationalError:
+            pass
+        self._connect().execute('INSERT OR IGNORE INTO mirror_meta (worksheet) VALUES (?)', (self.worksheet_name,))
+        if self.aggregates is not None:
+            self.aggregates.create(self._connect())
+
+    def _meta(self):
+        return self._connect().execute(
+            'SELECT synced_rows, synced_at, reconciled_at FROM mirror_meta WHERE worksheet = ?',
+            (self.worksheet_name,)
+        ).fetchone()
+
+    @property
+    def row_count(self):
+        return self._meta()[0]
+
+    @property
+    def version(self):
+        return self._connect().execute(
+            'SELECT version FROM mirror_meta WHERE worksheet = ?', (self.worksheet_name,)
+        ).fetchone()[0]
+
+    @property
+    def synced_at(self):
+        """Start time of the last successful fetch by any worker."""
+        return self._meta()[1]
+
+    def write_through(self, journal_id, row):
+        """Add a journaled row to the replica until a sync brings in the delivered copy.
+
+        Returns the replica version that includes the row.
+        """
+        placeholders = ', '.join('?' for _ in range(len(self.headers) + 1))
+        row = _fit([_cell(value) for value in row], len(self.headers))
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.pending_table} (journal_id, {self._columns}) VALUES ({placeholders})",
+                (journal_id, *row)
+            )
+            if self.aggregates is not None:
+                self.aggregates.add(conn, self.worksheet_name, [row])
+            self._bump_version(conn)
+            version = self.version
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._rows_added(version, [row])
+        return version
+
+    def mark_stale(self):
+        """Sync on this worker's next read instead of waiting for the sync interval."""
+        self._stale = True
+
+    def refresh(self, force=False):
+        """Bring the replica up to date if it is stale or the sync interval has passed."""
+        with self._local:
+            now = time.time()
+            synced_rows, synced_at, reconciled_at = self._meta()
+            if reconciled_at is None or now - reconciled_at >= self.reconcile_interval:
+                self._reconcile(now)
+            elif force or self._stale or synced_at is None or now - synced_at >= self.sync_interval:
+                self._sync_new_rows(now, synced_rows)
+
+    def _bump_version(self, conn):
+        conn.execute('UPDATE mirror_meta SET version = version + 1 WHERE worksheet = ?', (self.worksheet_name,))
+
+    def _insert(self, conn, first_row_number, rows):
+        placeholders = ', '.join('?' for _ in range(len(self.headers) + 1))
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {self.table} (row_number, {self._columns}) VALUES ({placeholders})",
+            [(first_row_number + offset, *_fit(row, len(self.headers))) for offset, row in enumerate(rows)]
+        )
+
+    def _settle_pending(self, conn, rows):
+        """Drop one provisional row per synced row with the same (Timestamp, email).
+
+        Returns the synced rows that had no provisional copy.
+        """
+        timestamp, email = self.headers.index('Timestamp'), self.headers.index('email')
+        unmatched = []
+        for row in rows:
+            row = _fit(row, len(self.headers))
+            cursor = conn.execute(
+                f"DELETE FROM {self.pending_table} WHERE journal_id = (SELECT MIN(journal_id) FROM {self.pending_table} "
+                f"WHERE \"email\" = ? AND \"Timestamp\" = ?)",
+                (row[email], row[timestamp])
+            )
+            if cursor.rowcount == 0:
+                unmatched.append(row)
+        return unmatched
+
+    def _sync_new_rows(self, started, synced_rows):
+        # Row 1 holds the headers, so data row n lives on sheet row n + 1.
+        values = self.read_range(f"A{synced_rows + 2}:{self.last_column}")
+        new_rows = [list(row) for row in values]
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another worker may have synced further while this fetch was in
+            # flight; only rows beyond what is already stored are new.
+            stored = self._meta()[0]
+            fresh = new_rows[max(0, stored - synced_rows):]
+            self._insert(conn, synced_rows + len(new_rows) - len(fresh) + 1, fresh)
+            unmatched = self._settle_pending(conn, fresh)
+            if self.aggregates is not None:
+                self.aggregates.add(conn, self.worksheet_name, unmatched)
+            if fresh:
+                self._bump_version(conn)
+                version = self.version
+            total = max(stored, synced_rows + len(new_rows))
+            conn.execute(
+                'UPDATE mirror_meta SET synced_rows = ?, synced_at = MAX(COALESCE(synced_at, 0), ?) WHERE worksheet = ?',
+                (total, started, self.worksheet_name)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._stale = False
+        self.incremental_syncs += 1
+        logger.info(f"Synced {len(new_rows)} new rows from '{self.worksheet_name}' ({total} total).")
+        if fresh:
+            self._rows_added(version, unmatched)
+
+    def _rows_added(self, version, rows):
+        if self.on_rows is None:
+            return
+        try:
+            self.on_rows(version - 1, version, rows)
+        except Exception as e:
+            logger.error(f"Error handling new rows for '{self.worksheet_name}': {e}")
+
+    def _reconcile(self, started):
+        values = self.read_all()
+        rows = [list(row) for row in values[1:]] if len(values) > 1 else []
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(f"DELETE FROM {self.table}")
+            self._insert(conn, 1, rows)
+            conn.execute(
+                f"DELETE FROM {self.pending_table} WHERE EXISTS (SELECT 1 FROM {self.table} AS synced "
+                f"WHERE synced.\"email\" = {self.pending_table}.\"email\" "
+                f"AND synced.\"Timestamp\" = {self.pending_table}.\"Timestamp\")"
+            )
+            if self.aggregates is not None:
+                self._rebuild_aggregates(conn)
+            conn.execute(
+                'UPDATE mirror_meta SET synced_rows = ?, synced_at = ?, reconciled_at = ? WHERE worksheet = ?',
+                (len(rows), started, started, self.worksheet_name)
+            )
+            self._bump_version(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._stale = False
+        self.full_syncs += 1
+        logger.info(f"Reconciled '{self.worksheet_name}' ({len(rows)} rows).")
+
+    def _rebuild_aggregates(self, conn):
+        rows = conn.execute(f"SELECT {self._columns} FROM {self.table}").fetchall()
+        rows += conn.execute(f"SELECT {self._columns} FROM {self.pending_table}").fetchall()
+        self.aggregates.rebuild(conn, self.worksheet_name, [list(row) for row in rows])
+
+    def peer_aggregates(self):
+        """Aggregates over every replica row, building and storing them on first use."""
+        conn = self._connect()
+        current = self.aggregates.read(conn, self.worksheet_name)
+        if current is not None:
+            return current
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if self.aggregates.read(conn, self.worksheet_name) is None:
+                self._rebuild_aggregates(conn)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return self.aggregates.read(conn, self.worksheet_name)
+
+    def _query(self, where='', params=(), limit=None):
+        # Synced rows in sheet order, then provisional rows in journal order.
+        condition = f" WHERE {where}" if where else ''
+        sql = (f"SELECT {self._columns} FROM ("
+               f"SELECT 0 AS source, row_number AS position, {self._columns} FROM {self.table}{condition} "
+               f"UNION ALL "
+               f"SELECT 1, journal_id, {self._columns} FROM {self.pending_table}{condition}"
+               f") ORDER BY source, position")
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return frame_from_rows(self._connect().execute(sql, tuple(params) * 2).fetchall(), self.headers)
+
+    def _current_snapshot(self, build=True):
+        """The (version, frame, email index) snapshot for the replica's current version.
+
+        With `build=False` an out-of-date snapshot is not rebuilt and None is
+        returned instead.
+        """
+        version = self.version
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot
+        if not build:
+            return None
+        with self._local:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot[0] != version:
+                df = self._query()
+                snapshot = (version, df, df.groupby('email', sort=False).indices)
+                self._snapshot = snapshot
+                self.snapshot_builds += 1
+        return snapshot
+
+    @property
+    def snapshot_version(self):
+        """Version of the snapshot last returned by frame(), or None."""
+        snapshot = self._snapshot
+        return snapshot[0] if snapshot is not None else None
+
+    def frame(self):
+        """Every mirrored row in sheet order, followed by undelivered appends, as a new DataFrame."""
+        return self._current_snapshot()[1].copy()
+
+    def rows_for_email(self, email, limit=None):
+        """A user's rows in sheet order.
+
+        Sliced from the snapshot when this worker has a current one; otherwise
+        read with an indexed query rather than building the snapshot for one user.
+        """
+        snapshot = self._current_snapshot(build=False)
+        if snapshot is None:
+            return self._query('"email" = ?', (email,), limit=limit)
+        _, df, positions = snapshot
+        positions = positions.get(email)
+        if positions is None:
+            return df.iloc[0:0].copy()
+        if limit is not None:
+            positions = positions[:limit]
+        return df.iloc[positions].reset_index(drop=True)
+
+    def pending_count(self):
+        return self._connect().execute(f"SELECT COUNT(*) FROM {self.pending_table}").fetchone()[0]
+
+    def stats(self):
+        synced_rows, synced_at, reconciled_at = self._meta()
+        return {
+            'rows': synced_rows,
+            'pending': self.pending_count(),
+            'version': self.version,
+            'snapshot_builds': self.snapshot_builds,
+            'synced_at': synced_at,
+            'reconciled_at': reconciled_at,
+            'incremental_syncs': self.incremental_syncs,
+            'full_syncs': self.full_syncs
+        }
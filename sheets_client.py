@@ -0,0 +1,305 @@
+# sheets_client.py
+# Worksheet lookups for the Google Sheets client layer.
+#
+# gspread's Spreadsheet.worksheet(name) fetches the spreadsheet metadata on
+# every call, so each read or append used to cost an extra API round trip.
+# WorksheetCache keeps the Worksheet handles per process and only goes back
+# to the API on a miss, after an explicit invalidation, or when a cached
+# handle turns out to point at a worksheet that no longer exists.
+#
+# gspread's default HTTP client sends everything through one AuthorizedSession,
+# which is not safe to share between threads and refreshes its token inline.
+# SessionPool holds a fixed set of keep-alive sessions that requests borrow one
+# at a time, and refreshes the shared credentials under a lock on a background
+# thread before they expire; pooled_http_client() plugs it into gspread so
+# threaded workers can overlap Sheets calls.
+#
+# gspread is only imported once a worksheet is actually used; importing it
+# pulls in google-auth and requests, which workers should not pay for at boot.
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+def column_letter(index):
+    """Column letter for a 1-based column index, e.g. 1 -> A, 28 -> AB."""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def header_range(headers):
+    return f"A1:{column_letter(len(headers))}1"
+
+
+def sheet_range(worksheet_name, cells):
+    """A1 range qualified with a (quoted) worksheet title."""
+    return "'" + worksheet_name.replace("'", "''") + "'!" + cells
+
+
+def stale_headers(spreadsheet, worksheet_headers):
+    """Titles whose first row differs from the expected headers, read with one batched request.
+
+    `worksheet_headers` maps worksheet titles to header lists; the worksheets
+    must already exist.
+    """
+    names = list(worksheet_headers)
+    response = spreadsheet.values_batch_get(
+        [sheet_range(name, header_range(worksheet_headers[name])) for name in names]
+    )
+    value_ranges = response.get('valueRanges', [])
+    stale = []
+    for index, name in enumerate(names):
+        rows = value_ranges[index].get('values') if index < len(value_ranges) else None
+        if not rows or rows[0] != list(worksheet_headers[name]):
+            stale.append(name)
+    return stale
+
+
+def _is_missing_worksheet(error):
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    return status == 400 and 'Unable to parse range' in str(error)
+
+
+class WorksheetCache:
+    """Per-process cache of gspread Worksheet handles keyed by title.
+
+    `spreadsheet_getter` returns the current gspread Spreadsheet (or None when
+    Sheets is not initialized). A miss loads every worksheet with a single
+    metadata request, so one miss primes the Budget, Health and Quiz handles.
+    """
+
+    def __init__(self, spreadsheet_getter):
+        self._spreadsheet_getter = spreadsheet_getter
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._worksheets = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, name, headers=None):
+        """Return the worksheet handle, creating the worksheet if `headers` are given.
+
+        Misses take turns on a separate lock and fetch without holding the
+        cache lock, so a slow metadata request never delays cached lookups.
+        """
+        with self._lock:
+            worksheet = self._worksheets.get(name)
+            if worksheet is not None:
+                self.hits += 1
+                return worksheet
+        with self._fetch_lock:
+            with self._lock:
+                # The fetch this thread waited behind may have loaded it
+                worksheet = self._worksheets.get(name)
+                if worksheet is not None:
+                    self.hits += 1
+                    return worksheet
+                self.misses += 1
+                generation = self.invalidations
+            spreadsheet = self._spreadsheet_getter()
+            if spreadsheet is None:
+                raise RuntimeError("Google Sheets client not initialized.")
+            worksheets = {ws.title: ws for ws in spreadsheet.worksheets()}
+            worksheet = worksheets.get(name)
+            if worksheet is None:
+                if headers is None:
+                    import gspread
+                    raise gspread.exceptions.WorksheetNotFound(name)
+                worksheet = spreadsheet.add_worksheet(name, rows=100, cols=len(headers))
+                worksheet.update(values=[headers], range_name=header_range(headers))
+                logger.info(f"Created worksheet '{name}'.")
+                worksheets[name] = worksheet
+            with self._lock:
+                # Handles fetched before an invalidation serve this call but are not kept
+                if self.invalidations == generation:
+                    self._worksheets = worksheets
+            return worksheet
+
+    def invalidate(self, name=None):
+        with self._lock:
+            if name is None:
+                self._worksheets = {}
+            else:
+                self._worksheets.pop(name, None)
+            self.invalidations += 1
+
+    def call(self, name, operation, headers=None):
+        """Run operation(worksheet), refreshing the handle once if the worksheet has gone away."""
+        import gspread
+        try:
+            return operation(self.get(name, headers))
+        except gspread.exceptions.APIError as e:
+            if not _is_missing_worksheet(e):
+                raise
+            logger.warning(f"Cached worksheet '{name}' no longer exists; refreshing.")
+            self.invalidate(name)
+            return operation(self.get(name, headers))
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'cached': sorted(self._worksheets)
+            }
+
+
+class SessionPool:
+    """Fixed set of keep-alive HTTP sessions shared by threads, plus their credentials.
+
+    `session_factory()` returns a new requests Session (an AuthorizedSession
+    over `credentials` in production). `credentials`, when given, are shared
+    by every session and refreshed by refresh_credentials() or the background
+    refresher once they are within `refresh_margin` seconds of expiring, which
+    is earlier than google-auth would refresh them inline.
+    """
+
+    def __init__(self, session_factory, size=4, credentials=None, refresh_margin=300):
+        self.size = size
+        self.credentials = credentials
+        self.refresh_margin = refresh_margin
+        # LIFO hands out the most recently used session, whose connection is warm
+        self._sessions = queue.LifoQueue()
+        for _ in range(size):
+            self._sessions.put(session_factory())
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._token_request = None
+        self._stop = threading.Event()
+        self._refresher = None
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.requests = 0
+        self.waits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @contextmanager
+    def session(self):
+        """Borrow a session for one request, waiting if all of them are busy."""
+        try:
+            session = self._sessions.get_nowait()
+            waited = False
+        except queue.Empty:
+            session = self._sessions.get()
+            waited = True
+        with self._lock:
+            self.requests += 1
+            self.waits += waited
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+        try:
+            yield session
+        finally:
+            with self._lock:
+                self.in_use -= 1
+            self._sessions.put(session)
+
+    def _expires_in(self):
+        expiry = getattr(self.credentials, 'expiry', None)
+        if expiry is None:
+            return None
+        # google-auth keeps expiry as a naive UTC datetime
+        return (expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+
+    def refresh_credentials(self, force=False):
+        """Refresh the shared token if forced, missing or about to expire; returns whether it did."""
+        if self.credentials is None:
+            return False
+        with self._refresh_lock:
+            expires_in = self._expires_in()
+            if not force and getattr(self.credentials, 'token', None) and (
+                    expires_in is None or expires_in > self.refresh_margin):
+                return False
+            if self._token_request is None:
+                # A plain session: the pooled ones would try to authorize the token request itself
+                from google.auth.transport.requests import Request
+                self._token_request = Request()
+            try:
+                self.credentials.refresh(self._token_request)
+            except Exception:
+                self.refresh_errors += 1
+                raise
+            self.refreshes += 1
+            return True
+
+    def start_refresher(self, interval=60):
+        """Check the token every `interval` seconds on a daemon thread."""
+        if self.credentials is None or self._refresher is not None:
+            return
+        self._refresher = threading.Thread(target=self._refresh_loop, args=(interval,),
+                                           name='sheets-token-refresh', daemon=True)
+        self._refresher.start()
+
+    def _refresh_loop(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                if self.refresh_credentials():
+                    logger.info("Refreshed Google Sheets access token.")
+            except Exception as e:
+                logger.error(f"Error refreshing Google Sheets access token: {e}")
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        with self._lock:
+            expires_in = self._expires_in()
+            return {
+                'size': self.size,
+                'in_use': self.in_use,
+                'peak_in_use': self.peak_in_use,
+                'requests': self.requests,
+                'waits': self.waits,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'token_expires_in': round(expires_in) if expires_in is not None else None
+            }
+
+
+_pooled_http_client = None
+
+
+def pooled_http_client():
+    """gspread HTTPClient class that sends each request on a session borrowed from a SessionPool.
+
+    Pass it as `http_client` with the pool as `session`, e.g.
+    gspread.authorize(credentials, http_client=pooled_http_client(), session=pool).
+    """
+    global _pooled_http_client
+    if _pooled_http_client is None:
+        from gspread.exceptions import APIError
+        from gspread.http_client import HTTPClient
+
+        class PooledHTTPClient(HTTPClient):
+            def __init__(self, auth, session):
+                self.auth = auth
+                self.pool = session
+                self.timeout = None
+
+            def login(self):
+                self.pool.refresh_credentials(force=True)
+
+            def request(self, method, endpoint, params=None, data=None, json=None, files=None, headers=None):
+                with self.pool.session() as session:
+                    response = session.request(method=method, url=endpoint, json=json, params=params, data=data,
+                                               files=files, headers=headers, timeout=self.timeout)
+                if response.ok:
+                    return response
+                raise APIError(response)
+
+        _pooled_http_client = PooledHTTPClient
+    return _pooled_http_client
@@ -0,0 +1,275 @@
+# sheets_journal.py
+# Durable write-behind journal for Google Sheets appends.
+#
+# Request handlers record each row in a local SQLite journal and return
+# immediately; a background flusher in every worker drains the journal into
+# the worksheets with retry and backoff. Rows are claimed with a lease so
+# several gunicorn workers can share one journal file. Delivery is
+# at-least-once: a worker that dies mid-append may cause that row to be sent
+# again once its lease expires.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_DELIVERED = 'delivered'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    worksheet TEXT NOT NULL,
+    row TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    delivered_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS journal_status_due ON journal (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS journal_worksheet_status ON journal (worksheet, status);
+"""
+
+
+def _json_default(value):
+    # numpy scalars (e.g. values taken from a DataFrame row) expose item()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class SheetsJournal:
+    """SQLite-backed queue of rows waiting to be appended to a worksheet."""
+
+    def __init__(self, path, lease_seconds=60, max_backoff=300):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_backoff = max_backoff
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            # FULL syncs the WAL on every commit so an accepted row survives
+            # a crash or power loss, not just a worker restart.
+            conn.execute('PRAGMA synchronous=FULL')
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, worksheet_name, row):
+        now = time.time()
+        cursor = self._connect().execute(
+            'INSERT INTO journal (worksheet, row, created_at, next_attempt_at) VALUES (?, ?, ?, ?)',
+            (worksheet_name, json.dumps(list(row), default=_json_default), now, now)
+        )
+        return cursor.lastrowid
+
+    def claim(self, limit=50, worksheet_name=None):
+        """Lease up to `limit` due rows, oldest first, as (id, worksheet, row) tuples."""
+        conn = self._connect()
+        now = time.time()
+        query = ('SELECT id, worksheet, row FROM journal '
+                 'WHERE status = ? AND next_attempt_at <= ? AND claimed_until <= ?')
+        params = [STATUS_PENDING, now, now]
+        if worksheet_name is not None:
+            query += ' AND worksheet = ?'
+            params.append(worksheet_name)
+        query += ' ORDER BY id LIMIT ?'
+        params.append(limit)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = conn.execute(query, params).fetchall()
+            conn.executemany(
+                'UPDATE journal SET claimed_until = ? WHERE id = ?',
+                [(now + self.lease_seconds, row_id) for row_id, _, _ in rows]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return [(row_id, worksheet, json.loads(row)) for row_id, worksheet, row in rows]
+
+    def ready_worksheets(self, batch_size, max_linger):
+        """Map each worksheet that should be flushed now to the number of rows to send.
+
+        Only full batches are sent unless the oldest due row has waited
+        `max_linger` seconds, in which case the partial batch goes too.
+        """
+        now = time.time()
+        rows = self._connect().execute(
+            'SELECT worksheet, COUNT(*), MIN(created_at) FROM journal '
+            'WHERE status = ? AND next_attempt_at <= ? AND claimed_until <= ? GROUP BY worksheet',
+            (STATUS_PENDING, now, now)
+        ).fetchall()
+        ready = {}
+        for worksheet, count, oldest in rows:
+            sendable = count if now - oldest >= max_linger else count - count % batch_size
+            if sendable:
+                ready[worksheet] = sendable
+        return ready
+
+    def mark_delivered(self, ids):
+        now = time.time()
+        self._connect().executemany(
+            'UPDATE journal SET status = ?, delivered_at = ?, claimed_until = 0, last_error = NULL WHERE id = ?',
+            [(STATUS_DELIVERED, now, row_id) for row_id in ids]
+        )
+
+    def mark_failed(self, ids, error):
+        conn = self._connect()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for row_id in ids:
+                attempts = conn.execute('SELECT attempts FROM journal WHERE id = ?', (row_id,)).fetchone()
+                attempts = (attempts[0] if attempts else 0) + 1
+                delay = min(self.max_backoff, 2 ** attempts)
+                conn.execute(
+                    'UPDATE journal SET attempts = ?, next_attempt_at = ?, claimed_until = 0, last_error = ? WHERE id = ?',
+                    (attempts, now + delay, str(error)[:500], row_id)
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def undelivered_rows(self, worksheet_name, delivered_since=None):
+        """Rows not yet visible in the sheet snapshot, oldest first.
+
+        Pending rows are always returned; rows delivered at or after
+        `delivered_since` are included too, so a caller can cover the window
+        between delivery and its next refresh of the sheet.
+        """
+        query = 'SELECT row FROM journal WHERE worksheet = ? AND (status = ?'
+        params = [worksheet_name, STATUS_PENDING]
+        if delivered_since is not None:
+            query += ' OR delivered_at >= ?'
+            params.append(delivered_since)
+        query += ') ORDER BY id'
+        return [json.loads(row) for (row,) in self._connect().execute(query, params)]
+
+    def purge_delivered(self, older_than_seconds=86400):
+        cursor = self._connect().execute(
+            'DELETE FROM journal WHERE status = ? AND delivered_at < ?',
+            (STATUS_DELIVERED, time.time() - older_than_seconds)
+        )
+        return cursor.rowcount
+
+    def stats(self):
+        conn = self._connect()
+        now = time.time()
+        by_worksheet = {}
+        for worksheet, status, count in conn.execute(
+                'SELECT worksheet, status, COUNT(*) FROM journal GROUP BY worksheet, status'):
+            by_worksheet.setdefault(worksheet, {STATUS_PENDING: 0, STATUS_DELIVERED: 0})[status] = count
+        pending, retrying, oldest = conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(attempts > 0), 0), MIN(created_at) FROM journal WHERE status = ?',
+            (STATUS_PENDING,)
+        ).fetchone()
+        last_delivered = conn.execute(
+            'SELECT MAX(delivered_at) FROM journal WHERE status = ?', (STATUS_DELIVERED,)
+        ).fetchone()[0]
+        last_error = conn.execute(
+            'SELECT last_error FROM journal WHERE status = ? AND last_error IS NOT NULL ORDER BY id DESC LIMIT 1',
+            (STATUS_PENDING,)
+        ).fetchone()
+        return {
+            'backlog': pending,
+            'retrying': retrying,
+            'oldest_pending_age': round(now - oldest, 3) if oldest else 0.0,
+            'last_delivered_at': last_delivered,
+            'last_error': last_error[0] if last_error else None,
+            'worksheets': by_worksheet
+        }
+
+
+class JournalFlusher(threading.Thread):
+    """Background thread that drains a SheetsJournal into Google Sheets.
+
+    Pending rows are coalesced per worksheet: a worksheet is flushed once it
+    has `batch_size` rows due or its oldest due row has waited `max_linger`
+    seconds, and each flush sends up to `batch_size` rows in one call.
+
+    `deliver(worksheet_name, rows)` appends the rows and raises on failure.
+    `on_delivered(worksheet_names)` is called after rows are marked delivered.
+    """
+
+    def __init__(self, journal, deliver, on_delivered=None, batch_size=50, max_linger=2.0,
+                 interval=1.0, purge_after=86400):
+        super().__init__(name='sheets-journal-flusher', daemon=True)
+        self.journal = journal
+        self.deliver = deliver
+        self.on_delivered = on_delivered
+        self.batch_size = batch_size
+        self.max_linger = max_linger
+        self.interval = min(interval, max_linger) if max_linger > 0 else interval
+        self.purge_after = purge_after
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._last_purge = 0.0
+
+    def notify(self):
+        """Wake the flusher early, e.g. right after a row is enqueued."""
+        self._wake.set()
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        self._wake.set()
+        self.join(timeout)
+
+    def flush_once(self, force=False):
+        """Deliver every batch that is currently due; returns the number of rows delivered.
+
+        `force` ignores the linger time and flushes partial batches as well.
+        """
+        delivered = 0
+        linger = 0 if force else self.max_linger
+        touched = set()
+        for worksheet_name, sendable in self.journal.ready_worksheets(self.batch_size, linger).items():
+            while sendable > 0:
+                claimed = self.journal.claim(limit=min(self.batch_size, sendable), worksheet_name=worksheet_name)
+                if not claimed:
+                    break
+                ids = [row_id for row_id, _, _ in claimed]
+                try:
+                    self.deliver(worksheet_name, [row for _, _, row in claimed])
+                except Exception as e:
+                    logger.error(f"Failed to deliver {len(ids)} journal rows to '{worksheet_name}': {e}")
+                    self.journal.mark_failed(ids, e)
+                    break
+                self.journal.mark_delivered(ids)
+                touched.add(worksheet_name)
+                delivered += len(ids)
+                sendable -= len(ids)
+        if touched and self.on_delivered is not None:
+            try:
+                self.on_delivered(touched)
+            except Exception as e:
+                logger.error(f"Journal on_delivered callback failed: {e}")
+        return delivered
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                self.flush_once()
+                if time.time() - self._last_purge > 3600:
+                    self.journal.purge_delivered(self.purge_after)
+                    self._last_purge = time.time()
+            except Exception as e:
+                logger.error(f"Sheets journal flusher error: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
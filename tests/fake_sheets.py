@@ -0,0 +1,260 @@
+# Local stand-in for the subset of the Google Sheets v4 API that the app
+# uses, for benchmarks and stress tests. It counts every request so callers
+# can assert on API usage, and `connect()` returns a real gspread client whose
+# HTTPS traffic to sheets.googleapis.com is redirected to this server.
+
+import json
+import re
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+import gspread
+import requests
+from requests.adapters import HTTPAdapter
+
+SHEETS_HOST = 'https://sheets.googleapis.com'
+
+_CELL = re.compile(r'^([A-Z]*)(\d*)$')
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - 64)
+    return index
+
+
+def _parse_range(label):
+    """Split an A1 range such as "'Health'!A5:N" into (title, start_row, start_col, end_row, end_col)."""
+    if '!' in label:
+        title, cells = label.rsplit('!', 1)
+    else:
+        title, cells = label, ''
+    title = title.strip("'").replace("''", "'")
+    start_row, start_col, end_row, end_col = 1, 1, None, None
+    if cells:
+        first, _, last = cells.partition(':')
+        letters, digits = _CELL.match(first).groups()
+        start_col = _column_index(letters) if letters else 1
+        start_row = int(digits) if digits else 1
+        if last:
+            letters, digits = _CELL.match(last).groups()
+            end_col = _column_index(letters) if letters else None
+            end_row = int(digits) if digits else None
+        else:
+            end_row, end_col = start_row, start_col
+    return title, start_row, start_col, end_row, end_col
+
+
+def _formatted(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    return str(value)
+
+
+class FakeSpreadsheetState:
+    def __init__(self, spreadsheet_id, titles=()):
+        self.spreadsheet_id = spreadsheet_id
+        self.lock = threading.Lock()
+        self.sheets = {}
+        self.calls = {}
+        for title in titles:
+            self.add_sheet(title)
+
+    def add_sheet(self, title, rows=100, cols=26):
+        properties = {
+            'sheetId': len(self.sheets) + 1,
+            'title': title,
+            'index': len(self.sheets),
+            'sheetType': 'GRID',
+            'gridProperties': {'rowCount': rows, 'columnCount': cols}
+        }
+        self.sheets[title] = {'properties': properties, 'rows': []}
+        return properties
+
+    def total_calls(self):
+        with self.lock:
+            return sum(self.calls.values())
+
+    def metadata(self):
+        return {
+            'spreadsheetId': self.spreadsheet_id,
+            'properties': {'title': 'Fake Ficore', 'locale': 'en_US', 'timeZone': 'Africa/Lagos'},
+            'sheets': [{'properties': dict(sheet['properties'])} for sheet in self.sheets.values()]
+        }
+
+    def get_values(self, label):
+        title, start_row, start_col, end_row, end_col = _parse_range(label)
+        rows = self.sheets[title]['rows']
+        selected = rows[start_row - 1:end_row] if end_row else rows[start_row - 1:]
+        values = []
+        for row in selected:
+            cells = row[start_col - 1:end_col] if end_col else row[start_col - 1:]
+            values.append([_formatted(cell) for cell in cells])
+        while values and not any(values[-1]):
+            values.pop()
+        result = {'range': label, 'majorDimension': 'ROWS'}
+        if values:
+            result['values'] = values
+        return result
+
+    def update_values(self, label, values):
+        title, start_row, start_col, _, _ = _parse_range(label)
+        rows = self.sheets[title]['rows']
+        for offset, new_row in enumerate(values):
+            index = start_row - 1 + offset
+            while len(rows) <= index:
+                rows.append([])
+            row = rows[index]
+            needed = start_col - 1 + len(new_row)
+            if len(row) < needed:
+                row.extend([''] * (needed - len(row)))
+            row[start_col - 1:needed] = new_row
+        return {'updatedRange': label, 'updatedRows': len(values)}
+
+    def append_values(self, label, values):
+        title = _parse_range(label)[0]
+        rows = self.sheets[title]['rows']
+        start = len(rows) + 1
+        rows.extend(list(row) for row in values)
+        return {'updates': {'updatedRange': f"'{title}'!A{start}", 'updatedRows': len(values)}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; without NODELAY every
+        # response would stall on delayed ACKs.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload, status=200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def _route(self, method):
+        state = self.server.state
+        path = urlsplit(self.path).path
+        prefix = f"/v4/spreadsheets/{state.spreadsheet_id}"
+        if not path.startswith(prefix):
+            return self._reply({'error': {'code': 404, 'message': 'Not found'}}, 404)
+        rest = path[len(prefix):]
+        if self.server.latency:
+            threading.Event().wait(self.server.latency)
+        body = self._body() if method in ('POST', 'PUT') else None
+        with state.lock:
+            if method == 'GET' and rest == '':
+                name, payload = 'metadata', state.metadata()
+            elif method == 'GET' and rest == '/values:batchGet':
+                query = urlsplit(self.path).query
+                labels = [unquote(part[len('ranges='):]).replace('+', ' ')
+                          for part in query.split('&') if part.startswith('ranges=')]
+                name, payload = 'values_batch_get', {'valueRanges': [state.get_values(label) for label in labels]}
+            elif method == 'GET' and rest.startswith('/values/'):
+                name, payload = 'values_get', state.get_values(unquote(rest[len('/values/'):]))
+            elif method == 'PUT' and rest.startswith('/values/'):
+                name, payload = 'values_update', state.update_values(unquote(rest[len('/values/'):]), body.get('values', []))
+            elif method == 'POST' and rest.startswith('/values/') and rest.endswith(':append'):
+                label = unquote(rest[len('/values/'):-len(':append')])
+                name, payload = 'values_append', state.append_values(label, body.get('values', []))
+            elif method == 'POST' and rest == ':batchUpdate':
+                replies = []
+                for request in body.get('requests', []):
+                    properties = request['addSheet']['properties']
+                    grid = properties.get('gridProperties', {})
+                    replies.append({'addSheet': {'properties': state.add_sheet(
+                        properties['title'], grid.get('rowCount', 100), grid.get('columnCount', 26))}})
+                name, payload = 'batch_update', {'spreadsheetId': state.spreadsheet_id, 'replies': replies}
+            else:
+                return self._reply({'error': {'code': 400, 'message': f"Unsupported {method} {rest}"}}, 400)
+            state.calls[name] = state.calls.get(name, 0) + 1
+        self._reply(payload)
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_PUT(self):
+        self._route('PUT')
+
+    def do_POST(self):
+        self._route('POST')
+
+
+class _RedirectAdapter(HTTPAdapter):
+    """Send requests addressed to sheets.googleapis.com to the local server."""
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        request.url = self.base_url + request.url[len(SHEETS_HOST):]
+        return super().send(request, **kwargs)
+
+
+class FakeSheetsServer:
+    """Threaded HTTP server emulating one spreadsheet.
+
+    `latency` adds a fixed delay to every request to mimic network round trips.
+    """
+
+    def __init__(self, spreadsheet_id='fake-spreadsheet', titles=('Budget', 'Health', 'Quiz'), latency=0.0):
+        self.state = FakeSpreadsheetState(spreadsheet_id, titles)
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.state = self.state
+        self._server.latency = latency
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def session(self, pool_maxsize=10):
+        session = requests.Session()
+        session.mount(SHEETS_HOST, _RedirectAdapter(self.base_url, pool_maxsize=pool_maxsize))
+        return session
+
+    def connect(self, session=None):
+        """Return a gspread Spreadsheet bound to this server."""
+        client = gspread.Client(auth=None, session=session or self.session())
+        return client.open_by_key(self.state.spreadsheet_id)
+
+    def rows(self, title):
+        with self.state.lock:
+            return [list(row) for row in self.state.sheets[title]['rows']]
+
+    def reset_calls(self):
+        with self.state.lock:
+            self.state.calls.clear()
@@ -0,0 +1,111 @@
+# Local SMTP stand-in for tests and benchmarks. It speaks enough of the
+# protocol for smtplib (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT),
+# records every message and counts connections. `connect_latency` delays the
+# greeting to mimic the TCP + TLS + AUTH cost of opening a real session, and
+# drop_connections() closes every open session to simulate a server restart.
+
+import socket
+import socketserver
+import threading
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server.owner
+        with server.lock:
+            server.connections += 1
+            server.open_sockets.add(self.connection)
+        try:
+            if server.connect_latency:
+                threading.Event().wait(server.connect_latency)
+            self._reply('220 fake-smtp ready')
+            sender, recipients = None, []
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                command = line.decode('ascii', 'replace').strip()
+                verb = command[:4].upper()
+                if verb == 'EHLO':
+                    self._reply('250-fake-smtp', '250 8BITMIME')
+                elif verb == 'HELO':
+                    self._reply('250 fake-smtp')
+                elif verb == 'MAIL':
+                    sender, recipients = command[10:].strip(), []
+                    self._reply('250 OK')
+                elif verb == 'RCPT':
+                    recipients.append(command[8:].strip())
+                    self._reply('250 OK')
+                elif verb == 'DATA':
+                    self._reply('354 End data with <CR><LF>.<CR><LF>')
+                    body = []
+                    for data in iter(self.rfile.readline, b''):
+                        if data in (b'.\r\n', b'.\n'):
+                            break
+                        body.append(data[1:] if data.startswith(b'..') else data)
+                    with server.lock:
+                        server.messages.append((sender, recipients, b''.join(body)))
+                    self._reply('250 OK queued')
+                elif verb == 'RSET':
+                    sender, recipients = None, []
+                    self._reply('250 OK')
+                elif verb == 'NOOP':
+                    self._reply('250 OK')
+                elif verb == 'QUIT':
+                    self._reply('221 Bye')
+                    return
+                else:
+                    self._reply('502 Command not implemented')
+        except OSError:
+            return
+        finally:
+            with server.lock:
+                server.open_sockets.discard(self.connection)
+
+    def _reply(self, *lines):
+        self.wfile.write(''.join(f'{line}\r\n' for line in lines).encode('ascii'))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeSMTPServer:
+    def __init__(self, connect_latency=0.0):
+        self.connect_latency = connect_latency
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = []
+        self.open_sockets = set()
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.drop_connections()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def drop_connections(self):
+        with self.lock:
+            sockets = list(self.open_sockets)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
@@ -0,0 +1,60 @@
+# Row-wise scoring as it was implemented in app.py before scoring.py, kept as
+# the reference for equivalence tests and benchmarks.
+
+import pandas as pd
+
+
+def legacy_health_score(df, course_urls):
+    for col in ['income_revenue', 'expenses_costs', 'debt_loan', 'debt_interest_rate']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+    df['IncomeRevenueSafe'] = df['income_revenue'].replace(0, 1e-10)
+    df['CashFlowRatio'] = (df['income_revenue'] - df['expenses_costs']) / df['IncomeRevenueSafe']
+    df['DebtToIncomeRatio'] = df['debt_loan'] / df['IncomeRevenueSafe']
+    df['DebtInterestBurden'] = df['debt_interest_rate'].clip(lower=0) / 20
+    df['DebtInterestBurden'] = df['DebtInterestBurden'].clip(upper=1)
+    df['NormCashFlow'] = df['CashFlowRatio'].clip(0, 1)
+    df['NormDebtToIncome'] = 1 - df['DebtToIncomeRatio'].clip(0, 1)
+    df['NormDebtInterest'] = 1 - df['DebtInterestBurden']
+    df['HealthScore'] = (
+        df['NormCashFlow'] * 0.333 +
+        df['NormDebtToIncome'] * 0.333 +
+        df['NormDebtInterest'] * 0.333
+    ) * 100
+    df['HealthScore'] = df['HealthScore'].round(2)
+
+    def score_description_and_course(row):
+        score = row['HealthScore']
+        cash_flow = row['CashFlowRatio']
+        debt_interest = row['DebtInterestBurden']
+        if score >= 75:
+            return ('Stable Income; invest excess now', 'Ficore Simplified Investing Course', course_urls['investing'])
+        elif score >= 50:
+            if cash_flow < 0.3 or debt_interest > 0.5:
+                return ('At Risk; manage your expense!', 'Ficore Debt and Expense Management', course_urls['debt'])
+            return ('Moderate; save something monthly!', 'Ficore Savings Mastery', course_urls['savings'])
+        elif score >= 25:
+            return ('At Risk; manage your expense!', 'Ficore Debt and Expense Management', course_urls['debt'])
+        else:
+            return ('Critical; seek financial help!', 'Ficore Financial Recovery', course_urls['recovery'])
+
+    df[['ScoreDescription', 'CourseTitle', 'CourseURL']] = df.apply(
+        score_description_and_course, axis=1, result_type='expand'
+    )
+    return df
+
+
+def legacy_budget_metrics(df, get_translations):
+    for col in ['monthly_income', 'housing_expenses', 'food_expenses', 'transport_expenses', 'other_expenses', 'savings_goal']:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0)
+    df['total_expenses'] = df['housing_expenses'] + df['food_expenses'] + df['transport_expenses'] + df['other_expenses']
+    df['savings'] = df.apply(
+        lambda row: max(0, row['monthly_income'] * 0.1) if pd.isna(row['savings_goal']) or row['savings_goal'] == 0 else row['savings_goal'],
+        axis=1
+    )
+    df['surplus_deficit'] = df['monthly_income'] - df['total_expenses'] - df['savings']
+    df['outcome_status'] = df['surplus_deficit'].apply(lambda x: 'Savings' if x >= 0 else 'Overspend')
+    df['advice'] = df['surplus_deficit'].apply(
+        lambda x: get_translations(df['language'].iloc[0])['Great job! Save or invest your surplus to grow your wealth.'] if x >= 0
+        else get_translations(df['language'].iloc[0])['Reduce non-essential spending to balance your budget.']
+    )
+    return df
@@ -1,6 +1,13 @@
+import os
+import re
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
-from app import app, calculate_health_score
+import app as app_module
+from app import app, calculate_health_score, PREDETERMINED_HEADERS_HEALTH
+from rank_service import ScoreRanks, VersionedRanks
+from sheets_journal import SheetsJournal
 import pandas as pd
 
 def test_quiz_navigation(client):
@@ -90,6 +97,116 @@ class TestFicoreApp(unittest.TestCase):
         self.assertIn('Badges', result.columns)
         self.assertTrue(isinstance(result['Badges'].iloc[0], str))
 
+def fake_sheet(email=None, headers=None, worksheet_name=None):
+    if worksheet_name == 'Health' and email:
+        row = ['2025-01-01 10:00:00', 'Biz', '1000', '500', '100', '5', 'false', '', 'Ada', '', 'SME', email, '', 'en']
+        return pd.DataFrame([row], columns=PREDETERMINED_HEADERS_HEALTH)
+    return pd.DataFrame(columns=headers)
+
+@patch('app.get_score_ranks', return_value=ScoreRanks([45.0, 60.0, 75.0]))
+@patch('app.queue_email')
+@patch('app.append_to_sheet', return_value=True)
+@patch('app.fetch_data_from_sheet', side_effect=fake_sheet)
+class TestSessionCookieSize(unittest.TestCase):
+    """Each flow's largest session cookie stays well below the 4 KB browser limit."""
+    MAX_COOKIE_BYTES = 640
+
+    def setUp(self):
+        app.testing = True
+        self.client = app.test_client()
+        self.sizes = []
+
+    def post(self, url, data):
+        page = self.client.get(url).get_data(as_text=True)
+        token = re.search(r'name="csrf_token"[^>]*value="([^"]+)"', page)
+        response = self.client.post(url, data=dict(data, csrf_token=token.group(1) if token else ''))
+        self.record()
+        return response
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.record()
+        return response
+
+    def record(self):
+        cookie = self.client.get_cookie(app.config['SESSION_COOKIE_NAME'])
+        self.sizes.append(len(cookie.value) if cookie else 0)
+
+    def test_health_flow(self, *mocks):
+        self.post('/health_score_step1', {'first_name': 'Ada', 'email': 'ada@example.com', 'language': 'en'})
+        self.post('/health_score_step2', {'business_name': 'Biz', 'user_type': 'SME'})
+        response = self.post('/health_score_step3', {'income_revenue': '1000', 'expenses_costs': '500',
+                                                     'debt_loan': '100', 'debt_interest_rate': '5'})
+        self.assertIn('/health_dashboard', response.headers['Location'])
+        for step in range(1, 7):
+            self.assertEqual(self.get(f'/health_dashboard?step={step}').status_code, 200)
+        self.assertLess(max(self.sizes), self.MAX_COOKIE_BYTES)
+
+    def test_budget_flow(self, *mocks):
+        self.post('/budget_step1', {'first_name': 'Ada', 'email': 'ada@example.com', 'language': 'en'})
+        self.post('/budget_step2', {'monthly_income': '1000'})
+        self.post('/budget_step3', {'housing_expenses': '100', 'food_expenses': '100',
+                                    'transport_expenses': '100', 'other_expenses': '100'})
+        self.post('/budget_step4', {'savings_goal': '50'})
+        self.assertEqual(self.get('/budget_dashboard').status_code, 200)
+        self.assertLess(max(self.sizes), self.MAX_COOKIE_BYTES)
+
+    def test_quiz_flow(self, *mocks):
+        for step, questions in ((1, range(1, 5)), (2, range(5, 8)), (3, range(8, 11))):
+            data = {f'question_{i}': 'Yes' for i in questions}
+            data.update(submit='Next', language='en', first_name='Ada', email='ada@example.com')
+            self.post(f'/quiz_step{step}', data)
+        response = self.get('/quiz_results')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'Do you save regularly?', response.data)
+        self.assertLess(max(self.sizes), self.MAX_COOKIE_BYTES)
+
+class TestSheetsUnavailable(unittest.TestCase):
+    """Submissions are served from the replica while Google Sheets cannot be reached."""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        replica_path = os.path.join(directory, 'replica.db')
+        with patch('app.SHEETS_REPLICA_PATH', replica_path):
+            mirrors = {name: app_module._make_mirror(name) for name in app_module.WORKSHEET_HEADERS}
+        for patcher in (patch('app.get_sheets_client', return_value=None),
+                        patch('app.sheets_journal', SheetsJournal(os.path.join(directory, 'journal.db'))),
+                        patch.dict('app.sheet_mirrors', mirrors),
+                        patch.dict('app.score_ranks', {'Health': VersionedRanks(), 'Budget': VersionedRanks()}),
+                        patch.dict(app.config, {'WTF_CSRF_ENABLED': False})):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        app.testing = True
+        self.client = app.test_client()
+
+    @patch('app.queue_email')
+    def test_health_flow_reads_its_own_submission(self, queue_email):
+        self.client.post('/health_score_step1', data={'first_name': 'Ada', 'email': 'ada@example.com',
+                                                      'language': 'en', 'auto_email': 'y'})
+        self.client.post('/health_score_step2', data={'business_name': 'Biz', 'user_type': 'SME'})
+        response = self.client.post('/health_score_step3', data={'income_revenue': '1000', 'expenses_costs': '500',
+                                                                 'debt_loan': '100', 'debt_interest_rate': '5'})
+        self.assertIn('/health_dashboard', response.headers['Location'])
+        self.assertEqual(queue_email.call_args.kwargs['rank'], 1)
+        self.assertEqual(queue_email.call_args.kwargs['total_users'], 1)
+        response = self.client.get('/health_dashboard?step=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(b'Error retrieving data', response.data)
+
+class TestStatusEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.client = app.test_client()
+
+    def test_hidden_without_matching_token(self):
+        self.assertEqual(self.client.get('/email_status').status_code, 404)
+        with patch('app.STATUS_TOKEN', 's3cret'):
+            self.assertEqual(self.client.get('/email_status').status_code, 404)
+            self.assertEqual(self.client.get('/email_status', headers={'X-Status-Token': 'wrong'}).status_code, 404)
+            response = self.client.get('/chart_status', headers={'X-Status-Token': 's3cret'})
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('hit_rate', response.get_json())
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,63 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from batch_score import main, run
+from scoring import COURSE_URLS, budget_metrics, score_health
+from tests.test_scoring import budget_frame, health_frame
+from translations import get_translations
+
+
+class TestBatchScore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir, name)
+
+    def read_csv(self, name):
+        return pd.read_csv(self.path(name), dtype=str, keep_default_na=False)
+
+    def test_health_csv_in_chunks_matches_whole_frame(self):
+        health_frame(503).to_csv(self.path('health.csv'), index=False)
+        expected = score_health(self.read_csv('health.csv'), COURSE_URLS)
+        for workers in (0, 2):
+            rows, _ = run('health', self.path('health.csv'), self.path('out.csv'), chunk_size=50, workers=workers)
+            self.assertEqual(rows, 503)
+            actual = pd.read_csv(self.path('out.csv'))
+            self.assertEqual(list(actual.columns), list(expected.columns))
+            pd.testing.assert_series_equal(actual['HealthScore'], expected['HealthScore'], check_dtype=False)
+            self.assertEqual(list(actual['CourseURL']), list(expected['CourseURL']))
+
+    def test_budget_ndjson_localizes_advice_per_row(self):
+        df = pd.concat([budget_frame(40, 'en'), budget_frame(40, 'ha', seed=3)]).sample(frac=1, random_state=0)
+        # Records with a null or blank language are scored in English
+        df['language'] = df['language'].astype(object)
+        df.iloc[[0, 5, 9], df.columns.get_loc('language')] = [None, '', None]
+        df.to_json(self.path('budget.ndjson'), orient='records', lines=True)
+        self.assertEqual(main(['budget', self.path('budget.ndjson'), self.path('out.ndjson'),
+                               '--chunk-size', '7', '--quiet']), 0)
+        with open(self.path('out.ndjson'), encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 80)
+        for record, (_, row) in zip(records, df.iterrows()):
+            row['language'] = row['language'] or 'en'
+            expected = budget_metrics(row.to_frame().T.reset_index(drop=True), get_translations).iloc[0]
+            self.assertEqual(record['language'], row['language'])
+            self.assertAlmostEqual(record['surplus_deficit'], expected['surplus_deficit'])
+            self.assertEqual(record['advice'], expected['advice'])
+
+    def test_ndjson_to_csv(self):
+        health_frame(20).to_json(self.path('health.jsonl'), orient='records', lines=True)
+        rows, _ = run('health', self.path('health.jsonl'), self.path('out.csv'), chunk_size=6)
+        self.assertEqual(rows, 20)
+        self.assertEqual(len(pd.read_csv(self.path('out.csv'))), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
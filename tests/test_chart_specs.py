@@ -0,0 +1,61 @@
+import json
+import unittest
+import numpy as np
+from chart_specs import ChartCache, bar_spec
+
+
+class TestBarSpec(unittest.TestCase):
+    def test_numpy_values_serialize(self):
+        spec = bar_spec(['Your Score', 'Average Peer Score'], [np.int64(68), np.float64(55.123456)],
+                        'How Your Score Compares', 'Score Type', 'Score')
+        decoded = json.loads(json.dumps(spec))
+        self.assertEqual(decoded['data'][0]['y'], [68.0, 55.1235])
+        self.assertEqual(decoded['layout']['xaxis']['title']['text'], 'Score Type')
+        self.assertEqual(decoded['layout']['height'], 300)
+
+    def test_non_finite_values_become_null(self):
+        spec = bar_spec(['A', 'B'], [float('nan'), 1], 'T', 'x', 'y')
+        self.assertEqual(spec['data'][0]['y'], [None, 1.0])
+
+
+class TestChartCache(unittest.TestCase):
+    def test_hits_reuse_the_fragment(self):
+        cache = ChartCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return bar_spec(["Tom's <b>"], [1], 'T', 'x', 'y')
+
+        first = cache.get(('comparison', 'en', 60.0, 55.0), build)
+        second = cache.get(('comparison', 'en', 60.0, 55.0), build)
+        self.assertIs(first, second)
+        self.assertEqual(len(builds), 1)
+        self.assertNotIn("'", first)
+        self.assertNotIn('<', first)
+        self.assertEqual(json.loads(first)['data'][0]['x'], ["Tom's <b>"])
+        self.assertEqual(cache.stats()['hit_rate'], 0.5)
+
+    def test_evicts_least_recently_used_by_size(self):
+        spec = lambda score: bar_spec(['Your Score'], [score], 'T', 'x', 'y')
+        size = len(ChartCache().get(1, lambda: spec(1)))
+        cache = ChartCache(max_bytes=size * 2 + size // 2)
+        cache.get(1, lambda: spec(1))
+        cache.get(2, lambda: spec(2))
+        cache.get(1, lambda: spec(1))
+        cache.get(3, lambda: spec(3))
+        stats = cache.stats()
+        self.assertEqual((stats['entries'], stats['evictions']), (2, 1))
+        self.assertLessEqual(stats['bytes'], cache.max_bytes)
+        cache.get(1, lambda: spec(1))
+        cache.get(2, lambda: spec(2))
+        self.assertEqual(cache.stats()['misses'], 4)
+
+    def test_missing_chart_is_not_cached(self):
+        cache = ChartCache()
+        self.assertIsNone(cache.get('none', lambda: None))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
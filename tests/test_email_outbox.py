@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from email_outbox import EmailOutbox, EmailWorkerPool
+
+
+class TestEmailOutbox(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir)
+        self.outbox = EmailOutbox(os.path.join(self.workdir, 'outbox.db'), max_attempts=2)
+
+    def test_send_once_delivers_oldest_first(self):
+        self.outbox.enqueue('health', {'to_email': 'a@example.com', 'health_score': 71.5})
+        self.outbox.enqueue('quiz', {'to_email': 'b@example.com'})
+        sent = []
+        pool = EmailWorkerPool(self.outbox, lambda kind, payload: sent.append((kind, payload)))
+        self.assertTrue(pool.send_once())
+        self.assertTrue(pool.send_once())
+        self.assertFalse(pool.send_once())
+        self.assertEqual(sent, [('health', {'to_email': 'a@example.com', 'health_score': 71.5}),
+                                ('quiz', {'to_email': 'b@example.com'})])
+        stats = pool.stats()
+        self.assertEqual((stats['queue_depth'], stats['sent']), (0, 2))
+        self.assertIsNotNone(stats['send_seconds']['p95'])
+
+    def test_failures_back_off_then_give_up(self):
+        self.outbox.enqueue('budget', {'to_email': 'c@example.com'})
+
+        def fail(kind, payload):
+            raise ConnectionError('smtp down')
+
+        pool = EmailWorkerPool(self.outbox, fail)
+        self.assertTrue(pool.send_once())
+        stats = self.outbox.stats()
+        self.assertEqual((stats['queue_depth'], stats['retrying']), (1, 1))
+        self.assertIn('smtp down', stats['last_error'])
+        # Backoff keeps it from being claimed straight away
+        self.assertEqual(self.outbox.claim(), [])
+        self.outbox._connect().execute('UPDATE outbox SET next_attempt_at = 0')
+        self.assertTrue(pool.send_once())
+        stats = self.outbox.stats()
+        self.assertEqual((stats['queue_depth'], stats['failed']), (0, 1))
+
+    def test_pending_emails_survive_a_restart(self):
+        self.outbox.enqueue('quiz', {'to_email': 'd@example.com'})
+        reopened = EmailOutbox(self.outbox.path)
+        self.assertEqual([kind for _, kind, _, _ in reopened.claim()], ['quiz'])
+
+    def test_concurrency_is_bounded_by_worker_count(self):
+        for i in range(30):
+            self.outbox.enqueue('quiz', {'to_email': f'{i}@example.com'})
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def send(kind, payload):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.005)
+            with lock:
+                active[0] -= 1
+
+        pool = EmailWorkerPool(self.outbox, send, workers=3, interval=0.05)
+        pool.start()
+        self.addCleanup(pool.stop, 5)
+        for _ in range(30):
+            pool.notify()
+        deadline = time.time() + 10
+        while self.outbox.stats()['sent'] < 30 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.outbox.stats()['sent'], 30)
+        self.assertLessEqual(active[1], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from jinja2 import DictLoader, Environment
+from email_shells import EmailShells
+
+TEMPLATE = (
+    "<h1>{{ trans['Report'] }}</h1><p>{{ trans['Dear'] }} [[ user_name ]],</p>"
+    "[% if badges %]<ul>[% for badge in badges %]<li>[[ trans.get(badge, badge) ]]</li>[% endfor %]</ul>[% endif %]"
+    "<p>[[ amount | money ]]</p><a href=\"{{ link }}\">{{ trans['More'] }}</a>"
+)
+TRANSLATIONS = {
+    'en': {'Report': 'Report', 'Dear': 'Dear', 'More': 'More & more', 'Saver': 'Saver'},
+    'ha': {'Report': 'Rahoto', 'Dear': 'Masoyi', 'More': 'Kari', 'Saver': 'Mai ajiya'}
+}
+
+
+class TestEmailShells(unittest.TestCase):
+    def setUp(self):
+        self.built = []
+        env = Environment(loader=DictLoader({'report.html': TEMPLATE}), autoescape=True)
+
+        def shared(language):
+            self.built.append(language)
+            return {'trans': TRANSLATIONS[language], 'link': '/more?a=1&b=2'}
+
+        self.shells = EmailShells(env, shared, filters={'money': lambda value: f'N{value:,.2f}'})
+
+    def test_shell_is_built_once_per_language(self):
+        first = self.shells.render('report.html', 'en', user_name='Ada', badges=['Saver'], amount=1500)
+        self.assertEqual(first, '<h1>Report</h1><p>Dear Ada,</p><ul><li>Saver</li></ul><p>N1,500.00</p>'
+                                '<a href="/more?a=1&amp;b=2">More &amp; more</a>')
+        second = self.shells.render('report.html', 'en', user_name='Bo', badges=[], amount=2)
+        self.assertIn('<p>Dear Bo,</p><p>N2.00</p>', second)
+        hausa = self.shells.render('report.html', 'ha', user_name='Ada', badges=['Saver'], amount=1)
+        self.assertIn('<p>Masoyi Ada,</p><ul><li>Mai ajiya</li></ul>', hausa)
+        self.assertEqual(self.built, ['en', 'ha'])
+        self.assertEqual(self.shells.stats()['hits'], 1)
+
+    def test_recipient_fields_are_escaped(self):
+        html = self.shells.render('report.html', 'en', user_name='<script>x</script>', badges=['<b>'], amount=0)
+        self.assertIn('Dear &lt;script&gt;x&lt;/script&gt;,', html)
+        self.assertIn('<li>&lt;b&gt;</li>', html)
+
+    def test_delimiters_in_values_are_not_evaluated(self):
+        TRANSLATIONS['en']['More'] = "[[ 7 * 7 ]] [% for i in range(2) %]x[% endfor %] [[[# c #]"
+        self.addCleanup(TRANSLATIONS['en'].__setitem__, 'More', 'More & more')
+        html = self.shells.render('report.html', 'en', user_name='[[ 6 * 7 ]] [% if 1 %]y[% endif %]',
+                                  badges=[], amount=0)
+        self.assertIn('Dear [[ 6 * 7 ]] [% if 1 %]y[% endif %],', html)
+        self.assertIn('>&#91;[ 7 * 7 ]] &#91;% for i in range(2) %]x&#91;% endfor %] &#91;&#91;&#91;# c #]</a>', html)
+        self.assertNotIn('49', html)
+
+
+if __name__ == '__main__':
+    unittest.main()
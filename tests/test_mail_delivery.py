@@ -0,0 +1,59 @@
+import unittest
+from flask import Flask
+from flask_mail import Mail, Message
+from mail_delivery import PersistentMailer
+from tests.fake_smtp import FakeSMTPServer
+
+
+def mail_app(port):
+    app = Flask(__name__)
+    app.config.update(MAIL_SERVER='127.0.0.1', MAIL_PORT=port, MAIL_USE_TLS=False, MAIL_USE_SSL=False,
+                      MAIL_DEFAULT_SENDER='reports@example.com')
+    return app, Mail(app)
+
+
+def message(i):
+    return Message(subject=f'Report {i}', recipients=[f'user{i}@example.com'], html=f'<p>{i}</p>')
+
+
+class TestPersistentMailer(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSMTPServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.app, mail = mail_app(self.server.port)
+        self.mailer = PersistentMailer(mail, max_messages=4, max_idle=60)
+        context = self.app.app_context()
+        context.push()
+        self.addCleanup(context.pop)
+
+    def test_messages_share_a_connection_until_recycled(self):
+        for i in range(10):
+            self.mailer.send(message(i))
+        self.mailer.close()
+        self.assertEqual(len(self.server.messages), 10)
+        self.assertEqual(self.server.messages[0][1], ['<user0@example.com>'])
+        self.assertEqual(self.server.connections, 3)
+        stats = self.mailer.stats()
+        self.assertEqual((stats['connects'], stats['recycles'], stats['reconnects']), (3, 2, 0))
+
+    def test_reconnects_after_the_server_drops_the_session(self):
+        self.mailer.send(message(0))
+        self.server.drop_connections()
+        self.mailer.send(message(1))
+        self.mailer.close()
+        self.assertEqual([m[1] for m in self.server.messages], [['<user0@example.com>'], ['<user1@example.com>']])
+        self.assertEqual(self.mailer.stats()['reconnects'], 1)
+
+    def test_idle_connection_is_closed(self):
+        self.mailer.max_idle = 0
+        self.mailer.send(message(0))
+        self.mailer.close_if_idle()
+        self.mailer.send(message(1))
+        self.mailer.close()
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(self.mailer.stats()['reconnects'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from peer_aggregates import PeerAggregates
+from sheet_mirror import SheetMirror, frame_from_rows
+from tests.fake_sheets import FakeSheetsServer
+
+HEADERS = ['Timestamp', 'email', 'language', 'score']
+
+
+def score_rows(rows):
+    df = frame_from_rows(rows, HEADERS)
+    df['score'] = pd.to_numeric(df['score'], errors='coerce')
+    df['half'] = df['score'] / 2
+    return df
+
+
+class TestPeerAggregates(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSheetsServer(titles=('Health',))
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.worksheet = self.server.connect().worksheet('Health')
+        self.worksheet.update(values=[HEADERS], range_name='A1:D1')
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.scored = 0
+        self.mirror = self.make_mirror()
+
+    def make_mirror(self):
+        def counting_score_rows(rows):
+            self.scored += len(rows)
+            return score_rows(rows)
+
+        return SheetMirror('Health', HEADERS, self.worksheet.get_values, self.worksheet.get_all_values,
+                           db_path=os.path.join(self.directory, 'replica.db'),
+                           sync_interval=3600, reconcile_interval=3600,
+                           aggregates=PeerAggregates('score', ['half'], counting_score_rows))
+
+    def append(self, *rows):
+        self.worksheet.append_rows([list(row) for row in rows], value_input_option='RAW')
+
+    def test_maintained_as_rows_arrive(self):
+        self.append(('t1', 'a@example.com', 'en', '10'), ('t2', 'b@example.com', 'en', '30'))
+        self.mirror.refresh()
+        peers = self.mirror.peer_aggregates()
+        self.assertEqual((peers['count'], peers['mean'], peers['min'], peers['max']), (2, 20.0, 10.0, 30.0))
+
+        self.mirror.write_through(1, ['t3', 'c@example.com', 'en', 50])
+        self.assertEqual(self.mirror.peer_aggregates()['count'], 3)
+
+        # The delivered copy settles the provisional row; the manual row is new.
+        self.append(('t3', 'c@example.com', 'en', '50'), ('t4', 'd@example.com', 'en', '2'))
+        self.mirror.mark_stale()
+        self.mirror.refresh()
+        peers = self.mirror.peer_aggregates()
+        self.assertEqual(peers['count'], 4)
+        self.assertEqual(peers['sum'], 92.0)
+        self.assertEqual(peers['min'], 2.0)
+        self.assertEqual(peers['component_means'], {'half': 11.5})
+        self.assertEqual(peers['mean'], self.mirror.frame()['score'].astype(float).mean())
+
+    def test_empty_sheet_has_no_means(self):
+        self.mirror.refresh()
+        peers = self.mirror.peer_aggregates()
+        self.assertEqual(peers['count'], 0)
+        self.assertIsNone(peers['mean'])
+        self.assertEqual(peers['component_means'], {'half': None})
+        json.dumps(peers, allow_nan=False)
+
+    def test_persisted_across_restarts(self):
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        self.scored = 0
+        restarted = self.make_mirror()
+        self.assertEqual(restarted.peer_aggregates()['mean'], 10.0)
+        self.assertEqual(self.scored, 0)
+
+    def test_built_on_first_read_for_existing_replica(self):
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        self.mirror._connect().execute('DELETE FROM peer_aggregates')
+        self.assertEqual(self.mirror.peer_aggregates()['count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+from rank_service import ScoreRanks, VersionedRanks
+
+
+class TestScoreRanks(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.scores = [round(rng.uniform(0, 100), 1) for _ in range(500)] + [50.0] * 20
+        self.ranks = ScoreRanks(self.scores)
+
+    def test_matches_full_scans(self):
+        for score in [0, 12.3, 50.0, 99.9, 100, 150, -1] + self.scores[:50]:
+            self.assertEqual(self.ranks.count_at_or_above(score), sum(s >= score for s in self.scores))
+            self.assertEqual(self.ranks.count_above(score), sum(s > score for s in self.scores))
+            self.assertAlmostEqual(self.ranks.percentile(score),
+                                   100.0 * sum(s <= score for s in self.scores) / len(self.scores))
+
+    def test_incremental_add(self):
+        for score in (50.0, 101.0, float('nan')):
+            self.ranks.add(score)
+            self.scores.append(score)
+        self.scores.pop()
+        self.assertEqual(len(self.ranks), len(self.scores))
+        self.assertEqual(self.ranks.count_at_or_above(50.0), sum(s >= 50.0 for s in self.scores))
+        self.assertEqual(self.ranks.count_at_or_above(101.0), 1)
+
+    def test_top_threshold(self):
+        threshold = self.ranks.top_threshold(0.1)
+        self.assertTrue(self.ranks.in_top(threshold))
+        below = max(s for s in self.scores if s < threshold)
+        self.assertFalse(self.ranks.in_top(below))
+        self.assertIsNone(ScoreRanks([1.0]).top_threshold(0.1))
+
+    def test_ignores_nan(self):
+        self.assertEqual(len(ScoreRanks([1.0, float('nan'), 2.0])), 2)
+
+
+class TestVersionedRanks(unittest.TestCase):
+    def test_rebuilds_only_on_version_change(self):
+        ranks = VersionedRanks()
+        ranks.get(1, [1.0, 2.0])
+        ranks.get(1, lambda: self.fail('rebuilt for the same version'))
+        self.assertTrue(ranks.add(1, 2, [3.0]))
+        self.assertEqual(ranks.get(2, lambda: self.fail('rebuilt after insert')).count_at_or_above(2.0), 2)
+        self.assertTrue(ranks.add(2, 3, []))
+        self.assertEqual(len(ranks.get(3, lambda: self.fail('rebuilt after a change without scores'))), 3)
+        self.assertFalse(ranks.add(5, 6, [4.0]))
+        self.assertEqual(len(ranks.get(6, [9.0])), 1)
+        self.assertEqual(ranks.stats()['rebuilds'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
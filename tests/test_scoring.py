@@ -0,0 +1,109 @@
+import unittest
+import numpy as np
+import pandas as pd
+from scoring import budget_metrics, budget_metrics_values, score_health, score_health_values
+from tests.legacy_scoring import legacy_budget_metrics, legacy_health_score
+from translations import get_translations
+
+COURSE_URLS = {
+    'investing': 'https://example.com/investing',
+    'debt': 'https://example.com/debt',
+    'savings': 'https://example.com/savings',
+    'recovery': 'https://example.com/recovery'
+}
+
+
+def health_frame(n, seed=1):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'income_revenue': rng.choice([0, 1000, 50000, 250000], n) * rng.uniform(0, 2, n),
+        'expenses_costs': rng.uniform(0, 300000, n),
+        'debt_loan': rng.choice([0.0, 1.0], n) * rng.uniform(0, 500000, n),
+        'debt_interest_rate': rng.uniform(-5, 40, n),
+        'language': rng.choice(['en', 'ha'], n)
+    })
+    # Sheet values arrive as text, sometimes blank or malformed
+    df = df.astype(str)
+    df.loc[::7, 'debt_loan'] = ''
+    df.loc[::11, 'income_revenue'] = 'n/a'
+    df.loc[::13, 'expenses_costs'] = '0'
+    return df
+
+
+def budget_frame(n, language='en', seed=2):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'monthly_income': rng.uniform(-100, 400000, n),
+        'housing_expenses': rng.uniform(0, 150000, n),
+        'food_expenses': rng.uniform(0, 80000, n),
+        'transport_expenses': rng.uniform(0, 40000, n),
+        'other_expenses': rng.uniform(0, 40000, n),
+        'savings_goal': rng.choice([0.0, 1.0], n) * rng.uniform(0, 50000, n),
+        'language': language
+    }).astype(str)
+    df.loc[::5, 'savings_goal'] = ''
+    df.loc[::9, 'food_expenses'] = 'x'
+    return df
+
+
+class TestScoringEquivalence(unittest.TestCase):
+    def test_health_matches_row_wise_reference(self):
+        for n in (1, 5, 2000):
+            expected = legacy_health_score(health_frame(n), COURSE_URLS)
+            actual = score_health(health_frame(n), COURSE_URLS)
+            self.assertEqual(list(actual.columns), list(expected.columns))
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    def test_budget_matches_row_wise_reference(self):
+        for language in ('en', 'ha'):
+            for n in (1, 2000):
+                expected = legacy_budget_metrics(budget_frame(n, language), get_translations)
+                actual = budget_metrics(budget_frame(n, language), get_translations)
+                self.assertEqual(list(actual.columns), list(expected.columns))
+                pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    def test_boundary_scores(self):
+        df = pd.DataFrame({
+            'income_revenue': ['100', '100', '100', '100'],
+            'expenses_costs': ['0', '80', '100', '0'],
+            'debt_loan': ['0', '0', '100', '100'],
+            'debt_interest_rate': ['0', '0', '20', '20']
+        })
+        expected = legacy_health_score(df.copy(), COURSE_URLS)
+        pd.testing.assert_frame_equal(score_health(df, COURSE_URLS), expected, check_dtype=False)
+
+
+class TestScalarScoring(unittest.TestCase):
+    def assertSameValue(self, value, expected, column):
+        # pandas' text-to-float parser can differ from float() in the last bit.
+        if isinstance(value, float):
+            self.assertTrue(np.isclose(value, expected, rtol=1e-12, atol=0), f"{column}: {value} != {expected}")
+        else:
+            self.assertEqual(value, expected, column)
+
+    def test_health_values_match_vectorized(self):
+        df = health_frame(3000)
+        scored = score_health(df.copy(), COURSE_URLS)
+        for raw, (_, row) in zip(df.itertuples(index=False), scored.iterrows()):
+            result = score_health_values(raw.income_revenue, raw.expenses_costs, raw.debt_loan,
+                                         raw.debt_interest_rate, COURSE_URLS)
+            for column, value in result.as_columns().items():
+                self.assertSameValue(value, row[column], column)
+
+    def test_budget_values_match_vectorized(self):
+        for language in ('en', 'ha'):
+            df = budget_frame(3000, language)
+            scored = budget_metrics(df.copy(), get_translations)
+            for raw, (_, row) in zip(df.to_dict('records'), scored.iterrows()):
+                result = budget_metrics_values(raw, language, get_translations)
+                for column, value in result.as_columns().items():
+                    self.assertSameValue(value, row[column], column)
+
+    def test_results_are_slotted(self):
+        result = score_health_values('100', '50', '', None, COURSE_URLS)
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(result.debt_loan, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from session_backups import SessionBackups
+
+
+class TestSessionBackups(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.backups = SessionBackups(self.directory, lambda email: email.replace('@', '_'), delay=60)
+
+    def read(self, email):
+        with open(self.backups.path(email)) as f:
+            return json.load(f)
+
+    def test_repeated_saves_are_written_once(self):
+        for step in range(5):
+            self.backups.save('ada@example.com', {'step': step})
+        self.assertEqual(self.backups.load('ada@example.com'), {'step': 4})
+        self.assertFalse(os.path.exists(self.backups.path('ada@example.com')))
+        self.assertEqual(self.backups.flush(), 1)
+        self.assertEqual(self.read('ada@example.com'), {'step': 4})
+        self.backups.save('ada@example.com', {'step': 4})
+        stats = self.backups.stats()
+        self.assertEqual((stats['writes'], stats['coalesced'], stats['unchanged'], stats['pending']), (1, 4, 1, 0))
+        self.assertEqual(os.listdir(self.directory), ['ada_example.com.json'])
+
+    def test_restores_are_cached_until_the_file_changes(self):
+        self.backups.save('ada@example.com', {'step': 1})
+        self.backups.flush()
+        self.assertEqual(self.backups.load('ada@example.com'), {'step': 1})
+        self.assertEqual(self.backups.stats()['restore_hits'], 1)
+        # Another worker replaces the file
+        other = SessionBackups(self.directory, lambda email: email.replace('@', '_'))
+        other.save('ada@example.com', {'step': 2, 'from': 'another worker'})
+        other.flush()
+        self.assertEqual(self.backups.load('ada@example.com'), {'step': 2, 'from': 'another worker'})
+        self.assertEqual(self.backups.load('ada@example.com'), {'step': 2, 'from': 'another worker'})
+        stats = self.backups.stats()
+        self.assertEqual((stats['restore_hits'], stats['restore_misses']), (2, 1))
+        self.assertIsNone(self.backups.load('nobody@example.com'))
+
+    def test_discard_drops_pending_and_written_backups(self):
+        self.backups.save('ada@example.com', {'step': 1})
+        self.backups.flush()
+        self.backups.save('ada@example.com', {'step': 2})
+        self.assertTrue(self.backups.discard('ada@example.com'))
+        self.assertEqual(self.backups.flush(), 0)
+        self.assertIsNone(self.backups.load('ada@example.com'))
+        self.assertFalse(self.backups.discard('ada@example.com'))
+
+    def test_writer_thread_flushes_after_the_delay(self):
+        self.backups.delay = 0.05
+        self.backups.start()
+        self.backups.save('ada@example.com', {'step': 1})
+        for _ in range(250):
+            if os.path.exists(self.backups.path('ada@example.com')):
+                break
+            time.sleep(0.02)
+        self.assertEqual(self.read('ada@example.com'), {'step': 1})
+        self.backups.save('bo@example.com', {'step': 1})
+        self.backups.stop(timeout=5)
+        self.assertFalse(self.backups.is_alive())
+        self.assertEqual(self.read('bo@example.com'), {'step': 1})
+
+    def test_concurrent_writers_never_leave_a_torn_file(self):
+        workers = [SessionBackups(self.directory, lambda email: email.replace('@', '_')) for _ in range(4)]
+        payload = {'health_data': {'business_name': 'x' * 5000}}
+        errors = []
+
+        def write(backups, worker):
+            for step in range(50):
+                backups.save('ada@example.com', dict(payload, worker=worker, step=step))
+                backups.flush()
+
+        def read():
+            reader = SessionBackups(self.directory, lambda email: email.replace('@', '_'))
+            for _ in range(200):
+                try:
+                    reader.load('ada@example.com')
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(backups, i)) for i, backups in enumerate(workers)]
+        threads.append(threading.Thread(target=read))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.read('ada@example.com')['step'], 49)
+        self.assertEqual(os.listdir(self.directory), ['ada_example.com.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import unittest
+import zlib
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from session_codec import SessionCodec
+
+SESSION = {
+    'health_data': {'first_name': 'Ada', 'email': 'ada@example.com', 'language': 'en', 'auto_email': False,
+                    'business_name': 'Biz', 'user_type': 'SME', 'income_revenue': 1000.0, 'expenses_costs': 500.0,
+                    'debt_loan': 100.0, 'debt_interest_rate': 5.0},
+    'language': 'en',
+    'dashboard_data': {'first_name': 'Ada', 'email': 'ada@example.com', 'income_revenue': 1000.0,
+                       'expenses_costs': 500.0, 'debt_loan': 100.0, 'debt_interest_rate': 5.0},
+    '_flashes': [['success', 'Data submitted successfully!']]
+}
+
+
+def legacy_cookie(secret_key, session_dict):
+    return URLSafeTimedSerializer(secret_key).dumps(zlib.compress(json.dumps(session_dict).encode('utf-8')).hex())
+
+
+class TestSessionCodec(unittest.TestCase):
+    def test_round_trip_is_compact(self):
+        cookie = SessionCodec('secret').dumps(SESSION)
+        self.assertTrue(cookie.startswith('v2.'))
+        self.assertEqual(SessionCodec('secret').loads(cookie), SESSION)
+        self.assertLess(len(cookie) * 2, len(legacy_cookie('secret', SESSION)))
+
+    def test_legacy_cookies_still_decode(self):
+        self.assertEqual(SessionCodec('secret').loads(legacy_cookie('secret', SESSION)), SESSION)
+
+    def test_tampered_or_foreign_cookies_are_rejected(self):
+        cookie = SessionCodec('secret').dumps(SESSION)
+        with self.assertRaises(BadSignature):
+            SessionCodec('other').loads(cookie)
+        with self.assertRaises(BadSignature):
+            SessionCodec('secret').loads(cookie[:-2] + ('AA' if not cookie.endswith('AA') else 'BB'))
+        with self.assertRaises(BadSignature):
+            SessionCodec('other').loads(legacy_cookie('secret', SESSION))
+
+    def test_decoded_sessions_are_independent_copies(self):
+        codec = SessionCodec('secret', cache_size=2)
+        cookie = codec.dumps(SESSION)
+        first = codec.loads(cookie)
+        first['language'] = 'ha'
+        self.assertEqual(codec.loads(cookie)['language'], 'en')
+        for i in range(3):
+            codec.dumps({'language': str(i)})
+        self.assertEqual(len(codec._decoded), 2)
+        self.assertEqual(codec.loads(cookie), SESSION)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sheet_mirror import SheetMirror
+from tests.fake_sheets import FakeSheetsServer
+
+HEADERS = ['Timestamp', 'email', 'language', 'score']
+
+
+class TestSheetMirror(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSheetsServer(titles=('Health',))
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.worksheet = self.server.connect().worksheet('Health')
+        self.worksheet.update(values=[HEADERS], range_name='A1:D1')
+        self.requested = []
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.mirror = self.make_mirror()
+
+    def make_mirror(self):
+        def read_range(a1_range):
+            self.requested.append(a1_range)
+            return self.worksheet.get_values(a1_range)
+
+        return SheetMirror('Health', HEADERS, read_range, self.worksheet.get_all_values,
+                           db_path=os.path.join(self.directory, 'replica.db'),
+                           sync_interval=3600, reconcile_interval=3600)
+
+    def append(self, *rows):
+        self.worksheet.append_rows([list(row) for row in rows], value_input_option='RAW')
+
+    def test_only_new_rows_are_fetched(self):
+        self.append(('t1', 'a@example.com', 'en', '10'), ('t2', 'b@example.com', '', '20'))
+        self.mirror.refresh()
+        self.assertEqual(self.mirror.stats()['full_syncs'], 1)
+        self.append(('t3', 'c@example.com', 'ha', '30'))
+        self.mirror.refresh()  # within the sync interval: no request
+        self.assertEqual(self.requested, [])
+        self.mirror.mark_stale()
+        self.mirror.refresh()
+        self.assertEqual(self.requested, ['A4:D'])
+        df = self.mirror.frame()
+        self.assertEqual(list(df['email']), ['a@example.com', 'b@example.com', 'c@example.com'])
+        self.assertEqual(list(df['language']), ['en', 'en', 'ha'])
+
+    def test_reconcile_picks_up_edits(self):
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        self.worksheet.update(values=[['t1', 'a@example.com', 'en', '99']], range_name='A2:D2')
+        self.mirror.reconcile_interval = 0
+        self.mirror.refresh()
+        self.assertEqual(list(self.mirror.frame()['score']), ['99'])
+
+    def test_frame_is_a_copy(self):
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        self.mirror.frame()['score'] = 0
+        self.assertEqual(list(self.mirror.frame()['score']), ['10'])
+
+    def test_rows_for_email_uses_index(self):
+        self.append(('t1', 'a@example.com', 'en', '10'), ('t2', 'b@example.com', 'en', '20'),
+                    ('t3', 'a@example.com', 'en', '30'))
+        self.mirror.refresh()
+        self.assertEqual(list(self.mirror.rows_for_email('a@example.com')['score']), ['10', '30'])
+        self.assertEqual(list(self.mirror.rows_for_email('a@example.com', limit=1)['score']), ['10'])
+        self.assertTrue(self.mirror.rows_for_email('nobody@example.com').empty)
+        plan = self.mirror._connect().execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM "sheet_Health" WHERE "email" = ?', ('a@example.com',)
+        ).fetchall()
+        self.assertIn('USING INDEX', ' '.join(str(step[-1]) for step in plan))
+
+    def test_replica_is_shared_between_workers(self):
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        other = self.make_mirror()
+        other._stale = False
+        other.refresh()  # the first worker's sync is recent enough
+        self.assertEqual(self.requested, [])
+        self.assertEqual(list(other.frame()['email']), ['a@example.com'])
+        self.append(('t2', 'b@example.com', 'en', '20'))
+        other.mark_stale()
+        other.refresh()
+        self.assertEqual(self.requested, ['A3:D'])
+        self.assertEqual(self.mirror.row_count, 2)
+        self.assertEqual(list(self.mirror.frame()['email']), ['a@example.com', 'b@example.com'])
+
+    def test_write_through_until_synced(self):
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        self.mirror.write_through(7, ['t2', 'a@example.com', 'ha', 20])
+        self.assertEqual(list(self.mirror.rows_for_email('a@example.com')['score']), ['10', '20'])
+        self.assertEqual(list(self.mirror.frame()['email']), ['a@example.com', 'a@example.com'])
+        self.append(('t2', 'a@example.com', 'ha', '20'))
+        self.mirror.mark_stale()
+        self.mirror.refresh()
+        self.assertEqual(self.mirror.pending_count(), 0)
+        self.assertEqual(list(self.mirror.frame()['Timestamp']), ['t1', 't2'])
+
+    def test_new_rows_are_reported(self):
+        reported = []
+        self.mirror.on_rows = lambda previous, version, rows: reported.append((previous, version, [row[0] for row in rows]))
+        self.append(('t1', 'a@example.com', 'en', '10'))
+        self.mirror.refresh()
+        start = self.mirror.version
+        self.mirror.write_through(1, ['t2', 'b@example.com', 'en', 20])
+        # Settling the provisional row adds nothing; a manual row does
+        self.append(('t2', 'b@example.com', 'en', '20'))
+        self.mirror.mark_stale()
+        self.mirror.refresh()
+        self.append(('t3', 'c@example.com', 'en', '30'))
+        self.mirror.mark_stale()
+        self.mirror.refresh()
+        self.assertEqual(reported, [(start, start + 1, ['t2']), (start + 1, start + 2, []), (start + 2, start + 3, ['t3'])])
+        self.assertEqual(self.mirror.version, start + 3)
+
+    def test_per_email_reads_slice_one_snapshot(self):
+        self.append(('t1', 'a@example.com', 'en', '10'), ('t2', 'b@example.com', 'en', '20'),
+                    ('t3', 'a@example.com', 'en', '30'))
+        self.mirror.refresh()
+        self.mirror.frame()
+        for email in ('a@example.com', 'b@example.com', 'c@example.com'):
+            self.mirror.rows_for_email(email)
+        self.assertEqual(self.mirror.snapshot_builds, 1)
+        rows = self.mirror.rows_for_email('a@example.com')
+        self.assertEqual(list(rows['Timestamp']), ['t1', 't3'])
+        self.assertEqual(list(rows.index), [0, 1])
+        self.mirror.write_through(1, ['t4', 'a@example.com', 'en', '40'])
+        # Version changed: cold per-email reads use the query until the next full read
+        self.assertEqual(list(self.mirror.rows_for_email('a@example.com')['score']), ['10', '30', '40'])
+        self.assertEqual(self.mirror.snapshot_builds, 1)
+        self.assertEqual(len(self.mirror.frame()), 4)
+        self.assertEqual(self.mirror.snapshot_builds, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import gspread
+from sheets_client import SessionPool, WorksheetCache, header_range, pooled_http_client, stale_headers
+from tests.fake_sheets import FakeSheetsServer
+
+
+class TestWorksheetCache(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeSheetsServer(titles=('Budget', 'Health'))
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.spreadsheet = self.server.connect()
+        self.server.reset_calls()
+        self.cache = WorksheetCache(lambda: self.spreadsheet)
+
+    def test_handles_are_fetched_once(self):
+        self.cache.get('Health').append_rows([['a']], value_input_option='RAW')
+        self.cache.get('Health').append_rows([['b']], value_input_option='RAW')
+        self.cache.get('Budget')
+        self.assertEqual(self.server.state.calls, {'metadata': 1, 'values_append': 2})
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def test_invalidate_forces_refresh(self):
+        self.cache.get('Health')
+        self.cache.invalidate('Health')
+        self.cache.get('Health')
+        self.assertEqual(self.server.state.calls['metadata'], 2)
+        self.assertEqual(self.cache.stats()['invalidations'], 1)
+
+    def test_missing_worksheet_is_created_with_headers(self):
+        headers = [f'col{i}' for i in range(27)]
+        self.assertEqual(header_range(headers), 'A1:AA1')
+        worksheet = self.cache.get('Quiz', headers)
+        self.assertEqual(worksheet.title, 'Quiz')
+        self.assertEqual(self.server.rows('Quiz'), [headers])
+
+    def test_slow_fetch_does_not_block_cached_lookups(self):
+        slow, fetching, release = threading.Event(), threading.Event(), threading.Event()
+
+        def getter():
+            if slow.is_set():
+                fetching.set()
+                release.wait(5)
+            return self.spreadsheet
+
+        cache = WorksheetCache(getter)
+        cache.get('Health')
+        slow.set()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            creating = pool.submit(cache.get, 'Quiz', ['a', 'b'])
+            self.assertTrue(fetching.wait(5))
+            self.assertEqual(cache.get('Health').title, 'Health')
+            self.assertFalse(creating.done())
+            release.set()
+            self.assertEqual(creating.result(5).title, 'Quiz')
+        self.assertEqual(cache.stats()['cached'], ['Budget', 'Health', 'Quiz'])
+
+
+class TestStaleHeaders(unittest.TestCase):
+    def test_one_batched_read_finds_differing_headers(self):
+        with FakeSheetsServer(titles=('Budget', 'Health', "Bob's")) as server:
+            spreadsheet = server.connect()
+            expected = {'Budget': ['Timestamp', 'email'], 'Health': ['Timestamp', 'score'], "Bob's": ['a']}
+            spreadsheet.worksheet('Budget').update(values=[expected['Budget']], range_name='A1:B1')
+            spreadsheet.worksheet('Health').update(values=[['Timestamp', 'old']], range_name='A1:B1')
+            server.reset_calls()
+            self.assertEqual(stale_headers(spreadsheet, expected), ['Health', "Bob's"])
+            self.assertEqual(server.state.calls, {'values_batch_get': 1})
+
+
+class FakeCredentials:
+    def __init__(self, expires_in):
+        self.token = 'initial'
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=expires_in)
+        self.refresh_calls = 0
+
+    def refresh(self, request):
+        self.refresh_calls += 1
+        self.token = f'token-{self.refresh_calls}'
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+
+class TestSessionPool(unittest.TestCase):
+    def test_concurrent_appends_and_reads(self):
+        with FakeSheetsServer(latency=0.01) as server:
+            pool = SessionPool(server.session, size=4)
+            client = gspread.Client(auth=None, session=pool, http_client=pooled_http_client())
+            cache = WorksheetCache(lambda: client.open_by_key(server.state.spreadsheet_id))
+            server.reset_calls()
+
+            def submit(i):
+                worksheet_name = ('Budget', 'Health', 'Quiz')[i % 3]
+                cache.call(worksheet_name, lambda ws: ws.append_rows([[f'row-{i}']], value_input_option='RAW'))
+                return cache.call(worksheet_name, lambda ws: ws.get_values('A1:A'))
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(submit, range(150)))
+
+            self.assertTrue(all(results))
+            rows = sorted(row[0] for title in ('Budget', 'Health', 'Quiz') for row in server.rows(title))
+            self.assertEqual(rows, sorted(f'row-{i}' for i in range(150)))
+            stats = pool.stats()
+            self.assertEqual(stats['requests'], server.state.total_calls())
+            self.assertEqual(stats['in_use'], 0)
+            self.assertGreater(stats['peak_in_use'], 1)
+            self.assertLessEqual(stats['peak_in_use'], 4)
+            self.assertGreater(stats['waits'], 0)
+
+    def test_token_is_refreshed_once_ahead_of_expiry(self):
+        credentials = FakeCredentials(expires_in=60)
+        pool = SessionPool(object, size=2, credentials=credentials, refresh_margin=300)
+        barrier = threading.Barrier(8)
+
+        def refresh():
+            barrier.wait()
+            return pool.refresh_credentials()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            refreshed = list(executor.map(lambda _: refresh(), range(8)))
+        self.assertEqual(refreshed.count(True), 1)
+        self.assertEqual(credentials.refresh_calls, 1)
+        self.assertFalse(pool.refresh_credentials())
+        self.assertGreater(pool.stats()['token_expires_in'], 3000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sheets_journal import SheetsJournal, JournalFlusher
+
+
+class TestSheetsJournal(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir)
+        self.journal = SheetsJournal(os.path.join(self.workdir, 'journal.db'))
+
+    def test_flush_delivers_rows_in_order(self):
+        self.journal.enqueue('Health', ['2025-01-01 10:00:00', 'a@example.com'])
+        self.journal.enqueue('Budget', ['2025-01-01 10:00:01', 'b@example.com'])
+        delivered = []
+        notified = []
+        flusher = JournalFlusher(self.journal, lambda name, rows: delivered.append((name, rows)),
+                                 on_delivered=notified.append)
+        self.assertEqual(flusher.flush_once(force=True), 2)
+        self.assertEqual(sorted(name for name, _ in delivered), ['Budget', 'Health'])
+        self.assertEqual(notified, [{'Health', 'Budget'}])
+        self.assertEqual(self.journal.stats()['backlog'], 0)
+        self.assertEqual(self.journal.undelivered_rows('Health'), [])
+
+    def test_failed_delivery_is_retried_later(self):
+        self.journal.enqueue('Quiz', ['row'])
+
+        def fail(name, rows):
+            raise ConnectionError('quota exceeded')
+
+        self.assertEqual(JournalFlusher(self.journal, fail).flush_once(force=True), 0)
+        stats = self.journal.stats()
+        self.assertEqual(stats['backlog'], 1)
+        self.assertEqual(stats['retrying'], 1)
+        self.assertIn('quota exceeded', stats['last_error'])
+        # Backoff keeps the row out of the next claim but it stays visible to readers.
+        self.assertEqual(self.journal.claim(), [])
+        self.assertEqual(self.journal.undelivered_rows('Quiz'), [['row']])
+
+    def test_rows_are_coalesced_per_worksheet(self):
+        for i in range(5):
+            self.journal.enqueue('Health', [f'health-{i}'])
+        self.journal.enqueue('Quiz', ['quiz-0'])
+        batches = []
+        flusher = JournalFlusher(self.journal, lambda name, rows: batches.append((name, rows)),
+                                 batch_size=2, max_linger=60)
+        # Only Health has a full batch; the lone Quiz row lingers.
+        self.assertEqual(flusher.flush_once(), 4)
+        self.assertEqual(batches, [('Health', [['health-0'], ['health-1']]),
+                                   ('Health', [['health-2'], ['health-3']])])
+        self.assertEqual(flusher.flush_once(force=True), 2)
+        self.assertEqual(sorted(name for name, _ in batches[2:]), ['Health', 'Quiz'])
+
+    def test_claimed_rows_are_leased_to_one_flusher(self):
+        self.journal.enqueue('Health', ['row'])
+        other = SheetsJournal(self.journal.path)
+        self.assertEqual(len(self.journal.claim()), 1)
+        self.assertEqual(other.claim(), [])
+
+    def test_recently_delivered_rows_can_be_overlaid(self):
+        row_id = self.journal.enqueue('Health', ['row'])
+        self.journal.mark_delivered([row_id])
+        self.assertEqual(self.journal.undelivered_rows('Health'), [])
+        self.assertEqual(self.journal.undelivered_rows('Health', delivered_since=0), [['row']])
+
+
+if __name__ == '__main__':
+    unittest.main()
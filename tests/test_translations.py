@@ -0,0 +1,54 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from translations import get_translations
+from translation_catalog import CompiledCatalog, compile_catalog, load_catalog, source_path
+
+
+class TestTranslations(unittest.TestCase):
+    def test_catalog_is_built_once(self):
+        self.assertIs(get_translations('ha'), get_translations('ha'))
+
+    def test_unknown_language_uses_english(self):
+        self.assertIs(get_translations('xx'), get_translations('en'))
+        self.assertIs(get_translations('../locales/en'), get_translations('en'))
+
+    def test_missing_key_falls_back_to_english(self):
+        hausa = get_translations('ha')
+        self.assertEqual(hausa['Home'], 'Shafin Farko')
+        self.assertEqual(hausa['Incomplete Data'], get_translations('en')['Incomplete Data'])
+
+    def test_catalog_is_read_only(self):
+        with self.assertRaises(TypeError):
+            get_translations('en')['Home'] = 'Changed'
+
+
+class TestCompiledCatalog(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.workdir)
+
+    def test_compiled_catalog_matches_source(self):
+        target = os.path.join(self.workdir, 'ha.cat')
+        compile_catalog(source_path('ha'), target)
+        with open(source_path('ha'), encoding='utf-8') as f:
+            source = json.load(f)
+        catalog = CompiledCatalog(target)
+        self.assertEqual(dict(catalog), source)
+        self.assertNotIn('No such key', catalog)
+        self.assertEqual(catalog.get('No such key', 'default'), 'default')
+
+    def test_load_rebuilds_missing_catalog(self):
+        with open(os.path.join(self.workdir, 'yo.json'), 'w', encoding='utf-8') as f:
+            json.dump({'Home': 'Ilé'}, f, ensure_ascii=False)
+        catalog = load_catalog('yo', self.workdir)
+        self.assertTrue(os.path.exists(os.path.join(self.workdir, 'yo.cat')))
+        self.assertEqual(catalog['Home'], 'Ilé')
+        self.assertIs(load_catalog('yo', self.workdir), catalog)
+        self.assertIsNone(load_catalog('ig', self.workdir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+# translation_catalog.py
+# Compiled, memory-mapped translation catalogs.
+#
+# Source strings live in locales/<language>.json. Each source is compiled into
+# locales/<language>.cat, a sorted binary table that is memory-mapped read-only
+# on first use, so every gunicorn worker shares the same page-cache pages and
+# adding a language does not grow per-worker startup time or RSS.
+#
+# Build all catalogs ahead of a deploy with:
+#
+#     python translation_catalog.py
+#
+# Missing or stale catalogs are also rebuilt on first use.
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+SOURCE_SUFFIX = '.json'
+COMPILED_SUFFIX = '.cat'
+
+# File layout (little-endian):
+#   header  : magic, format version, entry count
+#   index   : count x (key offset, key length, value offset, value length),
+#             sorted by the UTF-8 bytes of the key
+#   strings : UTF-8 key and value bytes referenced by the index
+MAGIC = b'FCAT'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHxxI')
+_ENTRY = struct.Struct('<IIII')
+
+
+def source_path(language, locales_dir=LOCALES_DIR):
+    return os.path.join(locales_dir, f"{language}{SOURCE_SUFFIX}")
+
+
+def compiled_path(language, locales_dir=LOCALES_DIR):
+    return os.path.join(locales_dir, f"{language}{COMPILED_SUFFIX}")
+
+
+def available_languages(locales_dir=LOCALES_DIR):
+    try:
+        names = os.listdir(locales_dir)
+    except FileNotFoundError:
+        return []
+    return sorted(name[:-len(SOURCE_SUFFIX)] for name in names if name.endswith(SOURCE_SUFFIX))
+
+
+def compile_catalog(source, target):
+    """Compile a JSON {key: text} source file into a binary catalog."""
+    with open(source, 'r', encoding='utf-8') as f:
+        strings = json.load(f)
+    entries = sorted((key.encode('utf-8'), value.encode('utf-8')) for key, value in strings.items())
+    strings_start = _HEADER.size + _ENTRY.size * len(entries)
+    index = bytearray()
+    blob = bytearray()
+    for key, value in entries:
+        key_offset = strings_start + len(blob)
+        blob += key
+        value_offset = strings_start + len(blob)
+        blob += value
+        index += _ENTRY.pack(key_offset, len(key), value_offset, len(value))
+    # Write next to the target and rename so concurrent workers never map a
+    # half-written file.
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(entries)))
+        f.write(index)
+        f.write(blob)
+    os.replace(tmp, target)
+    logger.info(f"Compiled {len(entries)} strings from {source} into {target}")
+    return len(entries)
+
+
+def build_all(locales_dir=LOCALES_DIR):
+    built = {}
+    for language in available_languages(locales_dir):
+        built[language] = compile_catalog(source_path(language, locales_dir), compiled_path(language, locales_dir))
+    return built
+
+
+class CompiledCatalog(Mapping):
+    """Read-only mapping over a memory-mapped compiled catalog."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} translation catalog")
+        self._count = count
+        self.path = path
+
+    def _entry(self, position):
+        return _ENTRY.unpack_from(self._map, _HEADER.size + position * _ENTRY.size)
+
+    def _find(self, key):
+        needle = key.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = self._entry(middle)
+            candidate = self._map[key_offset:key_offset + key_length]
+            if candidate < needle:
+                low = middle + 1
+            elif candidate > needle:
+                high = middle
+            else:
+                return self._map[value_offset:value_offset + value_length].decode('utf-8')
+        return None
+
+    def __getitem__(self, key):
+        value = self._find(key) if isinstance(key, str) else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __iter__(self):
+        for position in range(self._count):
+            key_offset, key_length, _, _ = self._entry(position)
+            yield self._map[key_offset:key_offset + key_length].decode('utf-8')
+
+    def __len__(self):
+        return self._count
+
+
+class FallbackCatalog(Mapping):
+    """Look keys up in a translation first and fall back to English."""
+
+    def __init__(self, primary, fallback):
+        self._primary = primary
+        self._fallback = fallback
+        self._length = None
+
+    def __getitem__(self, key):
+        try:
+            return self._primary[key]
+        except KeyError:
+            return self._fallback[key]
+
+    def __contains__(self, key):
+        return key in self._primary or key in self._fallback
+
+    def __iter__(self):
+        yield from self._primary
+        for key in self._fallback:
+            if key not in self._primary:
+                yield key
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
+
+_loaded = {}
+_load_lock = threading.Lock()
+
+
+def _is_stale(language, locales_dir):
+    target = compiled_path(language, locales_dir)
+    if not os.path.exists(target):
+        return True
+    return os.path.getmtime(source_path(language, locales_dir)) > os.path.getmtime(target)
+
+
+def load_catalog(language, locales_dir=LOCALES_DIR):
+    """Return the compiled catalog for a language, mapping it on first use.
+
+    Returns None if no source exists for the language.
+    """
+    cache_key = (locales_dir, language)
+    catalog = _loaded.get(cache_key)
+    if catalog is not None:
+        return catalog
+    with _load_lock:
+        catalog = _loaded.get(cache_key)
+        if catalog is not None:
+            return catalog
+        if not os.path.exists(source_path(language, locales_dir)):
+            return None
+        if _is_stale(language, locales_dir):
+            compile_catalog(source_path(language, locales_dir), compiled_path(language, locales_dir))
+        catalog = CompiledCatalog(compiled_path(language, locales_dir))
+        _loaded[cache_key] = catalog
+        return catalog
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    directory = sys.argv[1] if len(sys.argv) > 1 else LOCALES_DIR
+    for language, count in build_all(directory).items():
+        print(f"{language}: {count} strings")
@@ -1,930 +1,55 @@
 # translations.py
-# Contains translation strings for Ficore Africa Flask app in English and Hausa
+# Translation lookup for Ficore Africa Flask app (English, Hausa and any other
+# language with a source file in locales/)
 # Covers Financial Personality Quiz, Monthly Budget Planner, and Financial Health Tool
+#
+# Strings are stored in locales/<language>.json and served from compiled,
+# memory-mapped catalogs (see translation_catalog.py). A language is only
+# mapped the first time it is requested.
 
-def get_translations(language='en'):
-    translations = {
-        'en': {
-            # General
-            'Home': 'Home',
-            'Back to Home': 'Back to Home',
-            'Back' : 'Back',
-            'Thanks again': 'Thanks again',
-            'Logout': 'Logout',
-            'Financial Health Score': 'Financial Health Score',
-            'Allocate income across expense categories': 'Allocate income across expense categories',
-            'Use Ficore to Track your income, net worth, budgets, and bills, to grow your money with confidence.': 'Use Ficore to Track your income, net worth, budgets, and bills, to grow your money with confidence.',
-            'About Ficore Africa: Empowering financial growth across Africa since 2025': 'About Ficore Africa: Empowering financial growth across Africa since 2025',
-            'Why Ficore Africa?': 'Why Ficore Africa?',
-            'Spend less on non-essentials to balance your budget' : 'Spend less on non-essentials to balance your budget',
-            'Localized for Africa with support for Naira and regional financial contexts': 'Localized for Africa with support for Naira and regional financial contexts',
-            'Provides actionable insights for better financial decisions': 'Provides actionable insights for better financial decisions',
-            'Empowers financial literacy with easy-to-use tools' : 'Empowers financial literacy with easy-to-use tools',
-            'What people are saying about Us': 'What people are saying about Us',
-            'Manage and mark bills as paid': 'Manage and mark bills as paid',
-            'Aims to cover 3-6 months of expenses for financial security': 'Aims to cover 3-6 months of expenses for financial security',
-            'Log and edit expenses for spending insights': 'Log and edit expenses for spending insights',
-            'Expense Tracker': 'Expense Tracker',
-            'Bill Planner': 'Bill Planner',
-            'Net worth is assets minus liabilities': 'Net worth is assets minus liabilities',
-            'Answer questions to assess financial literacy': 'Answer questions to assess financial literacy',
-            'Emergency Fund Calculator': 'Emergency Fund Calculator',
-            'Personality Quiz': 'Personality Quiz',
-            'Net Worth Calculator': 'Net Worth Calculator',
-            'Budget Planner': 'Budget Planner',
-            'Where to Start? Get Your Free Health Score' : 'Where to Start? Get Your Free Health Score!',
-            'Track income, net worth, bills, and make budgets, to grow with confidence.': 'Track income, net worth, bills, and make budgets, to grow with confidence.',
-            'Your All-in-One Toolkit for Personal & SME Financial Health Across Africa': 'Your All-in-One Toolkit for Personal & SME Financial Health Across Africa',
-            'Provide Feedback': 'Provide Feedback',
-            'Choose your language': 'Choose your language',
-            'Join Waitlist': 'Join Waitlist',
-            'Explore More Tools' : 'Explore More Tools from Ficore',
-            'Error processing data. Please try again.': 'Error processing data. Please try again.',
-            'Book Consultancy': 'Book Consultancy',
-            'Connect on LinkedIn': 'Connect on LinkedIn',
-            'Follow on Twitter': 'Follow on Twitter',
-            'Avoider Tip': 'Start with simple budgeting and track daily expenses.',
-            'track_bills_tip': 'Track your bill payments easily',
-            'Contact Us': 'Contact Us',
-            'Click to Email': 'Click to Email',
-            'for support': 'for support',
-            'Session Expired': 'Session expired. Please start over.',
-            'Incomplete Data': 'Incomplete data. Please complete all steps.',
-            'Error retrieving data. Please try again.': 'Error retrieving data. Please try again.',
-            'Error saving data. Please try again.': 'Error saving data. Please try again.',
-            'Google Sheets Error': 'Unable to access Google Sheets. Please try again later.',
-            'Submission Success': 'Data submitted successfully!',
-            'Check Inbox': 'Check your Inbox, Junk, or Spam folder for your report!',
-            'Results copied to clipboard': 'Results copied to clipboard',
-            'Failed to copy results': 'Failed to copy results',
-            '500 Error': 'Server Error',
-            'Invalid Endpoint': 'The requested endpoint is not available. Please try again.',
-            'Worksheet Not Found': 'The requested worksheet was not found. It has been created automatically.',
-            'Page Not Found': 'Page Not Found',
-            'The page you are looking for does not exist.': 'The page you are looking for does not exist.',
-            'An unexpected error occurred on the server.': 'An unexpected error occurred on the server.',
-            'Error Details': 'Error Details',
-            'Return to Home': 'Return to Home',
-            'Form processing error. Please try again.': 'Form processing error. Please try again.',
-            'Please correct the errors below': 'Please correct the errors below.',
-            'Quiz configuration error. Please try again later.': 'Quiz configuration error. Please try again later.',
-            'Track your financial health with Ficore Africa. See your score, earn badges, and get smart insights.': 'Track your financial health with Ficore Africa. See your score, earn badges, and get smart insights.',
-            'Ficore Africa - Your Financial Health Dashboard': 'Ficore Africa - Your Financial Health Dashboard',
-            'Listen to Voice Guidance': 'Listen to Voice Guidance',
-            'Listen': 'Listen',
-            'Voice guidance coming soon!': 'Voice guidance coming soon!',
-            'Your Badges': 'Your Badges',
-            'Congratulations!': 'Congratulations!',
-            'No Badges Yet': 'No Badges Yet',
-            'Keep improving!': 'Keep improving!',
-            'Give Feedback': 'Give Feedback',
-            'Submit Feedback': 'Submit Feedback',
-            'Your feedback is valuable to us.': 'Your feedback is valuable to us.',
-            'Thank you for your feedback!': 'Thank you for your feedback!',
-            'Complete the health score form with Ficore Africa to calculate your personalized financial health score.': 'Complete the health score form with Ficore Africa to calculate your personalized financial health score.',
-            'Ficore Africa Logo': 'Ficore Africa Logo',
-            'New to finances? Click here to get guided tips on how to fill this form.': 'New to finances? Click here to get guided tips on how to fill this form.',
-            'Tips for Filling the Form': 'Tips for Filling the Form',
-            'Enter your legal first name as it appears on official documents.': 'Enter your legal first name as it appears on official documents.',
-            'Use an active email address you check regularly for updates.': 'Use an active email address you check regularly for updates.',
-            'Check this box if you want your financial health score sent to your email.': 'Check this box if you want your financial health score sent to your email.',
-            'Select English or Hausa based on your preference for communication.': 'Select English or Hausa based on your preference for communication.',
-            'Step': 'Step',
-            'Business Name': 'Business Name',
-            'If you have a business, enter its registered name; otherwise, use your personal name.': 'If you have a business, enter its registered name; otherwise, use your personal name.',
-            'Choose Business if you’re representing a company, or Individual if this is for personal finance.': 'Choose Business if you’re representing a company, or Individual if this is for personal finance.',
-            'Type personal name if no business': 'Type personal name if no business',
-            'Business or Individual': 'Business or Individual',
-            'Income/Revenue': 'Income/Revenue',
-            'Include all regular income sources like salary, sales, or side hustles (e.g., 150,000).': 'Include all regular income sources like salary, sales, or side hustles (e.g., 150,000).',
-            'Income information': 'Income information',
-            'Total money you receive regularly, like salary, business sales, gifts, grants, incentives, or side hustles.': 'Total money you receive regularly, like salary, business sales, gifts, grants, incentives, or side hustles.',
-            'e.g. 150,000': 'e.g. 150,000',
-            'Expenses/Costs': 'Expenses/Costs',
-            'Sum up all monthly expenses like rent, utilities, and food (e.g., 60,000).': 'Sum up all monthly expenses like rent, utilities, and food (e.g., 60,000).',
-            'Expenses information': 'Expenses information',
-            'All the money you spend, such as on rent, food, transport, electricity bill, gas and utilities, fine and penalties, levies, taxes, etc.': 'All the money you spend, such as on rent, food, transport, electricity bill, gas and utilities, fine and penalties, levies, taxes, etc.',
-            'e.g. 60,000': 'e.g. 60,000',
-            'Debt/Loan': 'Debt/Loan',
-            'Enter the total amount you owe, such as loans or borrowings (e.g., 25,000).': 'Enter the total amount you owe, such as loans or borrowings (e.g., 25,000).',
-            'Debt information': 'Debt information',
-            'Money you owe, like loans, IOUs, borrowings, or funds lent to you.': 'Money you owe, like loans, IOUs, borrowings, or funds lent to you.',
-            'e.g. 25,000': 'e.g. 25,000',
-            'Debt Interest Rate': 'Debt Interest Rate',
-            'Input the annual or monthly interest rate on your debt as a percentage (e.g., 10 for 10%); enter 0 if interest-free.': 'Input the annual or monthly interest rate on your debt as a percentage (e.g., 10 for 10%); enter asa if interest-free.',
-            'Interest rate information': 'Interest rate information',
-            'Extra percentage you pay on a loan, usually per year or month. It’s usually something like 12% or 7%.': 'Extra percentage you pay on a loan, usually per year or month. It’s usually something like 12% or 7%.',
-            'e.g. 10': 'e.g. 10',
+import threading
+
+from translation_catalog import FallbackCatalog, available_languages, load_catalog
 
-            # Budget Planner
-            'Budget Planner': 'Budget Planner',
-            'Budget Dashboard': 'Budget Dashboard',
-            'Financial growth passport for Africa': 'Financial growth passport for Africa',
-            'Welcome': 'Welcome',
-            'Your Budget Summary': 'Your Budget Summary',
-            'Refresh': 'Refresh',
-            'My Budget': 'My Budget',
-            'Check yours at': 'Check yours at',
-            'Personal Information': 'Personal Information',
-            'First Name': 'First Name',
-            'Enter your first name': 'Enter your first name',
-            'Enter your first name for your report.': 'Enter your first name for your report.',
-            'Email': 'Email',
-            'Enter your email': 'Enter your email',
-            'Get your budget report by email.': 'Get your budget report by email.',
-            'Language': 'Language',
-            'Choose your language.': 'Choose your language.',
-            'Looks good!': 'Looks good!',
-            'First Name Required': 'First Name Required',
-            'Invalid Email': 'Invalid Email',
-            'Language selected!': 'Language selected!',
-            'Language required': 'Language required',
-            'Next': 'Next',
-            'Continue to Income': 'Continue to Income',
-            'Step 1': 'Step 1',
-            'Income': 'Income',
-            'Monthly Income': 'Monthly Income',
-            'e.g. ₦150,000': 'e.g. ₦150,000',
-            'Your monthly pay or income.': 'Your monthly pay or income.',
-            'Valid amount!': 'Valid amount!',
-            'Invalid Number': 'Invalid Number',
-            'Back': 'Back',
-            'Back to Personal Information': 'Back to Personal Information',
-            'Step 2': 'Step 2',
-            'Continue to Expenses': 'Continue to Expenses',
-            'Please enter a valid income amount': 'Please enter a valid income amount',
-            'Processing your information': 'Processing your information',
-            'Processing your income': 'Processing your income',
-            'Expenses': 'Expenses',
-            'Housing Expenses': 'Housing Expenses',
-            'e.g. ₦30,000': 'e.g. ₦30,000',
-            'Rent, electricity, or water bills.': 'Rent, electricity, or water bills.',
-            'Food Expenses': 'Food Expenses',
-            'e.g. ₦45,000': 'e.g. ₦45,000',
-            'Money spent on food each month.': 'Money spent on food each month.',
-            'Transport Expenses': 'Transport Expenses',
-            'e.g. ₦10,000': 'e.g. ₦10,000',
-            'Bus, bike, taxi, or fuel costs.': 'Bus, bike, taxi, or fuel costs.',
-            'Other Expenses': 'Other Expenses',
-            'e.g. ₦20,000': 'e.g. ₦20,000',
-            'Internet, clothes, or other spending.': 'Internet, clothes, or other spending.',
-            'Step 3': 'Step 3',
-            'Continue to Savings & Review': 'Continue to Savings & Review',
-            'Please enter valid amounts for all expenses': 'Please enter valid amounts for all expenses',
-            'Analyzing your expenses': 'Analyzing your expenses',
-            'Savings & Review': 'Savings & Review',
-            'Savings Goal': 'Savings Goal',
-            'Optional': 'Optional',
-            'Desired monthly savings amount.': 'Desired monthly savings amount.',
-            'e.g. ₦5,000': 'e.g. ₦5,000',
-            'Auto Email': 'Auto Email',
-            'Submit': 'Submit',
-            'Step 4': 'Step 4',
-            'Continue to Dashboard': 'Continue to Dashboard',
-            'Analyzing your budget': 'Analyzing your budget...',
-            'Please enter a valid savings goal amount': 'Please enter a valid savings goal amount',
-            'Please fill all required fields': 'Please fill all required fields',
-            'Total Expenses': 'Total Expenses',
-            'Savings': 'Savings',
-            'Saving': 'Saving',
-            'Overspend': 'Overspend',
-            'Surplus/Deficit': 'Surplus/Deficit',
-            'Advice': 'Advice',
-            'Great job! Save or invest your surplus to grow your wealth.': 'Great job! Save or invest your surplus to grow your wealth.',
-            'Housing costs are high. Look for cheaper rent or utilities.': 'Housing costs are high. Look for cheaper rent or utilities.',
-            'Food spending is high. Try cooking at home more.': 'Food spending is high. Try cooking at home more.',
-            'Reduce non-essential spending to balance your budget.': 'Reduce non-essential spending to balance your budget.',
-            'Other spending is high. Cut back on non-essentials like clothes or entertainment.': 'Other spending is high. Cut back on non-essentials like clothes or entertainment.',
-            'Your ranking': 'Your ranking',
-            'Rank': 'Rank',
-            'out of': 'out of',
-            'users': 'users',
-            'Budget Breakdown': 'Budget Breakdown',
-            'Income vs Expenses': 'Income vs Expenses',
-            'Earned badges': 'Earned badges',
-            'First Budget Completed!': 'First Budget Completed!',
-            'Send Email Report': 'Email report sent successfully!',
-            'Quick Tips': 'Quick Tips',
-            'Great job! Save or invest your surplus.': 'Great job! Save or invest your surplus.',
-            'Keep tracking your expenses every month.': 'Keep tracking your expenses every month.',
-            'Spend less on non-essentials to balance your budget.': 'Spend less on non-essentials to balance your budget.',
-            'Look for ways to earn extra income.': 'Look for ways to earn extra income.',
-            'Recommended Learning': 'Recommended Learning',
-            'Learn more about budgeting!': 'Learn more about budgeting!',
-            'Whats Next': 'What\'s Next',
-            'Share Your Results': 'Share Your Results',
-            'Summary with Emoji': 'Summary 📊',
-            'Badges with Emoji': 'Badges 🏅',
-            'Tips with Emoji': 'Tips 💡',
-            'Budget Report Subject': 'Your Budget Report',
-            'Your Budget Report': 'Your Budget Report',
-            'Dear': 'Dear',
-            'Here is your monthly budget summary.': 'Here is your monthly budget summary.',
-            'Budget Summary': 'Budget Summary',
-            'Thank you for choosing Ficore Africa!': 'Thank you for choosing Ficore Africa!',
-            'Advice with Emoji': 'Advice 💡',
-            'Recommended Learning with Emoji': 'Recommended Learning 📚',
-            'Join Financial Course': 'Join Financial Course',
-            'Join Course': 'Join Course',
-            'No tips available.': 'No tips available.',
-            'Balance': 'Balance',
-            'Income minus expenses and savings goal.': 'Income minus expenses and savings goal.',
-            'Expense Breakdown': 'Expense Breakdown',
-            'Pie chart of expense breakdown': 'Pie chart of expense breakdown',
-            'Badges': 'Badges',
-            'Earned for managing your budget effectively.': 'Earned for managing your budget effectively.',
-            'No badges earned yet.': 'No badges earned yet.',
-            'Tips': 'Tips',
-            'Tip': 'Tip',
-            'Actionable advice to improve your budget.': 'Actionable advice to improve your budget.',
-            'Back to Savings & Review': 'Back to Savings & Review',
-            'Warning: No income recorded!': 'Warning: No income recorded!',
+DEFAULT_LANGUAGE = 'en'
 
-            # Financial Health Tool
-            'Your Financial Health Summary': 'Your Financial Health Summary',
-            'Your Financial Health Score': 'Your Financial Health Score',
-            'Ranked': 'Ranked',
-            'Financial Health Course': 'Financial Health Course',
-            'Strong Financial Health': 'Your score indicates strong financial health. Focus on investing the surplus funds to grow your wealth.',
-            'Stable Finances': 'Your finances are stable but could improve. Consider saving more or reducing your expenses.',
-            'Financial Strain': 'Your score suggests financial strain. Prioritize paying off debt and managing your expenses.',
-            'Urgent Attention Needed': 'Your finances need urgent attention. Seek professional advice and explore recovery strategies.',
-            'Score Breakdown': 'Score Breakdown',
-            'Chart Unavailable': 'Chart unavailable due to data issues.',
-            'Score Composition': 'Your score is composed of three components',
-            'Cash Flow': 'Cash Flow',
-            'Cash Flow Description': 'Reflects how much income remains after expenses. Higher values indicate better financial flexibility.',
-            'Debt-to-Income Ratio': 'Debt-to-Income Ratio',
-            'Debt-to-Income Description': 'Measures debt relative to income. Lower ratios suggest manageable debt levels.',
-            'Debt Interest Burden': 'Debt Interest Burden',
-            'Debt Interest Description': 'Indicates the impact of interest rates on your finances. Lower burdens mean less strain from debt.',
-            'Balanced Components': 'Your components are well-balanced.',
-            'Components Need Attention': 'Some components need attention to improve your score.',
-            'Components Indicate Challenges': 'Your components indicate financial challenges.',
-            'Recommended Course': 'Recommended Course',
-            'Enroll in': 'Enroll in',
-            'Enroll Now': 'Enroll Now',
-            'Quick Financial Tips': 'Quick Financial Tips',
-            'Invest Wisely': 'Consider investing surplus funds wisely.',
-            'Scale Smart': 'Scale your business or finances smartly.',
-            'Build Savings': 'Focus on building your savings.',
-            'Cut Costs': 'Identify and cut unnecessary costs.',
-            'Reduce Debt': 'Prioritize reducing your debt.',
-            'Boost Income': 'Explore ways to boost your income.',
-            'How You Compare': 'How You Compare to Others',
-            'Your Rank': 'Your rank of',
-            'places you': 'places you',
-            'Top 10%': 'in the top 10% of users, indicating exceptional financial health compared to peers.',
-            'Top 30%': 'in the top 30%, showing above-average financial stability.',
-            'Middle Range': 'in the middle range, suggesting room for improvement to climb the ranks.',
-            'Lower Range': 'in the lower range, highlighting the need for strategic financial planning.',
-            'Regular Submissions': 'Regular submissions can improve your ranking.',
-            'Whats Next': 'What’s Next? Unlock Further Insights',
-            'Ficore Africa Financial Health Score': 'Ficore Africa Financial Health Score',
-            'Get Your Score': 'Get your financial health score and personalized insights instantly!',
-            'Enter your first name': 'Enter your first name',
-            'First Name Required': 'First name is required.',
-            'Enter your last name (optional)': 'Enter your last name (optional)',
-            'Confirm your email': 'Confirm your email',
-            'Enter phone number (optional)': 'Enter phone number (optional)',
-            'User Information': 'User Information',
-            'Enter your business name': 'Enter your business name',
-            'Business Name Required': 'Business name is required.',
-            'User Type': 'User Type',
-            'Financial Information': 'Financial Information',
-            'Enter monthly income/revenue': 'Enter monthly income/revenue',
-            'Enter monthly expenses/costs': 'Enter monthly expenses/costs',
-            'Enter total debt/loan amount': 'Enter total debt/loan amount',
-            'Enter debt interest rate (%)': 'Enter debt interest rate (%)',
-            'Session data missing. Please submit again.': 'Session data is missing. Please submit the form again.',
-            'An unexpected error occurred. Please try again.': 'An unexpected error occurred. Please try again.',
-            'Error generating plots. Dashboard will display without plots.': 'Error generating plots. The dashboard will display without them.',
-            'Top 10% Subject': '🔥 You\'re Top 10%! Your Ficore Score Report Awaits!',
-            'Score Report Subject': '📊 Your Ficore Score Report is Ready, {user_name}!',
-            'First Health Score Completed!': 'First Health Score Completed!',
-            'Financial Stability Achieved!': 'Financial Stability Achieved!',
-            'Debt Slayer!': 'Debt Slayer!',
-            'Your Financial Health Dashboard': 'Your Financial Health Dashboard',
-            'Choose a Tool': 'Choose a Tool',
-            'Select an option': 'Select an option',
-            'Start': 'Start',
-            'Email addresses must match.': 'Email addresses must match.',
-            'Complete the health score form ...': 'Complete the health score form ...',
-            'New to finances? ...': 'New to finances? ...',
-            'Close': 'Close',
-            'Feedback': 'Feedback',
-            'Consultancy': 'Consultancy',
-            'Component': 'Component',
-            'Score Contribution': 'Score Contribution',
-            'Debt Interest': 'Debt Interest',
-            'Debt-to-Income': 'Debt-to-Income',
-            'We have calculated your Ficore Africa Financial Health Score based on your recent submission.': 'We have calculated your Ficore Africa Financial Health Score based on your recent submission.',
-            'Follow the advice above to improve your financial health. We are here to support you every step of the way—take one small action today to grow stronger financially for your business, your goals, and your future!': 'Follow the advice above to improve your financial health. We are here to support you every step of the way—take one small action today to grow stronger financially for your business, your goals, and your future!',
-            'Want to learn more? Check this course:': 'Want to learn more? Check this course:',
-            'Please provide feedback on your experience:': 'Please provide feedback on your experience:',
-            'Want Smart Insights? Join the waitlist for Ficore Premium': 'Want Smart Insights? Join the waitlist for Ficore Premium',
-            'Need personalized advice? Book Consultancy': 'Need personalized advice? Book Consultancy',
-            'Best regards,': 'Best regards,',
-            'The Ficore Africa Team': 'The Ficore Africa Team',
-            'Follow us on LinkedIn and Twitter for updates': 'Follow us on LinkedIn and Twitter for updates',
-            'View Course': 'View Course',
-            'Follow us on': 'Follow us on',
-            'Invest': 'Invest',
-            'Explore investment options.': 'Explore investment options.',
-            'Scale': 'Scale',
-            'Plan for scalable growth.': 'Plan for scalable growth.',
-            'Build': 'Build',
-            'Start a savings plan.': 'Start a savings plan.',
-            'Cut': 'Cut',
-            'Review your expenses.': 'Review your expenses.',
-            'Reduce': 'Reduce',
-            'Create a debt repayment plan.': 'Create a debt repayment plan.',
-            'Boost': 'Boost',
-            'Consider side hustles or new revenue streams.': 'Consider side hustles or new revenue streams.',
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+_supported = None
 
-            # Financial Personality Quiz
-            'Financial Personality Quiz': 'Financial Personality Quiz',
-            'Financial Quiz': 'Financial Quiz',
-            'Discover Your Financial Personality': 'Discover Your Financial Personality',
-            'Start Quiz': 'Start Quiz',
-            'Question': 'Question',
-            'of': 'of',
-            'Submit Quiz': 'Submit Quiz',
-            'Personality Unlocked!': 'Personality Unlocked!',
-            'Your Financial Personality': 'Your Financial Personality',
-            'Habits': 'Habits',
-            'Personalized Tip': 'Personalized Tip',
-            'Quiz Summary': 'Quiz Summary',
-            'Retake Quiz': 'Retake Quiz',
-            'Explore Budget Planner': 'Explore Budget Planner',
-            'Explore Financial Health Tool': 'Explore Financial Health Tool',
-            'Share on WhatsApp': 'Share on WhatsApp',
-            'Share on Twitter': 'Share on Twitter',
-            'Learn How to Be a Planner': 'Learn How to Be a Planner',
-            'Quiz Report Subject': 'Your Financial Personality Quiz Results',
-            'Receive Email Report': 'Receive Email Report',
-            'Previous': 'Previous',
-            'Progress': 'Progress',
-            # Quiz Questions
-            'Do you track your expenses weekly?': 'Do you track your expenses weekly?',
-            'Do you avoid budgeting?': 'Do you avoid budgeting?',
-            'Do you save a portion of your income monthly?': 'Do you save a portion of your income monthly?',
-            'Do you often spend on non-essentials like entertainment?': 'Do you often spend on non-essentials like entertainment?',
-            'Do you plan your purchases in advance?': 'Do you plan your purchases in advance?',
-            'How often do you save?': 'How often do you save?',
-            'How often do you overspend at the market?': 'How often do you overspend at the market?',
-            'How often do you review your finances?': 'How often do you review your finances?',
-            'How often do you buy on impulse?': 'How often do you buy on impulse?',
-            'How often do you join savings groups?': 'How often do you join savings groups?',
-            'impulse_purchases': 'Do you make impulse purchases?',
-            'spend_non_essentials': 'Do you spend on non-essentials?',
-            'use_budgeting_tools': 'Do you use budgeting tools?',
-            'save_regularly': 'Do you save regularly?',
-            'invest_money': 'Do you invest your money?',
-            'track_expenses': 'Do you track your expenses?',
-            'emergency_fund': 'Do you have an emergency fund?',
-            'plan_expenses': 'Do you plan your expenses?',
-            'set_financial_goals': 'Do you set financial goals?',
-            'seek_financial_advice': 'Do you seek financial advice?',
-            # Tooltips
-            'Tracking: Recording all money spent daily.': 'Tracking: Recording all money spent daily.',
-            'Budgeting: Planning how to spend your money.': 'Budgeting: Planning how to spend your money.',
-            'Saving: Setting aside money for future use.': 'Saving: Setting aside money for future use.',
-            'Non-essentials: Items or activities not critical to daily needs.': 'Non-essentials: Items or activities not critical to daily needs.',
-            'Planning: Deciding what to buy before spending.': 'Planning: Deciding what to buy before spending.',
-            'Saving frequency: How regularly you set aside money.': 'Saving frequency: How regularly you set aside money.',
-            'Overspending: Spending more than planned.': 'Overspending: Spending more than planned.',
-            'Reviewing: Checking your income and expenses.': 'Reviewing: Checking your income and expenses.',
-            'Impulse buying: Purchasing without planning.': 'Impulse buying: Purchasing without planning.',
-            'Savings groups: Local groups for collective saving.': 'Savings groups: Local groups for collective saving.',
-            # Choices
-            'Yes': 'Yes',
-            'No': 'No',
-            'Never': 'Never',
-            'Sometimes': 'Sometimes',
-            'Always': 'Always',
-            'yes': 'Yes',
-            'no': 'No',
-            # Personalities
-            'Planner': 'Planner',
-            'Saver': 'Saver',
-            'Minimalist': 'Minimalist',
-            'Spender': 'Spender',
-            'Avoider': 'Avoider',
-            # Personality Descriptions
-            'Planner': 'You are disciplined and proactive in managing your finances.',
-            'Saver': 'You prioritize saving but may need to plan better.',
-            'Minimalist': 'You keep spending low but may miss saving opportunities.',
-            'Spender': 'You enjoy spending and may need budgeting help.',
-            'Avoider': 'You avoid financial planning and need to start tracking.',
-            # Tips
-            'Planner Tip': 'Continue tracking and set long-term financial goals.',
-            'Saver Tip': 'Create a budget to optimize your savings.',
-            'Minimalist Tip': 'Explore saving or investing your surplus funds.',
-            'Spender Tip': 'Track expenses and set spending limits.',
-            'Avoider Tip': 'Start with simple budgeting and track daily expenses.',
-            # New Translations
-            'Ranking Info': 'Ranking Info',
-            'Ranking based on debt, expenses, and income balance.': 'Ranking based on debt, expenses, and income balance.',
-            'See your Income Breakdown': 'See your Income Breakdown',
-            'Cash Flow Info': 'Cash Flow Info',
-            'What’s left after your spending.': 'What’s left after your spending.',
-            'This is your monthly surplus (Income minus Expenses).': 'This is your monthly surplus (Income minus Expenses).',
-            'Debt-to-Income Info': 'Debt-to-Income Info',
-            'Your debt as a percentage of income.': 'Your debt as a percentage of income.',
-            'Debt Interest Info': 'Debt Interest Info',
-            'Impact of your debt interest rate.': 'Impact of your debt interest rate.',
-            'Return to Main Menu': 'Return to Main Menu',
-            'Earned by maintaining positive cash flow for this session.': 'Earned by maintaining positive cash flow for this session.',
-            'Awarded for keeping debt below 20% of income.': 'Awarded for keeping debt below 20% of income.',
-            'Earned for excellent financial habits.': 'Earned for excellent financial habits.',
-            'Explore Investments': 'Explore Investments',
-            'Plan Growth': 'Plan Growth',
-            'Start Saving': 'Start Saving',
-            'Reduce Expenses': 'Reduce Expenses',
-            'Pay Off Debt': 'Pay Off Debt',
-            'Increase Income': 'Increase Income',
-            "You're ahead of": "You're ahead of",
-            'This is where you stand': 'This is where you stand',
-            'Ready for your next financial win? Book Consultancy today!': 'Ready for your next financial win? Book Consultancy today!',
-            # New Quiz-Related Translations
-            'Impulse: buying something without planning': 'Impulse: buying something without planning',
-            'Non-essentials: items not needed for daily living': 'Non-essentials: items not needed for daily living',
-            'Budgeting tools: apps or methods to track spending': 'Budgeting tools: apps or methods to track spending',
-            'Yes, I often buy without planning': 'Yes, I often buy without planning',
-            'No, I plan my purchases': 'No, I plan my purchases',
-            'Yes, I spend on extras': 'Yes, I spend on extras',
-            'No, I focus on essentials': 'No, I focus on essentials',
-            'Yes, I track my spending': 'Yes, I track my spending',
-            'No, I don’t track spending': 'No, I don’t track spending',
-            'Yes, I save consistently': 'Yes, I save consistently',
-            'No, I don’t save often': 'No, I don’t save often',
-            'Yes, I plan ahead': 'Yes, I plan ahead',
-            'No, I don’t plan': 'No, I don’t plan',
-            'Your Information': 'Your Information',
-            'Take Quiz Again': 'Take Quiz Again',
-        },
-        'ha': {
-            # General
-            'Home': 'Shafin Farko',
-            'Back to Home': 'Komawa Gida',
-            'Provide Feedback': 'Ba da Ra\'ayi',
-            'Join Waitlist': 'Shiga Jerin Jira',
-            'Error processing data. Please try again.': 'An samu matsala. A sake gwadawa.',
-            'Book Consultancy': 'Yin Rajistar Shawara',
-            'Connect on LinkedIn': 'Haɗa a LinkedIn',
-            'Follow on Twitter': 'Bi a Twitter',
-            'Avoider Tip': 'Fara da tsara kasafi mai sauƙi kuma bincika kashewar yau da kullum.',
-            'track_bills_tip': 'Bin diddigin biyan kuɗin ka cikin sauƙi',
-            'Contact Us': 'Tuntube Mu a',
-            'Click to Email': 'Danna don Imel',
-            'for support': 'don tallafi',
-            'Session Expired': 'Zaman ya ƙare. Da fatan za a sake farawa.',
-            'Incomplete rhymes': 'Bayanai ba su cika ba. Da fatan za a cika dukkan matakai.',
-            'Error retrieving data. Please try again.': 'Kuskure wajen dawo da bayanai. Da fatan za a sake gwadawa.',
-            'Error saving data. Please try again.': 'Kuskure wajen ajiye bayanai. Da fatan za a sake gwadawa.',
-            'Google Sheets Error': 'Ba a iya samun damar Google Sheets ba. Da fatan za a sake gwadawa daga baya.',
-            'Submission Success': 'An ƙaddamar da bayanan ka cikin nasara!',
-            'Check Inbox': 'Duba akwatin saƙonku don ganin rahoton ku!',
-            'Results copied to clipboard': 'An kwafi sakamakon zuwa allo',
-            'Failed to copy results': 'An kasa kwafi sakamakon',
-            '500 Error': 'Server Error',
-            'Invalid Endpoint': 'Wurin da ake nema ba ya samuwa. Da fatan za a sake gwadawa.',
-            'Worksheet Not Found': 'Lambar da ake nema ba ta samu ba. An ƙirƙira ta ta atomatik.',
-            'Page Not Found': 'Ba a Samu Shafin Ba',
-            'The page you are looking for does not exist.': 'Shafin da kake nema bai wanzu ba.',
-            'An unexpected error occurred on the server.': 'Kuskuren da ba a zata ba ya faru a sabar.',
-            'Error Details': 'Bayanin Kuskure',
-            'Return to Home': 'Koma zuwa Shafin Farko',
-            'Form processing error. Please try again.': 'Kuskuren sarrafa fom. Da fatan za a sake gwadawa.',
-            'Please correct the errors below': 'Da fatan za a gyara kurakuran da ke ƙasa.',
-            'Quiz configuration error. Please try again later.': 'Kuskuren saitin tambayoyin. Da fatan za a sake gwadawa daga baya.',
-            'Track your financial health with Ficore Africa. See your score, earn badges, and get smart insights.': 'Bibiyar lafiyar kuɗin ku tare da Ficore Africa. Duba makin ku, sami lambobin yabo, kuma ku sami fahimta mai kyau.',
-            'Ficore Africa - Your Financial Health Dashboard': 'Ficore Africa - Shafin Duba Lafiyar Kuɗin Ka',
-            'Listen to Voice Guidance': 'Saurari Jagorar Murya',
-            'Listen': 'Saurara',
-            'Voice guidance coming soon!': 'Jagorar murya na zuwa nan ba da jimawa ba!',
-            'Your Badges': 'Lambobin Yabon Ka',
-            'Congratulations!': 'Taya Murna!',
-            'No Badges Yet': 'Ba a Samu Lambobin Yabo ba Tukuna',
-            'Keep improving!': 'Ci gaba da ƙoƙari!',
-            'Give Feedback': 'Ba da Ra\'ayi',
-            'Submit Feedback': 'Aika Ra\'ayi',
-            'Your feedback is valuable to us.': 'Ra\'ayoyin ku na da matukar muhimmanci a gare mu.',
-            'Thank you for your feedback!': 'Na gode da ra\'ayoyin ku!',
-            'Complete the health score form with Ficore Africa to calculate your personalized financial health score.': 'Cika fom ɗin don ƙididdigar lafiyar kuɗinku tare da Ficore Africa don ganin maki na musamman akan lafiyar kudin.',
-            'Ficore Africa Logo': 'Tambarin Ficore Africa',
-            'New to finances? Click here to get guided tips on how to fill this form.': 'Sabon zuwa harkokin kuɗi? Danna nan don samun shawari akan yadda ake cika wannan fom ɗin.',
-            'Tips for Filling the Form': 'Shawari don Cika Fom ɗin',
-            'Enter your legal first name as it appears on official documents.': 'Shigar da cikakken sunan ka na farko kamar yadda yake a cikin takardun hukuma.',
-            'Use an active email address you check regularly for updates.': 'Yi amfani da adireshin imel mai aiki da kake dubawa akai-akai don sabuntawa.',
-            'Check this box if you want your financial health score sent to your email.': 'Zabi wannan akwatin idan kana son a tura makin lafiyar kuɗinka zuwa imel ɗinka.',
-            'Select English or Hausa based on your preference for communication.': 'Zaɓi Turanci ko Hausa bisa ga yadda kake so a yi sadarwa da kai.',
-            'Step': 'Mataki',
-            'Business Name': 'Sunan Kasuwanci',
-            'If you have a business, enter its registered name; otherwise, use your personal name.': 'Idan kana da kasuwanci, shigar da sunan da aka yi rajistar sa; in ba haka ba, yi amfani da sunan ka na kanka.',
-            'Choose Business if you’re representing a company, or Individual if this is for personal finance.': 'Zaɓi Kasuwanci idan kana wakiltar kamfani, ko zabi Mutum idan wannan na harkokin kuɗin ka ne.',
-            'Type personal name if no business': 'Rubuta sunan kanka idan babu kasuwanci',
-            'Business or Individual': 'Kasuwanci ko Mutum',
-            'Income/Revenue': 'Kuɗin Shiga/Samu',
-            'Include all regular income sources like salary, sales, or side hustles (e.g., 150,000).': 'Haɗa dukkan hanyoyin samun kuɗi na yau da kullun kamar albashi, tallace-tallace, ko wasu sana\'o\'in gefe (misali, 150,000).',
-            'Income information': 'Bayanan kuɗin shiga',
-            'Total money you receive regularly, like salary, business sales, gifts, grants, incentives, or side hustles.': 'Duk kuɗin da kake samu akai-akai, kamar albashi, tallace-tallacen kasuwanci, kyaututtuka, tallafi, kari, ko wasu sana\'o\'in gefe.',
-            'e.g. 150,000': 'misali 150,000',
-            'Expenses/Costs': 'Kuɗaɗen da Aka Kashe/Farashi',
-            'Sum up all monthly expenses like rent, utilities, and food (e.g., 60,000).': 'Ƙididdige duk kuɗaɗen da ake kashewa a kowane wata kamar haya, kuɗin wuta da ruwa, da abinci (misali, 60,000).',
-            'Expenses information': 'Bayanan kuɗaɗen da aka kashe',
-            'All the money you spend, such as on rent, food, transport, electricity bill, gas and utilities, fine and penalties, levies, taxes, etc.': 'Duk kuɗin da kake kashewa, kamar na haya, abinci, sufuri, kuɗin wuta, gas da kayan amfani, tara da hukunci, haraji, da sauransu.',
-            'e.g. 60,000': 'misali 60,000',
-            'Debt/Loan': 'Bashi/Rance',
-            'Enter the total amount you owe, such as loans or borrowings (e.g., 25,000).': 'Shigar da jimillar kuɗin da ake bin ka, kamar lamuni ko rancen kuɗi (misali, 25,000).',
-            'Debt information': 'Bayanan bashi',
-            'Money you owe, like loans, IOUs, borrowings, or funds lent to you.': 'Kuɗin da ake bin ka, kamar lamuni, bashin baki, rancen kuɗi, ko kuɗin da aka baka aro.',
-            'e.g. 25,000': 'misali 25,000',
-            'Debt Interest Rate': 'Kuɗin Ruwa na Bashi',
-            'Input the annual or monthly interest rate on your debt as a percentage (e.g., 10 for 10%); enter 0 if interest-free.': 'Shigar da kuɗin ruwa na shekara ko na wata akan bashin ka a matsayin kashi (misali, 10 don 10%); shigar da 0 idan babu ruwa.',
-            'Interest rate information': 'Bayanan kuɗin ruwa',
-            'Extra percentage you pay on a loan, usually per year or month. It’s usually something like 12% or 7%.': 'Ƙarin kashi da kake biya akan lamuni, yawanci a kowace shekara ko wata. Yawanci kamar 12% ko 7%.',
-            'e.g. 10': 'misali 10',
+def supported_languages():
+    global _supported
+    if _supported is None:
+        _supported = frozenset(available_languages())
+    return _supported
 
-            # Budget Planner
-            'Budget Planner': 'Shirya Kasafin Kuɗinku',
-            'Budget Dashboard': 'Dashboard na Kasafin Kuɗi',
-            'Financial growth passport for Africa': 'Fasfo na ci gaban kuɗi na Afirka',
-            'Welcome': 'Maraba',
-            'Your Budget Summary': 'Takaitaccen Kasafin Kuɗin Ku',
-            'Refresh': 'Sabunta',
-            'My Budget': 'Kasafin Kuɗina',
-            'Check yours at': 'Duba naku a',
-            'Personal Information': 'Bayanan Kai',
-            'First Name': 'Suna na Farko',
-            'Enter your first name': 'Shigar da sunanka na farko',
-            'Enter your first name for your report.': 'Shigar da sunanka na farko don rahotanka.',
-            'Email': 'Imel',
-            'Enter your email': 'Shigar da imel ɗinka',
-            'Get your budget report by email.': 'Samu rahoton kasafin kuɗinka ta imel.',
-            'Language': 'Yare',
-            'Choose your language.': 'Zaɓi yaren da akafi so.',
-            'Looks good!': 'Yayi kyau!',
-            'First Name Required': 'Ana Buƙatar Sunan Farko',
-            'Invalid Email': 'Imel Ba daidai ba',
-            'Language selected!': 'An zaɓi harshe!',
-            'Language required': 'Ana buƙatar harshe',
-            'Next': 'Gaba',
-            'Continue to Income': 'Ci gaba zuwa Kuɗin Shiga',
-            'Step 1': 'Mataki 1',
-            'Income': 'Kuɗin Shiga',
-            'Monthly Income': 'Kuɗin Shiga na Wata',
-            'e.g. ₦150,000': 'misali ₦150,000',
-            'Your monthly pay or income.': 'Albashinka na wata ko kuɗin shiga.',
-            'Valid amount!': 'Adadin da ya dace!',
-            'Invalid Number': 'Lamba Ba daidai ba',
-            'Back': 'Baya',
-            'Back to Personal Information': 'Koma zuwa Bayanan Kai',
-            'Step 2': 'Mataki 2',
-            'Continue to Expenses': 'Ci gaba zuwa Kashe Kuɗi',
-            'Please enter a valid income amount': 'Da fatan za a shigar da adadin kuɗin shiga mai inganci',
-            'Processing your information': 'Ana sarrafa bayananka',
-            'Processing your income': 'Ana sarrafa kuɗin shiganka',
-            'Expenses': 'Kashe Kuɗi',
-            'Housing Expenses': 'Kashe Kuɗi na Gida',
-            'e.g. ₦30,000': 'misali ₦30,000',
-            'Rent, electricity, or water bills.': 'Haya, wutar lantarki, ko kuɗin ruwa.',
-            'Food Expenses': 'Kashe Kuɗi na Abinci',
-            'e.g. ₦45,000': 'misali ₦45,000',
-            'Money spent on food each month.': 'Kuɗin da aka kashe akan abinci kowane wata.',
-            'Transport Expenses': 'Kashe Kuɗi na Sufuri',
-            'e.g. ₦10,000': 'misali ₦10,000',
-            'Bus, bike, taxi, or fuel costs.': 'Bas, keke, tasi, ko kuɗin mai.',
-            'Other Expenses': 'Sauran Kashe Kuɗi',
-            'e.g. ₦20,000': 'misali ₦20,000',
-            'Internet, clothes, or other spending.': 'Intanet, tufafi, ko sauran kashe kuɗi.',
-            'Step 3': 'Mataki 3',
-            'Continue to Savings & Review': 'Ci gaba zuwa Tanadi & Nazari',
-            'Please enter valid amounts for all expenses': 'Da fatan za a shigar da adadin da ya dace ga duk kashe kuɗi',
-            'Analyzing your expenses': 'Ana nazarin kashe kuɗinka',
-            'Savings & Review': 'Tanadi & Nazari',
-            'Savings Goal': 'Manufar Tanadi',
-            'Optional': 'Na Zaɓi',
-            'Desired monthly savings amount.': 'Adadin tanadi na wata da ake so.',
-            'e.g. ₦5,000': 'misali ₦5,000',
-            'Auto Email': 'Imel ta kai tsaye',
-            'Submit': 'Aika',
-            'Step 4': 'Mataki 4',
-            'Continue to Dashboard': 'Ci gaba zuwa Dashboard',
-            'Analyzing your budget': 'Ana nazarin kasafin kuɗinka',
-            'Please enter a valid savings goal amount': 'Da fatan za a shigar da adadin manufar tanadi mai inganci',
-            'Please fill all required fields': 'Da fatan za a cika duk filayen da ake buƙata',
-            'Total Expenses': 'Jimlar Kuɗaɗe',
-            'Savings': 'Tattara Kuɗi',
-            'Saving': 'Tara Kuɗi',
-            'Overspend': 'Kashe kudi yayi yawa',
-            'Surplus/Deficit': 'Rage/Riba',
-            'Advice': 'Shawara',
-            'Great job! Save or invest your surplus to grow your wealth.': 'Aiki mai kyau! Ajiye ko saka ragowar kuɗin ku don bunkasa arzikinku.',
-            'Housing costs are high. Look for cheaper rent or utilities.': 'Kuɗin gida yana da yawa. Nemi haya mai rahusa ko kayan aiki.',
-            'Food spending is high. Try cooking at home more.': 'Kuɗin abinci yana da yawa. Gwada dafa abinci a gida sosai.',
-            'Reduce non-essential spending to balance your budget.': 'Rage kashe kuɗi marasa mahimmanci don daidaita kasafin kuɗin ku.',
-            'Other spending is high. Cut back on non-essentials like clothes or entertainment.': 'Sauran kashe kuɗi yana da yawa. Rage abubuwan da ba su da mahimmanci kamar tufafi ko nishaɗi.',
-            'Your ranking': 'Matsayin ku',
-            'Rank': 'Matsayi',
-            'out of': 'daga cikin',
-            'users': 'masu amfani da Ficore',
-            'Budget Breakdown': 'Rarraba Kasafin Kuɗi',
-            'Income vs Expenses': 'Kuɗin Shiga vs Kuɗaɗe',
-            'Earned badges': 'Alamomīn da aka samu',
-            'First Budget Completed!': 'An kammala kasafin kuɗi na farko!',
-            'Send Email Report': 'An aika rahoton imel cikin nasara!',
-            'Quick Tips': 'Shawarwari masu Sauƙi',
-            'Great job! Save or invest your surplus.': 'Aiki mai kyau! Ajiye ko saka ragowar kuɗin ku.',
-            'Keep tracking your expenses every month.': 'Ci gaba da bin diddigin kuɗaɗen ku kowane wata.',
-            'Spend less on non-essentials to balance your budget.': 'Kashe ƙasa da kima akan abubuwan da ba su da mahimmanci don daidaita kasafin kuɗin ku.',
-            'Look for ways to earn extra income.': 'Nemi hanyoyin samun ƙarin kuɗin shiga.',
-            'Recommended Learning': 'Koyon da Aka Shawarta',
-            'Learn more about budgeting!': 'Ƙara koyo game da tsara kasafin kuɗi!',
-            'Whats Next': 'Me ke Gaba',
-            'Share Your Results': 'Raba Sakamakonku',
-            'Summary with Emoji': 'Taƙaice 📊',
-            'Badges with Emoji': 'Baja 🏅',
-            'Tips with Emoji': 'Shawara 💡',
-            'Budget Report Subject': 'Rahoton Kasafin Kuɗi',
-            'Your Budget Report': 'Rahoton Kasafin Kuɗi',
-            'Dear': 'Masoyi',
-            'Here is your monthly budget summary.': 'Ga takaitaccen kasafin kuɗin ku na wata.',
-            'Budget Summary': 'Takaitaccen Kasafin Kuɗi',
-            'Thank you for choosing Ficore Africa!': 'Muna godiya da zaɓin Ficore Afirka!',
-            'Advice with Emoji': 'Shawara 💡',
-            'Recommended Learning with Emoji': 'Koyon da Aka Shawarta 📚',
-            'Join Financial Course': 'Shiga Kwas na Kuɗi',
-            'Join Course': 'Shiga Kwas',
-            'No tips available.': 'Babu shawara a yanzu.',
-            'Balance': 'Ma’auni',
-            'Income minus expenses and savings goal.': 'Samun kuɗi ban da kashe kuɗi da burin tattara kuɗi.',
-            'Expense Breakdown': 'Rarraba Kashe Kuɗi',
-            'Pie chart of expense breakdown': 'Zanen pie na rarraba kashe kuɗi',
-            'Badges': 'Baji',
-            'Earned for managing your budget effectively.': 'An samu saboda sarrafa kasafin kuɗin ku yadda ya kamata.',
-            'No badges earned yet.': 'Babu baji da aka samu har yanzu.',
-            'Tips': 'Shawara',
-            'Tip': 'Shawara',
-            'Actionable advice to improve your budget.': 'Shawara mai amfani don inganta kasafin kuɗin ku.',
-            'Back to Savings & Review': 'Koma zuwa Tanadi & Nazari',
-            'Warning: No income recorded!': 'Gargadi: Ba a rubuta samun kuɗi ba!',
+def _load_catalog(language):
+    """Return the read-only mapping for a language, or None if it has no source.
 
-            # Financial Health Tool
-            'Your Financial Health Summary': 'Takaitaccen Bayanai Akan Lafiyar Kuɗin Ku!',
-            'Your Financial Health Score': 'Matsayin Lafiyar Kuɗin Ka',
-            'Ranked': 'An Jera Ku A Matsayina',
-            'Financial Health Course': 'Kwas ɗin Lafiyar Kuɗi',
-            'Strong Financial Health': 'Kyakkyawar Lafiyar Kuɗi',
-            'Stable Finances': 'Kuɗi Mai ɗorewa',
-            'Financial Strain': 'Matsin Kuɗi',
-            'Urgent Attention Needed': 'Ana Bukatar Kulawa Gaggawa',
-            'Check your inbox for a detailed report.': 'Duba akwatin saƙon shiga naka don cikakken rahoto.',
-            'Score Breakdown': 'Rarrabuwar Maki',
-            'Chart Unavailable': 'Ginshiƙi ba ya nan saboda matsalolin bayanai.',
-            'Score Composition': 'Tsarin Maki',
-            'Cash Flow': 'Yawan Kuɗin Shiga da Fita',
-            'Cash Flow Description': 'Yana nuna adadin kuɗin da ya rage muku a hannu bayan Kun kashe kuɗi wajen biyan Bukatu. Maki mai ƙima yana nuna mafi kyawun alamar rike kuɗi.',
-            'Debt-to-Income Ratio': 'Ƙimar Bashi akan Kuɗin Shiga',
-            'Debt-to-Income Description': 'Yana auna bashi dangane da kuɗin shiga. Ƙananan Makin rabiya yana nuna matakan bashi mai sauƙi.',
-            'Debt Interest Burden': 'Nauyin Kudin Ruwa Bashi',
-            'Debt Interest Description': 'Dangane da ƙimar Kudin Ruwar bashin ka.',
-            'Balanced Components': 'Sassan Ka Daidaitattu ne sosai.',
-            'Components Need Attention': 'Wasu sassan na buƙatar kulawa don inganta makin ka.',
-            'Components Indicate Challenges': 'Sassan ka na nuna ƙalubalen kuɗi.',
-            'Recommended Course': 'Darasi da Aka Shawarta Maka',
-            'Enroll in': 'Shiga ciki',
-            'Enroll Now': 'Yi Rijista Yanzu',
-            'Quick Financial Tips': 'Nasihu na Kuɗi Masu Saurin Amfani',
-            'Invest Wisely': 'Ka yi tunani sosai kafin ka zuba jari da rarar kuɗin ka.',
-            'Scale Smart': 'Ka faɗaɗa kasuwancin ka ko harkokin kuɗin ka cikin hikima.',
-            'Build Savings': 'Ka mai da hankali kan gina ajiyar kuɗin ka.',
-            'Cut Costs': 'Ka gano kuma ka rage kashe kuɗaɗen da basu zama dole ba.',
-            'Reduce Debt': 'Ka ba da fifiko ga rage bashin ka.',
-            'Boost Income': 'Ka bincika hanyoyin da za ka ƙara kuɗin shigan ka.',
-            'How You Compare': 'Yadda Kake Kwantanta da Wasu',
-            'Your Rank': 'Matsayin Ka',
-            'places you': 'ya sanya ka a',
-            'Top 10%': 'Kashi 10% na Sama',
-            'Top 30%': 'Kashi 30% na Sama',
-            'Middle Range': 'Matsakaicin Matsayi',
-            'Lower Range': 'Ƙananan Matsayi',
-            'Regular Submissions': 'Aika bayanai akai-akai',
-            'Whats Next': 'Me ke Gaba? Ku Duba Wadannan:',
-            'Ficore Africa Financial Health Score': 'Matsayin Lafiyar Kuɗi daga Ficore Africa',
-            'Get Your Score': 'Samu Makin Ka',
-            'Enter your first name': 'Shigar da sunanka na farko',
-            'First Name Required': 'Ana buƙatar sunan farko.',
-            'Enter your last name (optional)': 'Shigar da sunanka na ƙarshe (na zaɓi)',
-            'Confirm your email': 'Sake Tabbatar da imel ɗinka',
-            'Enter phone number (optional)': 'Shigar da lambar waya (na zaɡi)',
-            'User Information': 'Bayanan Ka',
-            'Enter your business name': 'Shigar da sunan kasuwancinka',
-            'Business Name Required': 'Ana buƙatar sunan kasuwanci.',
-            'User Type': 'Nau’in Mai Amfani da Ficore',
-            'Financial Information': 'Bayanan Kuɗi',
-            'Enter monthly income/revenue': 'Shigar da jimillar kuɗin shiga/kudin shigarku na wata-wata',
-            'Enter monthly expenses/costs': 'Shigar da jimillar kashe kuɗinku/kudin wata-wata',
-            'Enter total debt/loan amount': 'Shigar da jimillar bashi/lamuni',
-            'Enter debt interest rate (%)': 'Shigar da Interest na bashin (%)',
-            'Session data missing. Please submit again.': 'Bayanan zama sun ɓace. Da fatan za a sake yin aikace.',
-            'An unexpected error occurred. Please try again.': 'Wani kuskure wanda ba a zata ba ya faru. Da fatan za a sake gwadawa.',
-            'Error generating plots. Dashboard will display without plots.': 'An sami kuskure wajen ƙirƙirar zane. Allon zai nuna ba tare da su ba.',
-            'Top 10% Subject': '🔥 Kuna cikin Sama da kaso goma 10%! Rahoton Makin ku na Ficore Yana Jiran Ku!',
-            'Score Report Subject': '📊 Rahoton Makin ku na Ficore Yana Shirye, {user_name}!',
-            'First Health Score Completed!': 'Makin Lafiyar Arziki na Farko ya Kammala!',
-            'Financial Stability Achieved!': 'Akwai Wadata!',
-            'Debt Slayer!': 'Mai Ragargaza Bashi!',
-            'Your Financial Health Dashboard': 'Allon Lafiyar Kuɗin Ku',
-            'Choose a Tool': 'Zaɓi Kayan Aiki',
-            'Select an option': 'Zaɓi wani zaɓi',
-            'Start': 'Fara',
-            'Email addresses must match.': 'Adiresoshin imel dole su dace.',
-            'Complete the health score form ...': 'Cika fom ɗin makin lafiya ...',
-            'New to finances? ...': 'Sabon shiga cikin kuɗi? ...',
-            'Close': 'Rufe',
-            'Feedback': 'Ra’ayi',
-            'Consultancy': 'Shawara',
-            'Component': 'Abun Haɗin',
-            'Score Contribution': 'Gudummawar Maki',
-            'Debt Interest': 'Kudin ruwar Bashi',
-            'Debt-to-Income': 'Bashi zuwa Kuɗin Shiga',
-            'We have calculated your Ficore Africa Financial Health Score based on your recent submission.': 'Mun ƙididdige Makin Lafiyar Kuɗin Ficore Africa bisa sallamar ku na baya-bayan nan.',
-            'Follow the advice above to improve your financial health. We are here to support you every step of the way—take one small action today to grow stronger financially for your business, your goals, and your future!': 'Bi shawarar da ke sama don inganta lafiyar kuɗin ku. Muna nan don tallafa muku a kowane mataki—ɗauki ƙaramin aiki yau don ƙara ƙarfi a fannin kuɗi don kasuwancinku, burinku, da makomarku!',
-            'Want to learn more? Check this course:': 'Kana son ƙarin koyo? Duba wannan kwas:',
-            'Please provide feedback on your experience:': 'Da fatan za a ba da ra’ayi kan kwarewarku:',
-            'Want Smart Insights? Join the waitlist for Ficore Premium:': 'Kana son Fahimta Mai Wayo? Shiga jerin jira na Ficore Premium:',
-            'Need personalized advice? Book Consultancy:': 'Kana buƙatar shawara ta musamman? Yi Rijistar Shawara:',
-            'Best regards,': 'Gaisuwa mai kyau,',
-            'The Ficore Africa Team': 'Ƙungiyar Ficore Africa',
-            'Follow us on LinkedIn and Twitter for updates': 'Bi mu a LinkedIn da Twitter don sabuntawa',
-            'View Course': 'Duba Kwas ɗin',
-            'Invest': 'Zuba Jari',
-            'Explore investment options.': 'Bincika hanyoyin zuba jari.',
-            'Scale': 'Girmanwa',
-            'Plan for scalable growth.': 'Ka yi shirin girma mai ɗorewa.',
-            'Build': 'Gina',
-            'Start a savings plan.': 'Ka fara shirin ajiyar kuɗi.',
-            'Cut': 'Rage',
-            'Review your expenses.': 'Ka sake duba kuɗaɗen da kake kashewa.',
-            'Reduce': 'Ƙara Rage',
-            'Create a debt repayment plan.': 'Ka ƙirƙiri shirin biyan bashi.',
-            'Boost': 'Ƙarfafa',
-            'Consider side hustles or new revenue streams.': 'Ka yi la\'akari da ƙananan sana\'o\'i ko sabbin hanyoyin samun kuɗi.',
+    Non-English catalogs fall back to English for keys they do not translate.
+    """
+    catalog = _catalogs.get(language)
+    if catalog is not None:
+        return catalog
+    # Only languages with a source file are looked up, so a request parameter
+    # can never name an arbitrary path.
+    if language not in supported_languages():
+        return None
+    with _catalogs_lock:
+        catalog = _catalogs.get(language)
+        if catalog is None:
+            compiled = load_catalog(language)
+            if compiled is None:
+                return None
+            if language == DEFAULT_LANGUAGE:
+                catalog = compiled
+            else:
+                catalog = FallbackCatalog(compiled, load_catalog(DEFAULT_LANGUAGE))
+            _catalogs[language] = catalog
+    return catalog
 
-            # Financial Personality Quiz
-            'Financial Personality Quiz': 'Tambayar Halin Kuɗi',
-            'Financial Quiz': 'Tambayoyin Kuɗi',
-            'Discover Your Financial Personality': 'Gano Halin Kuɗin Ka',
-            'Start Quiz': 'Fara Tambayoyi',
-            'Question': 'Tambaya',
-            'of': 'na',
-            'Submit Quiz': 'Ƙaddamar da Tambayar',
-            'Personality Unlocked!': 'Halin Kuɗi An Buɗe!',
-            'Your Financial Personality': 'Halin Kuɗin Ka',
-            'Habits': 'Halaye',
-            'Personalized Tip': 'Shawara ta Keɓaɓɓu',
-            'Quiz Summary': 'Taƙaitaccen Tambayoyi',
-            'Retake Quiz': 'Sake Ɗaukar Tambayar',
-            'Explore Budget Planner': 'Bincika Mai Tsara Kasafin Kuɗi',
-            'Explore Financial Health Tool': 'Bincika Kayan Lafiyar Kuɗi',
-            'Share on WhatsApp': 'Raba akan WhatsApp',
-            'Share on Twitter': 'Raba akan Twitter',
-            'Learn How to Be a Planner': 'Koyon Yadda Ake Zama Mai Tsarawa',
-            'Quiz Report Subject': 'Sakamakon Tambayoyin Halin Kuɗin Ku',
-            'Receive Email Report': 'Karɓi Rahoton Imel',
-            'Previous': 'Baya',
-            'Progress': 'Ci gaba',
-            # Quiz Questions
-            'Do you track your expenses weekly?': 'Kana bin diddigin kashe kuɗinka kowane mako?',
-            'Do you avoid budgeting?': 'Kana guje wa tsara kasafin kuɗi?',
-            'Do you save a portion of your income monthly?': 'Kana ajiye wani ɓangare na kuɗin shigar ka kowane wata?',
-            'Do you often spend on non-essentials like entertainment?': 'Kana yawan kashe kuɗi akan abubuwan da ba su da mahimmanci kamar nishaɗi?',
-            'Do you plan your purchases in advance?': 'Kana tsara abubuwan da za ka saya a gaba?',
-            'How often do you save?': 'Sau nawa kake ajiyewa?',
-            'How often do you overspend at the market?': 'Sau nawa kake wuce gona da iri a kasuwa?',
-            'How often do you review your finances?': 'Sau nawa kake duba kuɗin ka?',
-            'How often do you buy on impulse?': 'Sau nawa kake siya ba tare da tsari ba?',
-            'How often do you join savings groups?': 'Sau nawa kake shiga ƙungiyoyin ajiya?',
-            'impulse_purchases': 'Shin kana yin sayayya ba tare da shiri ba?',
-            'spend_non_essentials': 'Shin kana kashe kudi akan abubuwan da ba su da mahimmanci?',
-            'use_budgeting_tools': 'Shin kana amfani da kayan aikin kasafin kudi?',
-            'save_regularly': 'Shin kana ajiye kudi akai-akai?',
-            'invest_money': 'Shin kana saka kudinka a cikin zuba jari?',
-            'track_expenses': 'Shin kana bin diddigin kashe kudinka?',
-            'emergency_fund': 'Shin kana da asusun gaggawa?',
-            'plan_expenses': 'Shin kana tsara kashe kudinka?',
-            'set_financial_goals': 'Shin kana sanya burin kudi?',
-            'seek_financial_advice': 'Shin kana neman shawarar kudi?',
-            # Tooltips
-            'Tracking: Recording all money spent daily.': 'Bibiya: Yin rikodin duk kuɗin da aka kashe kowace rana.',
-            'Budgeting: Planning how to spend your money.': 'Tsara Kasafi: Tsara yadda za a kashe kuɗin ka.',
-            'Saving: Setting aside money for future use.': 'Ajiya: Keɓe kuɗi don amfani a gaba.',
-            'Non-essentials: Items or activities not critical to daily needs.': 'Abubuwan da ba su da mahimmanci: Abubuwa ko ayyuka waɗanda ba su da mahimmanci ga buƙatun yau da kullum.',
-            'Planning: Deciding what to buy before spending.': 'Tsarawa: Yanke shawarar abin da za a saya kafin kashewa.',
-            'Saving frequency: How regularly you set aside money.': 'Mitar ajiya: Yadda kake keɓe kuɗi a kai a kai.',
-            'Overspending: Spending more than planned.': 'Wuce gona da iri: Kashe kuɗi fiye da tsari.',
-            'Reviewing: Checking your income and expenses.': 'Dubawa: Duba kuɗin shiga da kashewa.',
-            'Impulse buying: Purchasing without planning.': 'Siyan sha’awa: Saye ba tare da tsari ba.',
-            'Savings groups: Local groups for collective saving.': 'Ƙungiyoyin ajiya: Ƙungiyoyin gida don ajiya tare.',
-            # Choices
-            'Yes': 'Eh',
-            'No': 'A’a',
-            'Never': 'Ba ko yaushe ba',
-            'Sometimes': 'Wani lokaci',
-            'Always': 'Koyaushe',
-            'yes': 'Eh',
-            'no': 'A’a',
-            # Personalities
-            'Planner': 'Mai Tsarawa',
-            'Saver': 'Mai Ajiya',
-            'Minimalist': 'Mai Ƙarancin Amfani',
-            'Spender': 'Mai Kashewa',
-            'Avoider': 'Mai Gujewa',
-            # Personality Descriptions
-            'Planner': 'Kai mai horo ne kuma mai himma wajen sarrafa kuɗin ka.',
-            'Saver': 'Kana fifita ajiya amma kana iya buƙatar tsarawa mafi kyau.',
-            'Minimalist': 'Kana rage kashewa amma kana iya rasa damar ajiya.',
-            'Spender': 'Kana jin daɗin kashewa kuma kana iya buƙatar taimako wajen tsara kasafi.',
-            'Avoider': 'Kana guje wa tsara kuɗi kuma kana buƙatar fara bibiya.',
-            # Tips
-            'Planner Tip': 'Ci gaba da bibiya kuma saita manufofin kuɗi na dogon lokaci.',
-            'Saver Tip': 'Ƙirƙiri kasafin kuɗi don inganta ajiyarka.',
-            'Minimalist Tip': 'Bincika ajiya ko saka hannun jari a ragowar kuɗin ka.',
-            'Spender Tip': 'Bincika kashewa kuma saita iyakar kashewa.',
-            'Avoider Tip': 'Fara da tsara kasafi mai sauƙi kuma bincika kashewar yau da kullum.',
-            # New Translations
-            'Ranking Info': 'Bayani game da Jerawa',
-            'Ranking based on debt, expenses, and income balance.': 'Jerawa bisa ga bashi, kuɗaɗen da aka kashe, da kuma daidaiton kuɗin shiga.',
-            'See your Income Breakdown': 'Duba Rarrabuwar Kuɗin Shigan Ka',
-            'Cash Flow Info': 'Bayanin Kwararar Kudi',
-            'What’s left after your spending.': 'Abin da ya rage bayan kuɗin da ka kashe.',
-            'This is your monthly surplus (Income minus Expenses).': 'Wannan shine ribar ka ta wata-wata (Kuɗin Shiga ƙasa da Kuɗin da Aka Kashe).',
-            'Debt-to-Income Info': 'Bayanin Bashi da Kudin Shiga',
-            'Your debt as a percentage of income.': 'Bashin ka a matsayin kashi na kuɗin shigan ka.',
-            'Debt Interest Info': 'Bayanin Kudin Ruwar Bashi',
-            'Impact of your debt interest rate.': 'Tasirin ƙimar Kudin ruwa bashin ka.',
-            'Return to Main Menu': 'Komawa Shafin Farko',
-            'Earned by maintaining positive cash flow for this session.': 'An samu ta hanyar kula da yawan kuɗin shiga mai kyau a wannan zaman.',
-            'Awarded for keeping debt below 20% of income.': 'An ba da ita don kiyaye bashi ƙasa da kashi 20% na kuɗin shiga.',
-            'Earned for excellent financial habits.': 'An samu ta hanyar kyakkyawar ɗabi\'un kuɗi.',
-            'Explore Investments': 'Bincika Zuba Jari',
-            'Plan Growth': 'Shirya Girma',
-            'Start Saving': 'Fara Ajiyar Kuɗi',
-            'Reduce Expenses': 'Rage Kuɗin da Ake Kashewa',
-            'Pay Off Debt': 'Biyan Bashi',
-            'Increase Income': 'Ƙara Kuɗin Shiga',
-            "You're ahead of": "Ka fi",
-            'This is where you stand': 'Wannan shine inda kuke',
-            'Ready for your next financial win? Book Consultancy today!': 'Kun shirya don karin nasarar ku akan lamarin kudi? Yi shawara da kwararrun Ficore a yau!',
-            # New Quiz-Related Translations
-            'Impulse: buying something without planning': 'Sha’awa: Siyan wani abu ba tare da tsari ba',
-            'Non-essentials: items not needed for daily living': 'Abubuwan da ba su da mahimmanci: Abubuwa da ba su da bukata ga rayuwa ta yau da kullum',
-            'Budgeting tools: apps or methods to track spending': 'Kayan aikin kasafin kuɗi: Apps ko hanyoyin bin diddigin kashe kuɗi',
-            'Yes, I often buy without planning': 'Eh, sau da yawa na saya ba tare da tsari ba',
-            'No, I plan my purchases': 'A’a, na tsara abubuwan da zan saya',
-            'Yes, I spend on extras': 'E, na kashe kuɗi akan abubuwan ƙari',
-            'No, I focus on essentials': 'A’a, na mai da hankali kan abubuwan da suke da mahimmanci',
-            'Choose your language': 'Zaɓi yaren da akafi so',
-            'Yes, I track my spending': 'Eh, na binciki kashe kuɗina',
-            'Budget Planner': 'Tsara Kasafin Kudinku',
-            'Financial Health Score': 'Mastayin Lafiyar Kudinku',
-            'Allocate income across expense categories': 'Rarraba kuɗinku tsakanin harkoki da dalilan kashe kuɗinku masu muhimmanci.',
-            'Answer questions to assess financial literacy': 'Amsa tambayoyi don tantance halayya da kuma ilimin kuɗinku.',
-            'Personality Quiz': 'Duba Halayyar Kudi',
-            'Net worth is assets minus liabilities': 'Darajar dukiya shine abinda ya saura bayan an cire bashi a cikin kadarori da ake dashi.',
-            'Where to Start? Get Your Free Health Score' : 'Daga ina za,a fara? Duba Matsayin Lafiyar Kuɗinku Kyauta!',
-            'Your All-in-One Toolkit for Personal & SME Financial Health Across Africa': 'Dukkan Kayan aiki da Kuke Bukata don Kiyaye Lafiyar Kuɗinku, Ku Kadai, ko da Iyali, ko kuma Ƙananan Kasuwanci, a duk faɗin Afirka.',
-            'No, I don’t track spending': 'A’a, ba na bin diddigin kashe kuɗi ba',
-            'Yes, I save consistently': 'Eh, na ajiye kuɗi akai-akai',
-            'No, I don’t save often': 'A’a, ba na ajiye kuɗi sau da yawa ba',
-            'Yes, I plan ahead': 'Eh, na tsara gaba',
-            'No, I don’t plan': 'A’a, ba na tsarawa ba',
-            'Your Information': 'Bayanan Ka',
-            'Take Quiz Again': 'Sake Ɗaukar Tambayar',
-            'About Ficore Africa: Empowering financial growth across Africa since 2025': 'Game da Ficore Africa: Ƙarfafa ci gaban lamrin kuɗi a duk faɗin Afirka, tun 2025',
-            'Why Ficore Africa?': 'Me yasa Ficore Africa?',
-            'Localized for Africa with support for Naira and regional financial contexts': 'An keɓance shi don Afirka tare da tallafi ga Naira da yanayin lamurran kuɗi na yankinmu',
-            'Provides actionable insights for better financial decisions': 'Yana ba da karin haske na fahimta mai amfani don inganta shawarwainku na kuɗi',
-            'Empowers financial literacy with easy-to-use tools': 'Yana ƙarfafa ilimin kuɗi tare da bada kayan aiki masu sauƙin amfani domin lafiyar arzikinku',
-            'What people are saying about Us': 'Abin da mutane ke faɗi game da Mu',
-            'Manage and mark bills as paid': 'Sarrafa kuma sanya alamar biyan kuɗi',
-            'Aims to cover 3-6 months of expenses for financial security': 'Yana nufin rufe kuɗaɗen watanni 3-6 don tsaron kuɗi',
-            'Log and edit expenses for spending insights': 'Rikodi da gyara kuɗaɗe don fahimtar kashewa',
-            'Follow us on': 'Ku bibiyemu a shafin',
-            'Expense Tracker': 'Mai Binciken Kuɗaɗe',
-            'Use Ficore to Track your income, net worth, budgets, and bills, to grow your money with confidence.' : 'Amfani da Ficore ku bibiyi lamarin kudinku, darajar dukiyarku, biyan bashinku, kasafin kuɗinku, dakuma samun tunatarwa akan lamuran yau da kullum, don bunkasa arzikinku cikin kwarin gwiwa.',
-            'Testimonial 1' : 'Na bincika siffofin Ficore Apps karon farko a yau kuma naga sun burgeni... Na yi tunanin an yishi ne wa ƙananan kasuwanci kawai, amma yanzu na gane har ma da daidaikun mutane za su iya amfana. Sashen koyarwarsu yana a wani mataki daban.',
-            'Testimonial 2' : 'Ficore 🔥🔥🔥!',
-            'Testimonial 3' : ' Na jima ina bibiyar aiyukan Ficore kuma naga sun burgeni. A bayyane yake cewa abune mai yuwuwa, kuma ina son ƙarin haske, musamman ma idan akwai hanyar da zan iya bada tallafin wajen gudanarwa. Zan so in ba da gudummawa idan da buƙata!',
-            'Logout': 'Fita Gaba daya',
-            'Thanks again': 'Muna Kara Godiya',
-            'Bill Planner': 'Mai Tsara Biyan Kuɗi',
-            'Net Worth Calculator': 'Ƙididdigar Ƙimar Dukiya',
-            'Emergency Fund Calculator': 'Ƙididdigar Asusun Gaggawa',
-            'Explore More Tools': 'Bincika Ƙarin Kayan Aiki daga Ficore',
-            'Spend less on non-essentials to balance your budget': 'Kashe ƙasa da kima akan abubuwan da ba su da mahimmanci don daidaita kasafin kuɗin ku'
-        }
-    }
-    return translations.get(language, translations['en'])
+def get_translations(language='en'):
+    catalog = _load_catalog(language)
+    if catalog is None:
+        catalog = _load_catalog(DEFAULT_LANGUAGE)
+    return catalog